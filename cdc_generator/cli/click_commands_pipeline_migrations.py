@@ -57,6 +57,16 @@ def manage_pipelines_cmd(ctx: click.Context) -> int:
 @click.option("--all", "all_flag", is_flag=True,
               help="Generate for all customers")
 @click.option("--force", is_flag=True, help="Force regeneration")
+@click.option("--jobs", type=int, metavar="N",
+              help="Render source pipelines with N worker processes (0 = one per CPU)")
+@click.option("--incremental", is_flag=True,
+              help="Only regenerate outputs whose inputs changed")
+@click.option("--sink-routing", type=click.Choice(["static", "dynamic"]),
+              help="Consolidated sink routing: one output per customer x table (static) or per table shape (dynamic)")
+@click.option("--sink-write", type=click.Choice(["insert", "bulk"]),
+              help="Consolidated sink staging writes: multi-row INSERT (insert) or set-based JSON batch load (bulk)")
+@click.option("--sink-shards", type=int, metavar="N",
+              help="Split each consolidated sink into N shard files, each with its own consumer group")
 @click.pass_context
 def manage_pipelines_generate_cmd(_ctx: click.Context, **_kwargs: object) -> int:
     """manage-pipelines generate passthrough."""
@@ -88,6 +98,8 @@ def manage_pipelines_list_cmd(_ctx: click.Context, **_kwargs: object) -> int:
 @click.option("--sink", "sink_mode", is_flag=True,
               help="Verify sink PostgreSQL connectivity")
 @click.option("--service", help="Optional service name filter for --sink")
+@click.option("--max-connections", type=int, metavar="N",
+              help="Fail when a generated sink can open more than N Postgres connections")
 @click.pass_context
 def manage_pipelines_verify_cmd(_ctx: click.Context, **_kwargs: object) -> int:
     """manage-pipelines verify passthrough."""
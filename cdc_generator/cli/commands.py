@@ -194,7 +194,10 @@ PIPELINE_COMMANDS: dict[str, dict[str, str]] = {
         "module": "cdc_generator.core.pipeline_generator",
         "script": "core/pipeline_generator.py",
         "description": "Generate Bento pipelines",
-        "usage": "cdc manage-pipelines generate [customer] [--all] [--force]",
+        "usage": (
+            "cdc manage-pipelines generate [customer] [--all] [--force] [--jobs N] [--incremental] "
+            + "[--sink-routing static|dynamic] [--sink-write insert|bulk] [--sink-shards N]"
+        ),
     },
     "list": {
         "runner": "generator",
@@ -208,7 +211,7 @@ PIPELINE_COMMANDS: dict[str, dict[str, str]] = {
         "module": "cdc_generator.cli.pipeline_verify",
         "script": "cli/pipeline_verify.py",
         "description": "Verify pipeline templates/configuration (light/full/sink modes)",
-        "usage": "cdc manage-pipelines verify [--full] [--sink]",
+        "usage": "cdc manage-pipelines verify [--full] [--sink] [--max-connections N]",
     },
     "diff": {
         "runner": "generator",
@@ -14,6 +14,7 @@ import sys
 from pathlib import Path
 from typing import Any, cast
 
+from cdc_generator.core.pipeline_generator_shards import load_shard_manifest, sink_output_filenames
 from cdc_generator.helpers.service_config import (
     get_all_customers,
     get_project_root,
@@ -48,10 +49,13 @@ def _expected_files(project_root: Path) -> set[str]:
             environments.add(env)
             expected.add(f"sources/{env}/{customer}/source-pipeline.yaml")
 
+    sinks_dir = project_root / "pipelines" / "generated" / "sinks"
     for env in environments:
-        expected.add(f"sinks/{env}/sink-pipeline.yaml")
+        # Sharded sinks record their shard count and files in .shards.json.
+        recorded_shards, _ = load_shard_manifest(sinks_dir / env)
+        for filename in sink_output_filenames(sinks_dir / env, recorded_shards) or []:
+            expected.add(f"sinks/{env}/{filename}")
 
-    _ = project_root
     return expected
 
 
@@ -5,6 +5,7 @@ Usage:
     cdc manage-pipelines verify
     cdc manage-pipelines verify --full
     cdc manage-pipelines verify --sink
+    cdc manage-pipelines verify --max-connections 500
 """
 
 from __future__ import annotations
@@ -18,6 +19,7 @@ from pathlib import Path
 from typing import Any, cast
 from urllib.parse import urlparse
 
+from cdc_generator.core.pipeline_generator_common import normalize_table_name
 from cdc_generator.helpers.psycopg2_loader import (
     PostgresNotAvailableError,
     create_postgres_connection,
@@ -28,7 +30,7 @@ from cdc_generator.helpers.service_config import (
     get_project_root,
     load_customer_config,
 )
-from cdc_generator.helpers.yaml_loader import load_yaml_file
+from cdc_generator.helpers.yaml_loader import load_yaml_fast, load_yaml_file
 
 
 def _parse_args() -> argparse.Namespace:
@@ -51,6 +53,13 @@ def _parse_args() -> argparse.Namespace:
         default=None,
         help="Optional service name filter for --sink checks",
     )
+    parser.add_argument(
+        "--max-connections",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Fail when a generated sink can open more than N Postgres connections",
+    )
     return parser.parse_args()
 
 
@@ -105,6 +114,9 @@ def _validate_yaml_and_structure(project_root: Path) -> list[str]:
     errors.extend(
         _check_template_placeholders(sink_template),
     )
+    batched_source_template = templates_dir / "source-pipeline-batched-lsn.yaml"
+    if batched_source_template.exists():
+        errors.extend(_check_template_placeholders(batched_source_template))
 
     return errors
 
@@ -158,6 +170,186 @@ def _validate_generated_outputs(project_root: Path) -> list[str]:
     return errors
 
 
+_SQL_OUTPUT_TYPES = ("sql_insert", "sql_raw")
+_ENV_DEFAULT_PATTERN = re.compile(r"^\$\{([A-Za-z_][A-Za-z0-9_]*)(?::-([^}]*))?\}$")
+_DSN_CREDENTIALS_PATTERN = re.compile(r"//[^@/]*@")
+
+
+def _resolve_conn_limit(value: object) -> int | None:
+    """Resolve ``conn_max_open`` (literal or ``${VAR:-default}``); None = unbounded."""
+    raw = str(value).strip() if value is not None else ""
+    match = _ENV_DEFAULT_PATTERN.match(raw)
+    if match:
+        raw = os.environ.get(match.group(1), match.group(2) or "")
+    try:
+        limit = int(raw)
+    except ValueError:
+        return None
+    return limit if limit > 0 else None
+
+
+def _iter_sql_outputs(output: object) -> list[dict[str, Any]]:
+    """sql_insert/sql_raw outputs under an output config (switch/broker aware)."""
+    if not isinstance(output, dict):
+        return []
+    output_dict = cast(dict[str, Any], output)
+    found: list[dict[str, Any]] = []
+    for output_type in _SQL_OUTPUT_TYPES:
+        sql_output = output_dict.get(output_type)
+        if isinstance(sql_output, dict):
+            found.append(cast(dict[str, Any], sql_output))
+    switch = output_dict.get("switch")
+    if isinstance(switch, dict):
+        for case in cast(list[object], cast(dict[str, Any], switch).get("cases") or []):
+            if isinstance(case, dict):
+                found.extend(_iter_sql_outputs(cast(dict[str, Any], case).get("output")))
+    broker = output_dict.get("broker")
+    if isinstance(broker, dict):
+        for child in cast(list[object], cast(dict[str, Any], broker).get("outputs") or []):
+            found.extend(_iter_sql_outputs(child))
+    return found
+
+
+def _sink_connection_budget(sink_path: Path) -> dict[str, tuple[int, int | None]]:
+    """Per-DSN (sql output count, worst-case connections) for a sink file.
+
+    Each sql output keeps its own pool, so the worst case for a DSN is the
+    sum of ``conn_max_open`` over its outputs; None when any is unbounded.
+    """
+    data = load_yaml_fast(sink_path)
+    outputs = _iter_sql_outputs(data.get("output"))
+    for resource in cast(list[object], data.get("output_resources") or []):
+        outputs.extend(_iter_sql_outputs(resource))
+
+    budget: dict[str, tuple[int, int | None]] = {}
+    for sql_output in outputs:
+        dsn = _DSN_CREDENTIALS_PATTERN.sub("//***@", str(sql_output.get("dsn", "")))
+        count, total = budget.get(dsn, (0, 0))
+        limit = _resolve_conn_limit(sql_output.get("conn_max_open"))
+        budget[dsn] = (count + 1, None if total is None or limit is None else total + limit)
+    return budget
+
+
+def _report_sink_connections(project_root: Path, max_connections: int | None) -> list[str]:
+    """Print the worst-case Postgres connection count of each generated sink."""
+    errors: list[str] = []
+    sink_dir = project_root / "pipelines" / "generated" / "sinks"
+    sink_files = sorted(sink_dir.rglob("*.yaml")) if sink_dir.exists() else []
+    if not sink_files:
+        return errors
+
+    print("\n🔌 Worst-case sink connections:")
+    for sink_path in sink_files:
+        try:
+            budget = _sink_connection_budget(sink_path)
+        except Exception as exc:
+            errors.append(f"Could not read generated sink {sink_path}: {exc}")
+            continue
+        rel_path = sink_path.relative_to(project_root)
+        totals = [total for _, total in budget.values()]
+        if any(total is None for total in totals):
+            print(f"  - {rel_path}: unbounded (sql output without conn_max_open)")
+            if max_connections is not None:
+                errors.append(f"{rel_path}: sql outputs without conn_max_open can exceed {max_connections} connections")
+        else:
+            file_total = sum(cast(list[int], totals))
+            print(f"  - {rel_path}: {file_total} connection(s)")
+            if max_connections is not None and file_total > max_connections:
+                errors.append(f"{rel_path}: worst case {file_total} connections exceeds --max-connections {max_connections}")
+        for dsn, (count, total) in sorted(budget.items()):
+            print(f"      {dsn}: {count} sql output(s), {total if total is not None else 'unbounded'}")
+    return errors
+
+
+_SOURCE_TABLE_META_PATTERN = re.compile(r'meta source_table = "([^"]+)"')
+_PER_TABLE_COLUMNS_PATTERN = re.compile(r"\[__\$update_mask\](?P<columns>[^\n]*)\n\s*FROM cdc\.")
+_UNION_BRANCH_PATTERN = re.compile(r"'(?P<table>(?:[^']|'')+)' AS __source_table.*?\(SELECT (?P<columns>.*?) FOR JSON")
+_BRACKETED_NAME_PATTERN = re.compile(r"\[([^\]]+)\]")
+_STAGING_INSERT_PATTERN = re.compile(r'"(stg_[^"]+)" \(([^)]*)\)')
+_STAGING_TABLE_PATTERN = re.compile(r'"(stg_[^"]+)"')
+
+
+def _source_selected_columns(source_path: Path) -> dict[str, set[str]]:
+    """Table -> source columns selected from its change table."""
+    data = load_yaml_fast(source_path)
+    broker = cast(dict[str, Any], data.get("input") or {}).get("broker") or {}
+    selected: dict[str, set[str]] = {}
+    for input_cfg in cast(list[object], cast(dict[str, Any], broker).get("inputs") or []):
+        if not isinstance(input_cfg, dict):
+            continue
+        queries: list[str] = []
+        tables: list[str] = []
+        for processor in cast(list[object], cast(dict[str, Any], input_cfg).get("processors") or []):
+            if not isinstance(processor, dict):
+                continue
+            sql_raw = cast(dict[str, Any], processor).get("sql_raw")
+            if isinstance(sql_raw, dict):
+                queries.append(str(cast(dict[str, Any], sql_raw).get("query", "")))
+            bloblang = cast(dict[str, Any], processor).get("bloblang")
+            if isinstance(bloblang, str):
+                tables.extend(_SOURCE_TABLE_META_PATTERN.findall(bloblang))
+        for query in queries:
+            for branch in _UNION_BRANCH_PATTERN.finditer(query.replace("\n", " ")):
+                table = branch.group("table").replace("''", "'")
+                selected.setdefault(table, set()).update(_BRACKETED_NAME_PATTERN.findall(branch.group("columns")))
+            per_table = _PER_TABLE_COLUMNS_PATTERN.search(query)
+            if per_table is not None and tables:
+                selected.setdefault(tables[0], set()).update(_BRACKETED_NAME_PATTERN.findall(per_table.group("columns")))
+    return selected
+
+
+def _sink_staged_columns(sink_path: Path) -> dict[str, set[str]]:
+    """Staging table -> columns written by a generated sink."""
+    data = load_yaml_fast(sink_path)
+    staged: dict[str, set[str]] = {}
+    for sql_output in _iter_sql_outputs(data.get("output")):
+        table_match = _STAGING_TABLE_PATTERN.search(str(sql_output.get("table", "")))
+        if table_match is not None:
+            columns = cast(list[object], sql_output.get("columns") or [])
+            staged.setdefault(table_match.group(1), set()).update(str(column).strip('"') for column in columns)
+        insert_match = _STAGING_INSERT_PATTERN.search(str(sql_output.get("query", "")))
+        if insert_match is not None:
+            staged.setdefault(insert_match.group(1), set()).update(
+                column.strip().strip('"') for column in insert_match.group(2).split(",")
+            )
+    return staged
+
+
+def _report_unused_source_columns(project_root: Path) -> None:
+    """Warn about source columns selected from CDC tables but never staged."""
+    generated_dir = project_root / "pipelines" / "generated"
+    sources_dir = generated_dir / "sources"
+    if not sources_dir.exists():
+        return
+
+    warnings: list[str] = []
+    for source_path in sorted(sources_dir.glob("*/*/source-pipeline.yaml")):
+        sink_paths = sorted((generated_dir / "sinks" / source_path.parent.parent.name).glob("sink-pipeline*.yaml"))
+        if not sink_paths:
+            continue
+        try:
+            selected = _source_selected_columns(source_path)
+            staged: dict[str, set[str]] = {}
+            for sink_path in sink_paths:
+                for staging_table, columns in _sink_staged_columns(sink_path).items():
+                    staged.setdefault(staging_table, set()).update(columns)
+        except Exception as exc:
+            warnings.append(f"{source_path.relative_to(project_root)}: could not compare columns ({exc})")
+            continue
+        for table, columns in sorted(selected.items()):
+            staged_columns = staged.get(f"stg_{normalize_table_name(table)}")
+            if staged_columns is None:
+                continue
+            unused = sorted(column for column in columns if normalize_table_name(column) not in staged_columns)
+            if unused:
+                warnings.append(f"{source_path.relative_to(project_root)}: {table}: {', '.join(unused)}")
+
+    if warnings:
+        print("\n⚠️  Source columns selected but never written downstream (add ignore_columns):")
+        for warning in warnings:
+            print(f"  - {warning}")
+
+
 def _resolve_env_value(value: str) -> str:
     def replace_var(match: re.Match[str]) -> str:
         var_name = match.group(1)
@@ -196,7 +388,7 @@ def _extract_sink_server_connections(
     if not sink_groups_path.exists():
         return []
 
-    sink_groups_data = cast(dict[str, Any], load_yaml_file(sink_groups_path))
+    sink_groups_data = cast(dict[str, Any], load_yaml_fast(sink_groups_path))
 
     connections: list[tuple[str, str, int, str, str, str]] = []
     for sink_group_name_raw, sink_group_raw in sink_groups_data.items():
@@ -354,9 +546,14 @@ def main() -> int:
             errors.extend(_run_full_generation(project_root))
         if not errors:
             errors.extend(_validate_generated_outputs(project_root))
+        if not errors:
+            errors.extend(_report_sink_connections(project_root, args.max_connections))
+            _report_unused_source_columns(project_root)
     else:
         print("🔍 Running light verification (YAML + structure + placeholders)...")
         errors = _validate_yaml_and_structure(project_root)
+        errors.extend(_report_sink_connections(project_root, args.max_connections))
+        _report_unused_source_columns(project_root)
 
     if errors:
         print("\n❌ Verification failed:")
@@ -28,7 +28,7 @@ from cdc_generator.helpers.service_schema_paths import (
     get_schema_roots,
     get_schema_write_root,
 )
-from cdc_generator.helpers.yaml_loader import load_yaml_file
+from cdc_generator.helpers.yaml_loader import load_yaml_fast
 
 # ---------------------------------------------------------------------------
 # Data structures
@@ -281,7 +281,7 @@ def _load_all_templates(path: Path) -> dict[str, ColumnTemplate]:
         Dict of template key → ColumnTemplate.
     """
     try:
-        raw_data = load_yaml_file(path)
+        raw_data = load_yaml_fast(path)
     except FileNotFoundError:
         print_error(f"Column templates file not found: {path}")
         return {}
@@ -22,6 +22,7 @@ from cdc_generator.helpers.helpers_logging import (
     print_success,
     print_warning,
 )
+from cdc_generator.helpers.service_config import get_project_model
 from cdc_generator.helpers.topology_runtime import (
     resolve_runtime_engine,
     resolve_runtime_mode,
@@ -212,6 +213,7 @@ def load_table_definitions(
 ) -> dict[str, dict[str, Any]]:
     """Load table definitions from services/_schemas/{service}/{schema}/{table}.yaml."""
     package_api = _package_api()
+    model = get_project_model(project_root)
     schema_dirs = package_api.get_service_schema_read_dirs(service_name, project_root)
 
     tables: dict[str, dict[str, Any]] = {}
@@ -223,7 +225,7 @@ def load_table_definitions(
                 continue
             schema_name = sub_dir.name
             for yaml_file in sorted(sub_dir.glob("*.yaml")):
-                raw_dict = package_api.load_yaml_file(yaml_file)
+                raw_dict = model.load(yaml_file)
                 if not isinstance(raw_dict, dict):
                     continue
                 raw_dict_typed = cast(dict[str, object], raw_dict)
@@ -5,18 +5,14 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any, cast
 
-from cdc_generator.helpers.yaml_loader import load_yaml_file
+from cdc_generator.helpers.service_config import get_project_model
 
 from .data_structures import GenerationResult, SinkTarget
 
 
 def _load_source_groups(project_root: Path) -> dict[str, Any]:
     """Load source-groups.yaml from the project root."""
-    sg_path = project_root / "source-groups.yaml"
-    if not sg_path.exists():
-        return {}
-    raw = load_yaml_file(sg_path)
-    return cast(dict[str, Any], raw)
+    return get_project_model(project_root).source_groups()
 
 
 def resolve_source_group_config(project_root: Path) -> dict[str, Any]:
@@ -94,10 +90,9 @@ def resolve_sink_target(sink_name: str, project_root: Path) -> SinkTarget:
     sink_service = parts[1] if len(parts) > 1 else ""
 
     databases: dict[str, str] = {}
-    sg_path = project_root / "sink-groups.yaml"
-    if sg_path.exists():
-        raw = load_yaml_file(sg_path)
-        group_cfg = cast(dict[str, Any], raw).get(sink_group, {})
+    sink_groups = get_project_model(project_root).sink_groups()
+    if sink_groups:
+        group_cfg = sink_groups.get(sink_group, {})
         if isinstance(group_cfg, dict):
             sources = cast(dict[str, Any], group_cfg).get("sources", {})
             if isinstance(sources, dict):
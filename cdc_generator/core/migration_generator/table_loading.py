@@ -6,7 +6,7 @@ from pathlib import Path
 from typing import Any, cast
 
 from cdc_generator.helpers.service_schema_paths import get_service_schema_read_dirs
-from cdc_generator.helpers.yaml_loader import load_yaml_file
+from cdc_generator.helpers.yaml_loader import load_yaml_fast
 
 
 def load_table_definitions(
@@ -25,7 +25,7 @@ def load_table_definitions(
                 continue
             schema_name = sub_dir.name
             for yaml_file in sorted(sub_dir.glob("*.yaml")):
-                raw_dict = cast(dict[str, Any], load_yaml_file(yaml_file))
+                raw_dict = cast(dict[str, Any], load_yaml_fast(yaml_file))
                 table_name = raw_dict.get("table")
                 if not isinstance(table_name, str):
                     table_name = yaml_file.stem
@@ -2,15 +2,38 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Any
 
-from cdc_generator.core.pipeline_generator_common import get_primary_key_from_schema
+from cdc_generator.core.pipeline_generator_columns import project_source_columns
+from cdc_generator.core.pipeline_generator_common import GeneratedTableIndex
 from cdc_generator.core.pipeline_generator_transforms import (
     build_source_transform_processors,
     collect_sink_table_cfgs_for_source,
 )
 from cdc_generator.helpers.helpers_batch import build_staging_case
 
+# Per-table poll intervals, matching the native runtime's
+# native_cdc_schedule_policy base intervals for the same profiles.
+POLLING_PROFILES: dict[str, str] = {
+    "hot": "1s",
+    "warm": "5s",
+    "cool": "30s",
+    "cold": "60s",
+}
+DEFAULT_POLLING_PROFILE = "warm"
+MAX_LSN_CACHE_KEY = "__db_max_lsn"
+SOURCE_POLL_MODES = ("per-table", "union")
+_INITIAL_LSN = "0x00000000000000000000"
+
+# ``source.lsn_commit`` -> source template. ``batch`` keeps read watermarks
+# in memory and commits all tables' LSNs under one key once per batch.
+SOURCE_TEMPLATES: dict[str, str] = {
+    "message": "source-pipeline.yaml",
+    "batch": "source-pipeline-batched-lsn.yaml",
+}
+COMMITTED_LSNS_CACHE_KEY = "committed_lsns"
+
 
 def build_table_include_list(config: dict[str, Any]) -> str:
     """Build comma-separated table include list from CDC tables config."""
@@ -25,7 +48,6 @@ def build_table_include_list(config: dict[str, Any]) -> str:
 def build_sink_topics(
     config: dict[str, Any],
     topic_prefix: str,
-    generated_tables: dict[str, Any],
 ) -> str:
     """Build comma-separated list of Kafka topics for the sink to subscribe to."""
     source_tables = config.get('cdc_tables', [])
@@ -40,24 +62,302 @@ def build_sink_topics(
         for table_cfg in source_tables:
             table_name = table_cfg['table']
             schema = table_cfg.get('schema', 'dbo')
-
-            table_def = generated_tables.get(table_name)
-            if table_def and 'topic_format' in table_def:
-                topic = table_def['topic_format'].replace("{TOPIC_PREFIX}", topic_prefix)
-                topics.append(topic)
-            else:
-                topics.append(f"{topic_prefix}.{schema}.{table_name}")
+            topics.append(f"{topic_prefix}.{schema}.{table_name}")
 
     return "\n".join([f"      - \"{topic}\"" for topic in topics]).strip()
 
 
+def resolve_polling_interval(table_config: dict[str, Any]) -> str:
+    """Poll interval for a table's ``polling`` profile (hot/warm/cool/cold)."""
+    profile = str(table_config.get('polling') or DEFAULT_POLLING_PROFILE).strip().lower()
+    interval = POLLING_PROFILES.get(profile)
+    if interval is None:
+        print(
+            f"[WARNING] Unknown polling profile '{profile}' for {table_config.get('table')} "
+            + f"- using '{DEFAULT_POLLING_PROFILE}'"
+        )
+        interval = POLLING_PROFILES[DEFAULT_POLLING_PROFILE]
+    return interval
+
+
+def source_poll_mode(service_cfg: dict[str, Any] | None) -> str:
+    """The service's ``source.poll_mode`` (``per-table`` unless configured)."""
+    source_cfg = (service_cfg or {}).get('source')
+    mode = source_cfg.get('poll_mode') if isinstance(source_cfg, dict) else None
+    if mode is None:
+        return SOURCE_POLL_MODES[0]
+    if mode not in SOURCE_POLL_MODES:
+        print(f"[WARNING] Unknown source poll_mode '{mode}' - using '{SOURCE_POLL_MODES[0]}'")
+        return SOURCE_POLL_MODES[0]
+    return str(mode)
+
+
+def lsn_commit_mode(service_cfg: dict[str, Any] | None) -> str:
+    """The service's ``source.lsn_commit`` mode (``message`` unless configured)."""
+    source_cfg = (service_cfg or {}).get('source')
+    mode = source_cfg.get('lsn_commit') if isinstance(source_cfg, dict) else None
+    if mode is None:
+        return "message"
+    if mode not in SOURCE_TEMPLATES:
+        print(f"[WARNING] Unknown source lsn_commit '{mode}' - using 'message'")
+        return "message"
+    return str(mode)
+
+
+def source_template_name(service_cfg: dict[str, Any] | None) -> str:
+    """Source pipeline template for the service's LSN commit mode."""
+    return SOURCE_TEMPLATES[lsn_commit_mode(service_cfg)]
+
+
+def probe_max_lsn_enabled(service_cfg: dict[str, Any] | None) -> bool:
+    """Whether the service opted into the ``source.probe_max_lsn`` probe."""
+    source_cfg = (service_cfg or {}).get('source')
+    return isinstance(source_cfg, dict) and source_cfg.get('probe_max_lsn') is True
+
+
+def build_max_lsn_probe_input(dsn: str) -> str:
+    """Build the per-database input that caches ``sys.fn_cdc_get_max_lsn()``.
+
+    The probe emits no messages; table inputs compare the cached value with
+    the max LSN they last drained to and skip their CDC query when equal.
+    """
+    return f"""- label: cdc_max_lsn_probe
+  generate:
+    interval: ${{MSSQL_CDC_PROBE_INTERVAL:-1s}}
+    mapping: 'root = {{}}'
+  processors:
+    - sql_raw:
+        driver: mssql
+        dsn: "{dsn}"
+        query: 'SELECT CONVERT(VARCHAR(22), sys.fn_cdc_get_max_lsn(), 1) AS max_lsn'
+    - bloblang: 'root = if this.type() == "array" && this.length() > 0 {{ this.index(0).max_lsn.or("") }} else {{ "" }}'
+    - cache:
+        resource: lsn_cache
+        operator: set
+        key: "{MAX_LSN_CACHE_KEY}"
+        value: '${{! content() }}'
+    - bloblang: 'root = deleted()'"""
+
+
+def _lsn_lookup_processors(table_label: str, target: str, batched: bool) -> str:
+    """Processors that load a table's last LSN into ``root.<target>``.
+
+    Batched commits read the in-memory watermark first and fall back to the
+    committed LSNs only when the table has not been polled since start.
+    """
+    if not batched:
+        return f"""
+    - try:
+        - branch:
+            request_map: 'root = ""'
+            processors:
+              - cache:
+                  resource: lsn_cache
+                  operator: get
+                  key: "{table_label}_last_lsn"
+            result_map: 'root.{target} = content().string()'"""
+    return f"""
+    - try:
+        - branch:
+            request_map: 'root = ""'
+            processors:
+              - cache:
+                  resource: lsn_watermarks
+                  operator: get
+                  key: "{table_label}_last_lsn"
+            result_map: 'root.{target} = content().string()'
+    - catch:
+        - branch:
+            request_map: 'root = ""'
+            processors:
+              - cache:
+                  resource: lsn_cache
+                  operator: get
+                  key: "{COMMITTED_LSNS_CACHE_KEY}"
+            result_map: 'root.{target} = this.get("{table_label}").or("{_INITIAL_LSN}")'"""
+
+
+def _watermark_advance_processors(table_label: str, table_name: str | None = None) -> str:
+    """Processors that advance a table's in-memory watermark to its last row read.
+
+    ``table_name`` filters the rows of a multi-table (union) result.
+    """
+    rows = "this" if table_name is None else f'this.filter(row -> row.__source_table == "{table_name}")'
+    return f"""
+    - branch:
+        request_map: |
+          let rows = {rows}
+          root = if $rows.length() > 0 {{ $rows.index(-1).__lsn_hex }} else {{ deleted() }}
+        processors:
+          - cache:
+              resource: lsn_watermarks
+              operator: set
+              key: "{table_label}_last_lsn"
+              value: '${{! content() }}'"""
+
+
+def _probe_skip_processors(probed_key: str) -> str:
+    return f"""
+    # Skip the CDC query when the database max LSN is unchanged since this
+    # table last drained its change table
+    - bloblang: 'root = this.merge({{"db_max_lsn": "", "probed_lsn": ""}})'
+    - try:
+        - branch:
+            request_map: 'root = ""'
+            processors:
+              - cache:
+                  resource: lsn_cache
+                  operator: get
+                  key: "{MAX_LSN_CACHE_KEY}"
+            result_map: 'root.db_max_lsn = content().string()'
+    - try:
+        - branch:
+            request_map: 'root = ""'
+            processors:
+              - cache:
+                  resource: lsn_cache
+                  operator: get
+                  key: "{probed_key}"
+            result_map: 'root.probed_lsn = content().string()'
+    - bloblang: 'root = if this.db_max_lsn != "" && this.db_max_lsn == this.probed_lsn {{ deleted() }} else {{ this }}'
+    - bloblang: |
+        meta probe_lsn = this.db_max_lsn
+        root = this"""
+
+
+def _probe_record_processors(probed_key: str) -> str:
+    return f"""
+    # Remember the probed max LSN once the change table is drained
+    - branch:
+        request_map: 'root = if this.length() < ${{MSSQL_CDC_SELECT_TOP:-100000}} {{ @probe_lsn.or("") }} else {{ "" }}'
+        processors:
+          - cache:
+              resource: lsn_cache
+              operator: set
+              key: "{probed_key}"
+              value: '${{! content() }}'"""
+
+
+@dataclass(frozen=True)
+class _UnionTable:
+    """One change table polled by the multi-table ``union`` input."""
+
+    schema: str
+    table_name: str
+    mssql_columns: tuple[str, ...]
+    interval: str
+    transform_processors: str
+
+    @property
+    def label(self) -> str:
+        return self.table_name.lower()
+
+
+def _union_branch_sql(table: _UnionTable, arg_index: int) -> str:
+    table_literal = table.table_name.replace("'", "''")
+    row_columns = ", ".join(f"ct.{col}" for col in table.mssql_columns)
+    return (
+        "SELECT * FROM (\n"
+        + f"  SELECT TOP ${{MSSQL_CDC_SELECT_TOP:-100000}} '{table_literal}' AS __source_table, "
+        + "CONVERT(VARCHAR(22), ct.[__$start_lsn], 1) AS __lsn_hex, "
+        + "CONVERT(VARCHAR(22), ct.[__$seqval], 1) AS __seqval_hex, "
+        + "ct.[__$operation], ct.[__$update_mask], "
+        + f"(SELECT {row_columns} FOR JSON PATH, WITHOUT_ARRAY_WRAPPER, INCLUDE_NULL_VALUES) AS __row_json\n"
+        + f"  FROM cdc.{table.schema}_{table.table_name}_CT AS ct\n"
+        + f"  WHERE ct.[__$start_lsn] > CONVERT(VARBINARY(10), ${arg_index}, 1)\n"
+        + "  ORDER BY ct.[__$start_lsn], ct.[__$seqval]\n"
+        + f") AS {table.label}_changes"
+    )
+
+
+def build_union_source_input(
+    dsn: str,
+    tables: list[_UnionTable],
+    probe_max_lsn: bool = False,
+    batched_lsn: bool = False,
+) -> str:
+    """Build one input that polls every change table with a single UNION ALL query.
+
+    Each branch reads its own table above that table's cached LSN; rows
+    carry ``__source_table`` and their columns as ``__row_json`` and are
+    fanned back out to per-table messages inside the pipeline. The input
+    polls at the interval of the hottest table's profile.
+    """
+    interval = min((table.interval for table in tables), key=lambda value: int(value.rstrip("s")))
+    initial_lsns = ", ".join(f'"{table.label}": "{_INITIAL_LSN}"' for table in tables)
+    lsn_lookups = "".join(
+        _lsn_lookup_processors(table.label, f"lsn.{table.label}", batched_lsn) for table in tables
+    )
+    watermarks = ""
+    if batched_lsn:
+        watermarks = "\n    # Advance the in-memory read watermarks" + "".join(
+            _watermark_advance_processors(table.label, table.table_name) for table in tables
+        )
+    union_sql = "\nUNION ALL\n".join(
+        _union_branch_sql(table, arg_index) for arg_index, table in enumerate(tables, start=1)
+    ).replace("\n", "\n          ")
+    lsn_args = ", ".join(f'this.lsn.{table.label}' for table in tables)
+    probe_skip = _probe_skip_processors("union_probed_lsn") if probe_max_lsn else ""
+    probe_record = _probe_record_processors("union_probed_lsn") if probe_max_lsn else ""
+
+    transform_cases = [
+        f"""
+        - check: '@source_table == "{table.table_name}"'
+          processors:{table.transform_processors.replace(chr(10), chr(10) + "        ")}"""
+        for table in tables
+        if table.transform_processors
+    ]
+    transforms = ""
+    if transform_cases:
+        transforms = "\n    # Apply source-stage transforms per table\n    - switch:" + "".join(transform_cases)
+
+    return f"""- label: union_cdc
+  generate:
+    interval: {interval}
+    mapping: 'root = {{}}'
+  processors:
+    # Initialize every table with the default LSN, then read cached LSNs
+    - bloblang: 'root.lsn = {{ {initial_lsns} }}'{lsn_lookups}{probe_skip}
+    # Query all CDC tables in one round-trip, each above its own LSN
+    # IMPORTANT: TOP limits each table's share of the batch
+    - sql_raw:
+        driver: mssql
+        dsn: "{dsn}"
+        query: |
+          {union_sql}
+          ORDER BY __lsn_hex, __seqval_hex
+        args_mapping: 'root = [ {lsn_args} ]'
+    # Ensure result is always an array
+    # (sql_raw returns empty object when no rows, but we need empty array)
+    - bloblang: 'root = if this.type() == "object" {{ [] }} else {{ this }}'{probe_record}{watermarks}
+    # Split the array result into individual messages (one per CDC row)
+    - unarchive:
+        format: json_array
+    # Fan rows out by table: restore the row columns next to the CDC fields
+    - bloblang: |
+        meta source_table = this.__source_table
+        root = this.without("__source_table", "__seqval_hex", "__row_json").merge(this.__row_json.parse_json()){transforms}
+    # Capture the LSN for cache update (already hex string from SQL)
+    - bloblang: |
+        meta max_lsn = this.get("__lsn_hex")
+        root = this"""
+
+
 def build_source_table_inputs(
     config: dict[str, Any],
     variables: dict[str, Any],
-    generated_tables: dict[str, Any],
+    table_index: GeneratedTableIndex,
     service_cfg: dict[str, Any] | None = None,
 ) -> str:
-    """Build generate + sql_raw inputs for continuous CDC polling with LSN tracking."""
+    """Build generate + sql_raw inputs for continuous CDC polling with LSN tracking.
+
+    Each table polls at the interval of its ``polling`` profile. With
+    ``source.probe_max_lsn: true`` one probe input per database caches the
+    max LSN and table inputs skip their query while it is unchanged. With
+    ``source.poll_mode: union`` all tables share one UNION ALL input. With
+    ``source.lsn_commit: batch`` inputs resume from in-memory watermarks
+    (see ``SOURCE_TEMPLATES``).
+    """
     source_tables = config.get('cdc_tables', [])
     if not source_tables:
         return ""
@@ -69,6 +369,12 @@ def build_source_table_inputs(
     mssql_port = variables['MSSQL_PORT']
     mssql_database = variables['DATABASE_NAME']
     dsn = f"sqlserver://{mssql_user}:{mssql_password}@{mssql_host}:{mssql_port}?database={mssql_database}"
+    service_name = str(config.get('service', '')).strip()
+    probe_max_lsn = probe_max_lsn_enabled(service_cfg)
+    if probe_max_lsn:
+        inputs.append(build_max_lsn_probe_input(dsn))
+    union_tables: list[_UnionTable] | None = [] if source_poll_mode(service_cfg) == "union" else None
+    batched_lsn = lsn_commit_mode(service_cfg) == "batch"
 
     for table_config in source_tables:
         table_name = table_config['table']
@@ -77,40 +383,48 @@ def build_source_table_inputs(
         sink_table_cfgs = collect_sink_table_cfgs_for_source(service_cfg or {}, table_name)
         source_transform_processors = build_source_transform_processors(sink_table_cfgs)
 
-        table_def = generated_tables.get(table_name)
-        if not table_def or 'fields' not in table_def:
+        table_def = table_index.lookup(service_name, schema, table_name)
+        if table_def is None or not table_def.fields:
             print(f"[WARNING] No generated field metadata for {table_name} - skipping source input")
             continue
+        table_def = project_source_columns(table_def, table_config, service_cfg or {})
+
+        if union_tables is not None:
+            union_tables.append(_UnionTable(
+                schema=schema,
+                table_name=table_name,
+                mssql_columns=table_def.mssql_columns,
+                interval=resolve_polling_interval(table_config),
+                transform_processors=source_transform_processors,
+            ))
+            continue
 
-        fields = table_def['fields']
         table_label = table_name.lower()
-        cache_key = f"{table_label}_last_lsn"
+        lsn_lookup = _lsn_lookup_processors(table_label, "last_lsn", batched_lsn)
+        watermark = ""
+        if batched_lsn:
+            watermark = "\n    # Advance the in-memory read watermark to the last row read" + _watermark_advance_processors(
+                table_label,
+            )
+        probed_key = f"{table_label}_probed_lsn"
+        probe_skip = _probe_skip_processors(probed_key) if probe_max_lsn else ""
+        probe_record = _probe_record_processors(probed_key) if probe_max_lsn else ""
 
         select_columns = (
             "CONVERT(VARCHAR(22), [__$start_lsn], 1) AS __lsn_hex, "
             "[__$operation], [__$update_mask]"
         )
-        for field in fields:
-            mssql_col = field['mssql']
+        for mssql_col in table_def.mssql_columns:
             select_columns += f", {mssql_col}"
 
         input_yaml = f"""- label: {table_label}_cdc
   generate:
-    interval: 5s
+    interval: {resolve_polling_interval(table_config)}
     mapping: 'root = {{}}'
   processors:
     # Initialize with default LSN
     - bloblang: 'root.last_lsn = "0x00000000000000000000"'
-    # Try to get last processed LSN from cache
-    - try:
-        - branch:
-            request_map: 'root = ""'
-            processors:
-              - cache:
-                  resource: lsn_cache
-                  operator: get
-                  key: "{cache_key}"
-            result_map: 'root.last_lsn = content().string()'
+    # Try to get last processed LSN from cache{lsn_lookup}{probe_skip}
     # Query CDC table for records with LSN > last processed
     # sql_raw returns result set as JSON array
     # IMPORTANT: TOP 100000 limits batch size to prevent memory issues with large CDC backlogs
@@ -125,7 +439,7 @@ def build_source_table_inputs(
         args_mapping: 'root = [ this.last_lsn ]'
     # Ensure result is always an array
     # (sql_raw returns empty object when no rows, but we need empty array)
-    - bloblang: 'root = if this.type() == "object" {{ [] }} else {{ this }}'
+    - bloblang: 'root = if this.type() == "object" {{ [] }} else {{ this }}'{probe_record}{watermark}
     # Split the array result into individual messages (one per CDC row)
     - unarchive:
         format: json_array
@@ -138,6 +452,9 @@ def build_source_table_inputs(
 
         inputs.append(input_yaml)
 
+    if union_tables:
+        inputs.append(build_union_source_input(dsn, union_tables, probe_max_lsn, batched_lsn))
+
     result = ""
     for index, entry in enumerate(inputs):
         if index > 0:
@@ -167,7 +484,7 @@ def build_table_routing_map(
     service_name: str,
     config: dict[str, Any],
     variables: dict[str, Any],
-    generated_tables: dict[str, Any],
+    table_index: GeneratedTableIndex,
 ) -> str:
     """Build bloblang case statements for routing each table to correct topic/key."""
     source_tables = config.get('cdc_tables', [])
@@ -180,52 +497,23 @@ def build_table_routing_map(
     for table_config in source_tables:
         table_name = table_config['table']
         schema = table_config.get('schema', 'dbo')
-        table_def = generated_tables.get(table_name)
-        if not table_def:
+        table_def = table_index.lookup(service_name, schema, table_name)
+        if table_def is None or not table_def.fields:
             continue
 
-        key_expr = table_def.get('kafka_key')
-        topic_format = table_def.get('topic_format')
+        primary_key = table_index.primary_key(service_name, schema, table_name)
+        print(
+            f"  [i] {schema}.{table_name}: "
+            + f"Using primary_key from schema: {primary_key}"
+        )
 
-        if key_expr and topic_format:
-            full_topic = topic_format.replace("{TOPIC_PREFIX}", topic_prefix)
+        if isinstance(primary_key, list):
+            pk_parts = [f'$data.{pk}.string().or(\"\")' for pk in primary_key]
+            key_expr = ' + \"|\" + '.join(pk_parts)
         else:
-            primary_key: str | list[str] | None = table_def.get('primary_key')
-            pk_source = 'yaml' if primary_key else None
-
-            if not primary_key:
-                schema_pk, _source = get_primary_key_from_schema(service_name, schema, table_name)
-                if schema_pk:
-                    primary_key = schema_pk
-                    pk_source = 'schema'
-                    print(
-                        f"  [i] {schema}.{table_name}: "
-                        + f"Using primary_key from schema: {primary_key}"
-                    )
-
-            if not primary_key:
-                raise ValueError(
-                    f"{schema}.{table_name}: No primary_key found. "
-                    + "Generation requires schema metadata under "
-                    + f"services/_schemas/{service_name}/{schema}/{table_name}.yaml"
-                )
-
-            if pk_source == 'yaml':
-                schema_pk, _ = get_primary_key_from_schema(service_name, schema, table_name)
-                if schema_pk and schema_pk != primary_key:
-                    print(
-                        f"  ⚠️  {schema}.{table_name}: primary_key mismatch! "
-                        + f"YAML={primary_key}, Schema={schema_pk}"
-                    )
-
-            if isinstance(primary_key, list):
-                pk_list: list[str] = [str(pk) for pk in primary_key]
-                pk_parts = [f'$data.{pk}.string().or(\"\")' for pk in pk_list]
-                key_expr = ' + \"|\" + '.join(pk_parts)
-            else:
-                key_expr = f'$data.{primary_key}.string().or(\"\")'
-
-            full_topic = f"{topic_prefix}.{schema}.{table_name}"
+            key_expr = f'$data.{primary_key}.string().or(\"\")'
+
+        full_topic = f"{topic_prefix}.{schema}.{table_name}"
 
         case = f'''$table_name == "{table_name}" => {{
   "topic": "{full_topic}",
@@ -248,37 +536,30 @@ def build_sink_table_cases(
     config: dict[str, Any],
     schema: str,
     postgres_url: str,
-    generated_tables: dict[str, Any],
+    table_index: GeneratedTableIndex,
 ) -> str:
     """Build dynamic switch cases for sink pipeline using staging table pattern."""
     source_tables = config.get('cdc_tables', [])
     if not source_tables:
         return ""
 
+    service_name = str(config.get('service', '')).strip()
     cases: list[str] = []
 
     for table_config in source_tables:
         table_name = table_config['table']
 
-        table_def = generated_tables.get(table_name)
-        if not table_def or 'fields' not in table_def:
+        table_def = table_index.lookup(service_name, table_config.get('schema', 'dbo'), table_name)
+        if table_def is None or not table_def.fields:
             print(f"[WARNING] No generated field metadata for {table_name} - skipping")
             continue
 
-        fields = table_def['fields']
-        mssql_fields: list[str] = []
-        postgres_fields: list[str] = []
-
-        for field in fields:
-            mssql_fields.append(field['mssql'])
-            postgres_fields.append(field['postgres'])
-
         staging_case = build_staging_case(
             table_name=table_name,
             schema=schema,
             postgres_url=postgres_url,
-            postgres_fields=postgres_fields,
-            mssql_fields=mssql_fields,
+            postgres_fields=list(table_def.postgres_columns),
+            mssql_fields=list(table_def.mssql_columns),
         )
         cases.append(staging_case)
 
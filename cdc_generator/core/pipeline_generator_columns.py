@@ -0,0 +1,130 @@
+"""Column projection for generated CDC queries and staging writes.
+
+Source tables restrict their columns with ``include_columns`` or
+``ignore_columns`` in the service YAML. Sink tables restrict the columns they
+store with ``include_columns`` (cloned tables) or a ``columns`` mapping onto
+an existing target (``target_exists: true``), where same-named target
+columns are mapped implicitly.
+
+The change-table ``SELECT`` only drops columns that no sink table of the
+source table stores, and never when a sink table applies transforms or
+column templates (those may read any source column). Staging writes drop
+every column their own sink table does not store.
+"""
+
+from __future__ import annotations
+
+from typing import Any, cast
+
+from cdc_generator.core.pipeline_generator_common import GeneratedTable
+from cdc_generator.helpers.service_config import get_project_model
+
+SinkTable = tuple[str, str, dict[str, Any]]
+
+
+def _name_set(values: object) -> set[str] | None:
+    if not isinstance(values, list):
+        return None
+    names = {str(value).strip().casefold() for value in cast(list[object], values) if str(value).strip()}
+    return names or None
+
+
+def source_column_filter(table_config: dict[str, Any]) -> tuple[set[str] | None, set[str]]:
+    """(include, ignore) casefolded column names from a ``cdc_tables`` entry."""
+    return (
+        _name_set(table_config.get('include_columns')),
+        _name_set(table_config.get('ignore_columns')) or set(),
+    )
+
+
+def sink_tables_for_source(service_cfg: dict[str, Any], source_table: str) -> list[SinkTable]:
+    """(sink key, sink table key, config) of the first sink's tables fed by ``source_table``."""
+    sinks_raw = service_cfg.get('sinks', {})
+    if not isinstance(sinks_raw, dict) or not sinks_raw:
+        return []
+    sinks = cast(dict[str, Any], sinks_raw)
+    sink_key = str(next(iter(sinks)))
+    sink_root = sinks[sink_key]
+    if not isinstance(sink_root, dict):
+        return []
+    tables_raw = cast(dict[str, Any], sink_root).get('tables', {})
+    if not isinstance(tables_raw, dict):
+        return []
+
+    matching: list[SinkTable] = []
+    for table_key, table_cfg_raw in cast(dict[str, Any], tables_raw).items():
+        if not isinstance(table_cfg_raw, dict):
+            continue
+        table_cfg = cast(dict[str, Any], table_cfg_raw)
+        from_ref = str(table_cfg.get('from', '')).strip()
+        source_ref_table = from_ref.split('.', 1)[1] if '.' in from_ref else from_ref
+        if from_ref and source_ref_table.casefold() == source_table.casefold():
+            matching.append((sink_key, str(table_key), table_cfg))
+    return matching
+
+
+def sink_stored_columns(sink_table: SinkTable, table_def: GeneratedTable) -> set[str] | None:
+    """Casefolded source columns a sink table stores (None = every column)."""
+    sink_key, table_key, table_cfg = sink_table
+    include = _name_set(table_cfg.get('include_columns'))
+    mapping = table_cfg.get('columns')
+    if not table_cfg.get('target_exists') or not isinstance(mapping, dict):
+        return include
+
+    target_service = sink_key.split('.', 1)[1] if '.' in sink_key else ''
+    target_schema, target_table = table_key.split('.', 1) if '.' in table_key else ('public', table_key)
+    target_def = get_project_model().table_definition(target_service, target_schema, target_table)
+    target_columns_raw = target_def.get('columns') if target_def is not None else None
+    if not isinstance(target_columns_raw, list):
+        # Implicit same-name mappings are unknown without the target schema.
+        return include
+
+    target_names = {
+        str(cast(dict[str, Any], column).get('name', '')).casefold()
+        for column in cast(list[object], target_columns_raw)
+        if isinstance(column, dict)
+    }
+    source_names = {field["mssql"][1:-1].casefold() for field in table_def.fields}
+    stored = {str(name).casefold() for name in cast(dict[str, Any], mapping)} | (source_names & target_names)
+    return stored & include if include is not None else stored
+
+
+def project_source_columns(
+    table_def: GeneratedTable,
+    table_config: dict[str, Any],
+    service_cfg: dict[str, Any],
+) -> GeneratedTable:
+    """Columns the change-table query has to select for ``table_config``."""
+    include, ignore = source_column_filter(table_config)
+    sink_tables = sink_tables_for_source(service_cfg, table_def.name)
+    if not sink_tables or any(
+        table_cfg.get('transforms') or table_cfg.get('column_templates') for _, _, table_cfg in sink_tables
+    ):
+        return table_def.project(include, ignore)
+
+    needed: set[str] = set()
+    for sink_table in sink_tables:
+        stored = sink_stored_columns(sink_table, table_def)
+        if stored is None:
+            return table_def.project(include, ignore)
+        needed |= stored
+    return table_def.project(needed if include is None else needed & include, ignore)
+
+
+def project_staging_columns(
+    table_def: GeneratedTable,
+    table_config: dict[str, Any],
+    service_cfg: dict[str, Any],
+    sink_table_cfg: dict[str, Any] | None,
+) -> GeneratedTable:
+    """Columns the staging write for ``sink_table_cfg`` stores."""
+    include, ignore = source_column_filter(table_config)
+    if sink_table_cfg is not None:
+        for sink_table in sink_tables_for_source(service_cfg, table_def.name):
+            if sink_table[2] is not sink_table_cfg:
+                continue
+            stored = sink_stored_columns(sink_table, table_def)
+            if stored is not None:
+                include = stored if include is None else stored & include
+            break
+    return table_def.project(include, ignore)
@@ -2,31 +2,37 @@
 
 from __future__ import annotations
 
+import hashlib
+import os
 import re
+import tempfile
+from collections.abc import Callable
+from dataclasses import dataclass, replace
 from pathlib import Path
+from types import TracebackType
 from typing import Any, cast
 
 from cdc_generator.core.sink_env_routing import resolve_sink_env_key
+from cdc_generator.helpers.primary_key_resolver import (
+    PrimaryKeyResolver,
+    get_primary_key_resolver,
+)
 from cdc_generator.helpers.service_config import (
+    get_project_model,
     get_project_root,
-    load_service_config,
 )
-from cdc_generator.helpers.yaml_loader import ConfigValue, load_yaml_file
+from cdc_generator.helpers.yaml_loader import ConfigValue
 
 
 def get_services_for_customers(customers: list[str]) -> set[str]:
     """Determine which services are used by the given customers."""
     services: set[str] = set()
-    services_dir = get_project_root() / "services"
-
-    if not services_dir.exists():
-        return services
-
+    model = get_project_model()
     target_customers = {customer.casefold() for customer in customers}
 
-    for service_file in services_dir.glob("*.yaml"):
+    for service_name in model.service_names():
         try:
-            service_config = load_service_config(service_file.stem)
+            service_config = model.service_config(service_name)
             service_customers = service_config.get("customers", [])
             if not isinstance(service_customers, list):
                 continue
@@ -43,30 +49,216 @@ def get_services_for_customers(customers: list[str]) -> set[str]:
                     customer_names.add(name.casefold())
 
             if target_customers.intersection(customer_names):
-                services.add(service_file.stem)
+                services.add(service_name)
         except Exception:
             continue
 
     return services
 
 
-def normalize_for_comparison(content: str) -> str:
-    """Remove timestamp line from content for comparison purposes."""
-    lines = content.split("\n")
-    normalized_lines = [
-        line for line in lines
-        if not line.startswith("# Generated:")
-    ]
-    return "\n".join(normalized_lines)
+_GENERATED_LINE_PREFIX = "# Generated:"
+_CHECKSUM_LINE_PREFIX = "# Checksum: sha256:"
+# Header lines scanned for a checksum before giving up.
+_HEADER_SCAN_LINES = 40
+
+
+def _is_volatile_line(line: str) -> bool:
+    return line.startswith((_GENERATED_LINE_PREFIX, _CHECKSUM_LINE_PREFIX))
+
+
+def content_checksum(content: str) -> str:
+    """SHA256 of generated content, excluding the timestamp and checksum lines."""
+    digest = hashlib.sha256()
+    for line in content.splitlines(keepends=True):
+        if not _is_volatile_line(line):
+            digest.update(line.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def inject_checksum(content: str) -> str:
+    """Insert a ``# Checksum: sha256:`` line below the header's ``# Generated:`` line."""
+    checksum_line = f"{_CHECKSUM_LINE_PREFIX}{content_checksum(content)}\n"
+    generated_at = content.find(_GENERATED_LINE_PREFIX)
+    if generated_at == -1:
+        return checksum_line + content
+    line_end = content.find("\n", generated_at)
+    if line_end == -1:
+        return content + "\n" + checksum_line
+    return content[: line_end + 1] + checksum_line + content[line_end + 1 :]
+
+
+def read_header_checksum(file_path: Path) -> str | None:
+    """Return the checksum recorded in a generated file's header, if any."""
+    try:
+        with file_path.open(encoding="utf-8") as f:
+            for _, line in zip(range(_HEADER_SCAN_LINES), f, strict=False):
+                if line.startswith(_CHECKSUM_LINE_PREFIX):
+                    return line[len(_CHECKSUM_LINE_PREFIX):].strip()
+    except FileNotFoundError:
+        return None
+    return None
+
+
+def normalized_file_digest(file_path: Path) -> str | None:
+    """Hash a generated file line by line, ignoring volatile header lines.
+
+    Fallback for files written before header checksums existed. Returns None
+    when the file does not exist.
+    """
+    digest = hashlib.sha256()
+    try:
+        with file_path.open(encoding="utf-8") as f:
+            for line in f:
+                if not _is_volatile_line(line):
+                    digest.update(line.encode("utf-8"))
+    except FileNotFoundError:
+        return None
+    return digest.hexdigest()
+
+
+def existing_content_checksum(file_path: Path) -> str | None:
+    """Checksum of an existing generated file (None when missing).
+
+    Reads only the header when a checksum line is present.
+    """
+    return read_header_checksum(file_path) or normalized_file_digest(file_path)
 
 
 def should_write_file(file_path: Path, new_content: str) -> bool:
-    """Check if file should be written by comparing content (ignoring timestamp)."""
-    if not file_path.exists():
+    """Check if file should be written by comparing checksums (ignoring timestamp)."""
+    return existing_content_checksum(file_path) != content_checksum(new_content)
+
+
+def write_generated_file(file_path: Path, content: str) -> bool:
+    """Write generated content with a header checksum if it changed.
+
+    Returns:
+        True when the file was written, False when it was unchanged.
+    """
+    if not should_write_file(file_path, content):
+        return False
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    file_path.write_text(inject_checksum(content))
+    return True
+
+
+class SpooledBlock:
+    """Append-only text block buffered in a spooled temporary file.
+
+    Used for template values that grow with the number of tenants: items are
+    written out as they are produced instead of being collected in lists and
+    joined. ``prefix`` is emitted before the first item and ``separator``
+    between items; an empty block renders as "".
+    """
+
+    _MAX_IN_MEMORY = 1024 * 1024
+    _CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, *, separator: str = "\n", prefix: str = "") -> None:
+        self._separator = separator
+        self._prefix = prefix
+        self._file = tempfile.SpooledTemporaryFile(  # noqa: SIM115 - closed by close()
+            max_size=self._MAX_IN_MEMORY,
+            mode="w+",
+            encoding="utf-8",
+        )
+        self.count = 0
+
+    def append(self, text: str) -> None:
+        self._file.write(self._prefix if self.count == 0 else self._separator)
+        self._file.write(text)
+        self.count += 1
+
+    def write_to(self, write: Callable[[str], object]) -> None:
+        """Copy the block's content to ``write`` in chunks."""
+        self._file.seek(0)
+        while chunk := self._file.read(self._CHUNK_SIZE):
+            write(chunk)
+        self._file.seek(0, os.SEEK_END)
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> SpooledBlock:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class AtomicPipelineWriter:
+    """Stream a generated file into a temp sibling and rename it into place.
+
+    Content is hashed while it is written (volatile ``# Generated:`` and
+    ``# Checksum:`` lines are excluded). ``write_header()`` reserves a
+    checksum line below ``# Generated:`` that ``commit()`` fills in, and
+    ``commit()`` only replaces the target when its header checksum differs.
+    """
+
+    def __init__(self, file_path: Path) -> None:
+        self.file_path = file_path
+        self._tmp_path = file_path.with_name(f".{file_path.name}.{os.getpid()}.tmp")
+        self._digest = hashlib.sha256()
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self._tmp_path.open("wb")
+        self._checksum_offset: int | None = None
+        self._done = False
+
+    def write(self, text: str) -> None:
+        data = text.encode("utf-8")
+        self._file.write(data)
+        self._digest.update(data)
+
+    def _reserve_checksum(self) -> None:
+        self._checksum_offset = self._file.tell() + len(_CHECKSUM_LINE_PREFIX)
+        self._file.write(f"{_CHECKSUM_LINE_PREFIX}{'0' * 64}\n".encode())
+
+    def write_header(self, header: str) -> None:
+        """Write header text, leaving its ``# Generated:`` line out of the hash."""
+        for line in header.splitlines(keepends=True):
+            data = line.encode("utf-8")
+            self._file.write(data)
+            if line.startswith(_GENERATED_LINE_PREFIX):
+                if self._checksum_offset is None:
+                    self._reserve_checksum()
+            else:
+                self._digest.update(data)
+
+    def commit(self) -> bool:
+        """Finish the file; returns True when the target was (re)written."""
+        checksum = self._digest.hexdigest()
+        if self._checksum_offset is not None:
+            self._file.seek(self._checksum_offset)
+            self._file.write(checksum.encode("ascii"))
+        self._file.close()
+        self._done = True
+        if existing_content_checksum(self.file_path) == checksum:
+            self._tmp_path.unlink()
+            return False
+        self._tmp_path.replace(self.file_path)
         return True
 
-    existing_content = file_path.read_text()
-    return normalize_for_comparison(existing_content) != normalize_for_comparison(new_content)
+    def abort(self) -> None:
+        if not self._done:
+            self._file.close()
+            self._tmp_path.unlink(missing_ok=True)
+            self._done = True
+
+    def __enter__(self) -> AtomicPipelineWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.abort()
 
 
 def preserve_env_vars(value: object) -> str:
@@ -79,13 +271,83 @@ def preserve_env_vars(value: object) -> str:
 SINK_REF_PARTS_COUNT = 2
 
 
-def load_template(template_name: str) -> str:
-    """Load a template file as string."""
+_PLACEHOLDER_PATTERN = re.compile(r"\{\{([A-Za-z_][A-Za-z0-9_]*)\}\}")
+
+
+class CompiledTemplate:
+    """A ``{{VAR}}`` pipeline template tokenized once for single-pass rendering.
+
+    The text is split into alternating literal chunks and placeholder names;
+    ``render()`` walks them once and joins the pieces, so large values (such
+    as a consolidated sink's ``TABLE_CASES``) are never rescanned.
+    """
+
+    __slots__ = ("_literals", "_placeholders", "name")
+
+    def __init__(self, text: str, name: str = "<template>") -> None:
+        parts = _PLACEHOLDER_PATTERN.split(text)
+        self.name = name
+        self._literals = parts[0::2]
+        self._placeholders = parts[1::2]
+
+    @property
+    def placeholders(self) -> frozenset[str]:
+        """Placeholder names used by the template."""
+        return frozenset(self._placeholders)
+
+    def render(self, variables: dict[str, Any]) -> str:
+        """Render the template.
+
+        Raises:
+            ValueError: If the template uses placeholders missing from ``variables``.
+        """
+        pieces: list[str] = []
+        self.render_to(pieces.append, variables)
+        return "".join(pieces)
+
+    def render_to(self, write: Callable[[str], object], variables: dict[str, Any]) -> None:
+        """Stream the rendered template to ``write``.
+
+        ``SpooledBlock`` values are copied in chunks; other values are
+        converted with ``str()``.
+
+        Raises:
+            ValueError: If the template uses placeholders missing from ``variables``.
+        """
+        unknown = sorted(self.placeholders - variables.keys())
+        if unknown:
+            names = ", ".join(f"{{{{{name}}}}}" for name in unknown)
+            raise ValueError(f"Unknown placeholder(s) in {self.name}: {names}")
+
+        write(self._literals[0])
+        for placeholder, literal in zip(self._placeholders, self._literals[1:], strict=True):
+            value = variables[placeholder]
+            if isinstance(value, SpooledBlock):
+                value.write_to(write)
+            else:
+                write(str(value))
+            write(literal)
+
+
+_TEMPLATE_CACHE: dict[Path, tuple[tuple[int, int], CompiledTemplate]] = {}
+
+
+def load_template(template_name: str) -> CompiledTemplate:
+    """Load and compile a pipeline template (cached per path until it changes)."""
     templates_dir = get_project_root() / "pipelines" / "templates"
     template_path = templates_dir / template_name
     if not template_path.exists():
         raise FileNotFoundError(f"Template not found: {template_path}")
-    return template_path.read_text()
+
+    stat = template_path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _TEMPLATE_CACHE.get(template_path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    template = CompiledTemplate(template_path.read_text(), template_name)
+    _TEMPLATE_CACHE[template_path] = (stamp, template)
+    return template
 
 
 def normalize_table_name(name: str) -> str:
@@ -103,53 +365,200 @@ def normalize_table_name(name: str) -> str:
     return result
 
 
-def load_generated_table_definitions() -> dict[str, Any]:
-    """Load table definitions from canonical services/_schemas/ tree."""
-    services_dir = get_project_root() / "services"
-    generated_dir = services_dir / "_schemas"
+@dataclass(frozen=True)
+class GeneratedTable:
+    """Generation metadata precomputed for one ``services/_schemas`` table."""
+
+    service: str
+    schema: str
+    name: str
+    fields: tuple[dict[str, str], ...]
+    mssql_columns: tuple[str, ...]
+    postgres_columns: tuple[str, ...]
+    primary_key: str | list[str] | None
+
+    def project(self, include_columns: set[str] | None, ignore_columns: set[str]) -> GeneratedTable:
+        """Copy restricted to ``include_columns`` minus ``ignore_columns``.
+
+        Names are casefolded source column names; primary key columns are
+        always kept so the sink can still merge the rows.
+        """
+        if include_columns is None and not ignore_columns:
+            return self
+        primary_key = self.primary_key if isinstance(self.primary_key, list) else [self.primary_key or ""]
+        keep = {str(column).casefold() for column in primary_key if column}
+        fields = tuple(
+            field for field in self.fields
+            if field["mssql"][1:-1].casefold() in keep
+            or (
+                (include_columns is None or field["mssql"][1:-1].casefold() in include_columns)
+                and field["mssql"][1:-1].casefold() not in ignore_columns
+            )
+        )
+        if len(fields) == len(self.fields):
+            return self
+        return replace(
+            self,
+            fields=fields,
+            mssql_columns=tuple(field["mssql"] for field in fields),
+            postgres_columns=tuple(field["postgres"] for field in fields),
+        )
 
-    if not generated_dir.exists():
-        return {}
 
-    tables_by_name: dict[str, Any] = {}
-    for yaml_file in sorted(generated_dir.rglob("*.yaml")):
-        path_parts = set(yaml_file.parts)
-        if "_definitions" in path_parts or "_bloblang" in path_parts or "adapters" in path_parts:
+def _table_fields(table_def: dict[str, Any]) -> tuple[dict[str, str], ...]:
+    columns = table_def.get("columns")
+    if not isinstance(columns, list):
+        return ()
+    fields: list[dict[str, str]] = []
+    col_raw: object
+    for col_raw in cast(list[object], columns):
+        if not isinstance(col_raw, dict):
             continue
+        col = cast(dict[str, Any], col_raw)
+        col_name_raw = col.get("name")
+        if not isinstance(col_name_raw, str) or not col_name_raw:
+            continue
+        fields.append({
+            "mssql": f"[{col_name_raw}]",
+            "postgres": normalize_table_name(col_name_raw),
+        })
+    return tuple(fields)
 
-        table_def = load_yaml_file(yaml_file)
-        if table_def and table_def:
-            table_def_dict = cast(dict[str, object], table_def)
-            table_name = table_def_dict.get("table")
-            columns = table_def_dict.get("columns")
-            if not isinstance(table_name, str) or not isinstance(columns, list):
-                continue
-            columns_list = cast(list[object], columns)
-
-            fields: list[dict[str, str]] = []
-            col_raw: object
-            for col_raw in columns_list:
-                if not isinstance(col_raw, dict):
-                    continue
-                col = cast(dict[str, Any], col_raw)
-                col_name_raw = col.get("name")
-                if not isinstance(col_name_raw, str) or not col_name_raw:
-                    continue
-                postgres_name = normalize_table_name(col_name_raw)
-                fields.append(
-                    {
-                        "mssql": f"[{col_name_raw}]",
-                        "postgres": postgres_name,
-                    },
-                )
-
-            if fields:
-                tables_by_name[table_name] = {
-                    "name": table_name,
-                    "fields": fields,
-                }
 
-    return tables_by_name
+def _compact_primary_key(pk_columns: list[str]) -> str | list[str] | None:
+    if not pk_columns:
+        return None
+    if len(pk_columns) == 1:
+        return pk_columns[0]
+    return pk_columns
+
+
+# <service>/<schema>/<Table>.yaml below services/_schemas
+_TABLE_PATH_PARTS = 3
+
+
+class GeneratedTableIndex:
+    """Table definitions keyed by ``(service, schema, table)``.
+
+    Keys come from the ``services/_schemas/<service>/<schema>/<Table>.yaml``
+    path, so same-named tables in different schemas or services no longer
+    shadow each other. ``by_name()`` is kept for legacy customer configs that
+    carry no service.
+    """
+
+    def __init__(self, schemas_dir: Path, tables: dict[tuple[str, str, str], GeneratedTable]) -> None:
+        self.schemas_dir = schemas_dir
+        self._tables = tables
+        self._by_name: dict[str, GeneratedTable] = {}
+        for table in tables.values():
+            if table.fields:
+                self._by_name[table.name] = table
+
+    @classmethod
+    def build(
+        cls,
+        schemas_dir: Path,
+        table_defs: dict[Path, object],
+        resolver: PrimaryKeyResolver,
+    ) -> GeneratedTableIndex:
+        tables: dict[tuple[str, str, str], GeneratedTable] = {}
+        for path, raw in table_defs.items():
+            if not isinstance(raw, dict) or not raw:
+                continue
+            table_def = cast(dict[str, Any], raw)
+            parts = path.relative_to(schemas_dir).parts
+            if len(parts) < _TABLE_PATH_PARTS:
+                continue
+            table_name = table_def.get("table")
+            fields = _table_fields(table_def)
+            pk_columns = resolver.resolve(parts[0], parts[-2], path.stem) or []
+            tables[(parts[0], parts[-2], path.stem)] = GeneratedTable(
+                service=parts[0],
+                schema=parts[-2],
+                name=table_name if isinstance(table_name, str) else path.stem,
+                fields=fields,
+                mssql_columns=tuple(field["mssql"] for field in fields),
+                postgres_columns=tuple(field["postgres"] for field in fields),
+                primary_key=_compact_primary_key(pk_columns),
+            )
+        return cls(schemas_dir, tables)
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    def get(self, service_name: str, schema_name: str, table_name: str) -> GeneratedTable | None:
+        return self._tables.get((service_name, schema_name, table_name))
+
+    def by_name(self, table_name: str) -> GeneratedTable | None:
+        return self._by_name.get(table_name)
+
+    def lookup(self, service_name: str, schema_name: str, table_name: str) -> GeneratedTable | None:
+        """Resolve a CDC table config entry (by name when there is no service)."""
+        if service_name:
+            return self.get(service_name, schema_name, table_name)
+        return self.by_name(table_name)
+
+    def primary_key(
+        self,
+        service_name: str,
+        schema_name: str,
+        table_name: str,
+    ) -> str | list[str]:
+        """Primary key of a table.
+
+        Raises:
+            ValueError: If the table definition or its primary key is missing.
+        """
+        table_schema_path = self.schemas_dir / service_name / schema_name / f"{table_name}.yaml"
+        table = self.get(service_name, schema_name, table_name)
+        if table is None:
+            raise ValueError(
+                "Missing table schema definition for primary key resolution: "
+                + f"{table_schema_path}. "
+                + "Generation requires services/_schemas/{service}/{schema}/{Table}.yaml "
+                + "with a valid primary_key."
+            )
+        if table.primary_key is None:
+            raise ValueError(
+                "Missing primary key metadata in schema definition: "
+                + f"{table_schema_path}. "
+                + "Add top-level primary_key or mark columns with primary_key: true."
+            )
+        return table.primary_key
+
+
+_TABLE_INDEXES: dict[Path, tuple[tuple[tuple[Path, int, int], ...], GeneratedTableIndex]] = {}
+
+
+def get_generated_table_index() -> GeneratedTableIndex:
+    """Return the table index for the current project, building it once.
+
+    Every call stats the table definition files to validate the cached
+    index, so it suits long-lived callers; ``cdc manage-pipelines generate``
+    calls it once per run and passes the index through. The index is
+    rebuilt only when a file under ``services/_schemas`` is added, removed
+    or modified. Table files are parsed through the project
+    model, so a rebuild after a restart is served from the parsed-YAML cache,
+    and building the index warms the shared primary-key resolver.
+    """
+    model = get_project_model()
+    files = model.table_definition_files()
+    signature: list[tuple[Path, int, int]] = []
+    for path in files:
+        stat_result = path.stat()
+        signature.append((path, stat_result.st_mtime_ns, stat_result.st_size))
+    key = tuple(signature)
+
+    cached = _TABLE_INDEXES.get(model.schemas_dir)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    index = GeneratedTableIndex.build(
+        model.schemas_dir,
+        {path: model.load(path) for path in files},
+        get_primary_key_resolver(model.root),
+    )
+    _TABLE_INDEXES[model.schemas_dir] = (key, index)
+    return index
 
 
 def get_primary_key_from_schema(
@@ -158,61 +567,18 @@ def get_primary_key_from_schema(
     table_name: str,
 ) -> tuple[str | list[str] | None, str | None]:
     """Read primary_key from canonical service schema table definition."""
-    services_dir = get_project_root() / "services"
-    table_schema_path = services_dir / "_schemas" / service_name / schema_name / f"{table_name}.yaml"
+    return get_generated_table_index().primary_key(service_name, schema_name, table_name), "schema"
 
-    if not table_schema_path.exists():
-        raise ValueError(
-            "Missing table schema definition for primary key resolution: "
-            + f"{table_schema_path}. "
-            + "Generation requires services/_schemas/{service}/{schema}/{Table}.yaml "
-            + "with a valid primary_key."
-        )
-
-    table_def_dict = cast(dict[str, Any], load_yaml_file(table_schema_path))
-
-    top_level_pk = table_def_dict.get("primary_key")
-    if isinstance(top_level_pk, str) and top_level_pk:
-        return top_level_pk, "schema"
-    if isinstance(top_level_pk, list):
-        top_level_pk_list = cast(list[object], top_level_pk)
-        pk_list = [str(pk) for pk in top_level_pk_list if str(pk)]
-        if pk_list:
-            return pk_list, "schema"
-
-    columns = table_def_dict.get("columns", [])
-    pk_columns: list[str] = []
-    if isinstance(columns, list):
-        columns_list = cast(list[object], columns)
-        col: object
-        for col in columns_list:
-            if not isinstance(col, dict):
-                continue
-            col_dict = cast(dict[str, Any], col)
-            if col_dict.get("primary_key") is True:
-                col_name = col_dict.get("name")
-                if isinstance(col_name, str) and col_name:
-                    pk_columns.append(col_name)
-
-    if pk_columns:
-        if len(pk_columns) == 1:
-            return pk_columns[0], "schema"
-        return pk_columns, "schema"
-
-    raise ValueError(
-        "Missing primary key metadata in schema definition: "
-        + f"{table_schema_path}. "
-        + "Add top-level primary_key or mark columns with primary_key: true."
-    )
 
+def substitute_variables(template: str | CompiledTemplate, variables: dict[str, Any]) -> str:
+    """Replace {{VAR}} placeholders with values from variables dict.
 
-def substitute_variables(template: str, variables: dict[str, Any]) -> str:
-    """Replace {{VAR}} placeholders with values from variables dict."""
-    result = template
-    for key, value in variables.items():
-        placeholder = f"{{{{{key}}}}}"
-        result = result.replace(placeholder, str(value))
-    return result
+    Raises:
+        ValueError: If the template uses placeholders missing from ``variables``.
+    """
+    if isinstance(template, str):
+        template = CompiledTemplate(template)
+    return template.render(variables)
 
 
 def resolve_postgres_url_from_sink_groups(
@@ -221,7 +587,8 @@ def resolve_postgres_url_from_sink_groups(
     target_sink_env: str | None = None,
 ) -> str:
     """Build consolidated sink PostgreSQL URL from sink-groups.yaml."""
-    service_cfg = load_service_config(service_name)
+    model = get_project_model()
+    service_cfg = model.service_config(service_name)
     sinks_raw = service_cfg.get("sinks", {})
     if not isinstance(sinks_raw, dict) or not sinks_raw:
         raise ValueError(
@@ -239,11 +606,11 @@ def resolve_postgres_url_from_sink_groups(
 
     sink_group_name, sink_source_name = sink_ref_parts
 
-    sink_groups_path = get_project_root() / "sink-groups.yaml"
+    sink_groups_path = model.root / "sink-groups.yaml"
     if not sink_groups_path.exists():
         raise ValueError(f"Missing sink-groups.yaml at {sink_groups_path}")
 
-    sink_groups_data = cast(dict[str, Any], load_yaml_file(sink_groups_path))
+    sink_groups_data = model.sink_groups()
     sink_group_raw = sink_groups_data.get(sink_group_name)
     if not isinstance(sink_group_raw, dict):
         raise ValueError(
@@ -317,10 +684,7 @@ def resolve_postgres_url_from_sink_groups(
 
 
 def load_source_groups_config() -> dict[str, Any]:
-    source_groups_path = get_project_root() / "source-groups.yaml"
-    if not source_groups_path.exists():
-        return {}
-    return cast(dict[str, Any], load_yaml_file(source_groups_path))
+    return get_project_model().source_groups()
 
 
 def find_source_name_case_insensitive(group_name: str, customer_name: str) -> str | None:
@@ -3,23 +3,37 @@
 from __future__ import annotations
 
 from datetime import datetime
+from pathlib import Path
 from typing import Any, cast
 
+from cdc_generator.core.pipeline_generator_columns import project_staging_columns
 from cdc_generator.core.pipeline_generator_common import (
+    AtomicPipelineWriter,
+    CompiledTemplate,
+    GeneratedTableIndex,
+    SpooledBlock,
     get_services_for_customers,
     preserve_env_vars,
     resolve_postgres_url_from_sink_groups,
-    substitute_variables,
 )
+from cdc_generator.core.pipeline_generator_shards import sink_consumer_group
 from cdc_generator.core.pipeline_generator_transforms import (
+    RUNTIME_PROCESSORS_BLOCK_PREFIX,
     build_runtime_processor_case,
-    build_runtime_processors_block,
     build_sink_table_enrichment,
+    indent_runtime_processor_case,
     select_sink_table_cfg_for_source,
 )
-from cdc_generator.helpers.helpers_batch import build_staging_case
+from cdc_generator.helpers.helpers_batch import (
+    SINK_WRITE_MODES,
+    StagingRoute,
+    build_staging_route,
+    render_bulk_staging_case,
+    render_dynamic_staging_case,
+    render_staging_case,
+)
 from cdc_generator.helpers.helpers_logging import print_error
-from cdc_generator.helpers.service_config import load_customer_config, load_service_config
+from cdc_generator.helpers.service_config import get_project_model, load_customer_config
 
 
 def load_customer_env_config(
@@ -48,11 +62,11 @@ def build_customer_consolidated_routes(
     config: dict[str, Any],
     env_config: dict[str, Any],
     postgres_url: str,
-    generated_tables: dict[str, Any],
-) -> tuple[list[str], list[str], list[str], int, list[tuple[str, str]], int]:
-    """Build sink topics, table cases and runtime processors for one customer."""
+    table_index: GeneratedTableIndex,
+) -> tuple[list[str], list[StagingRoute], list[str], int, list[tuple[str, str]], int]:
+    """Build sink topics, staging routes and runtime processors for one customer."""
     topics: list[str] = []
-    table_cases: list[str] = []
+    table_routes: list[StagingRoute] = []
     runtime_cases: list[str] = []
     customer_generated_routes = 0
     skipped_routes = 0
@@ -62,7 +76,7 @@ def build_customer_consolidated_routes(
     source_tables_raw = config.get("cdc_tables", [])
     source_tables = cast(list[dict[str, Any]], source_tables_raw) if isinstance(source_tables_raw, list) else []
     service_name = str(config.get("service", ""))
-    service_cfg = load_service_config(service_name) if service_name else {}
+    service_cfg = get_project_model().service_config(service_name) if service_name else {}
     server_group_name = str(config.get("server_group", service_name))
 
     for table_config in source_tables:
@@ -71,16 +85,15 @@ def build_customer_consolidated_routes(
             continue
         table_schema = str(table_config.get("schema", "dbo"))
 
-        table_def = generated_tables.get(table_name)
-        if not table_def or "fields" not in table_def:
+        table_def = table_index.lookup(service_name, table_schema, table_name)
+        if table_def is None or not table_def.fields:
             print(f"   [WARNING] No generated field metadata for {table_name} - skipping")
             continue
 
-        fields = table_def["fields"]
-        mssql_fields = [field["mssql"] for field in fields]
-        postgres_fields = [field["postgres"] for field in fields]
-
         sink_table_cfg = select_sink_table_cfg_for_source(service_cfg, table_name)
+        staged_def = project_staging_columns(table_def, table_config, service_cfg, sink_table_cfg)
+        mssql_fields = list(staged_def.mssql_columns)
+        postgres_fields = list(staged_def.postgres_columns)
         extra_columns: list[str] = []
         extra_args: list[str] = []
         processor_steps: list[str] = []
@@ -105,21 +118,31 @@ def build_customer_consolidated_routes(
         if runtime_case:
             runtime_cases.append(runtime_case)
 
-        table_cases.append(
-            build_staging_case(
+        table_routes.append(
+            build_staging_route(
                 table_name=table_name,
-                schema=schema_name,
                 postgres_url=postgres_url,
                 postgres_fields=postgres_fields,
                 mssql_fields=mssql_fields,
                 extra_columns=extra_columns,
                 extra_args=extra_args,
+                batching=_sink_table_batching(sink_table_cfg),
             )
         )
         customer_generated_routes += 1
         topics.append(f'"{topic_prefix}.{table_schema}.{table_name}"')
 
-    return topics, table_cases, runtime_cases, customer_generated_routes, skipped_entries, skipped_routes
+    return topics, table_routes, runtime_cases, customer_generated_routes, skipped_entries, skipped_routes
+
+
+def _sink_table_batching(sink_table_cfg: dict[str, Any] | None) -> dict[str, object] | None:
+    """Per-table ``batching: {count, period}`` override from the sink table config."""
+    if sink_table_cfg is None:
+        return None
+    batching = sink_table_cfg.get("batching")
+    if not isinstance(batching, dict):
+        return None
+    return cast(dict[str, object], batching)
 
 
 def print_customer_skip_summary(
@@ -147,27 +170,67 @@ def print_customer_skip_summary(
     )
 
 
-def render_consolidated_sink_content(
-    env_name: str,
-    customers: list[str],
-    all_topics: list[str],
-    all_table_cases: list[str],
-    runtime_processor_cases: list[str],
-    sink_template: str,
-) -> str:
-    """Render consolidated sink content with generated header and substitutions."""
-    topics_yaml = "\n".join([f"      - {topic}" for topic in all_topics])
-    table_cases_yaml = "\n".join(all_table_cases).replace("\n", "\n      ")
-
-    variables = {
-        "ENV": env_name,
-        "SINK_TOPICS": "\n" + topics_yaml,
-        "TABLE_CASES": table_cases_yaml,
-        "SINK_RUNTIME_PROCESSORS": build_runtime_processors_block(runtime_processor_cases),
-    }
-    sink_pipeline = substitute_variables(sink_template, variables)
-
-    header = """# ============================================================================
+SINK_ROUTING_MODES = ("static", "dynamic")
+
+
+class ConsolidatedSinkBlocks:
+    """Per-environment sink sections, spooled as customers are processed.
+
+    Topics, table cases and runtime processor cases grow with the number of
+    tenants, so they are appended to ``SpooledBlock``s already formatted for
+    their position in the sink template instead of being held in lists.
+
+    With ``sink_routing="static"`` every (schema, table) pair gets its own
+    ``switch`` case. With ``"dynamic"`` staging routes are grouped by table
+    shape and ``finish_routes()`` emits one case per shape, so the sink has
+    O(tables) outputs instead of O(customers x tables).
+
+    ``sink_write="bulk"`` renders static cases that load each flushed batch
+    with one set-based INSERT instead of a multi-row INSERT.
+    """
+
+    def __init__(self, sink_routing: str = "static", sink_write: str = "insert") -> None:
+        if sink_routing not in SINK_ROUTING_MODES:
+            raise ValueError(f"Unknown sink routing mode: {sink_routing}")
+        if sink_write not in SINK_WRITE_MODES:
+            raise ValueError(f"Unknown sink write mode: {sink_write}")
+        if sink_write == "bulk" and sink_routing != "static":
+            raise ValueError("Bulk sink writes require static sink routing")
+        self.sink_routing = sink_routing
+        self.sink_write = sink_write
+        self.topics = SpooledBlock(prefix="\n", separator="\n")
+        self.table_cases = SpooledBlock(separator="\n      ")
+        self.runtime_cases = SpooledBlock(prefix=RUNTIME_PROCESSORS_BLOCK_PREFIX, separator="\n")
+        self._route_schemas: dict[StagingRoute, list[str]] = {}
+
+    def add_table_routes(self, schema: str, routes: list[StagingRoute]) -> None:
+        for route in routes:
+            if self.sink_routing == "dynamic":
+                self._route_schemas.setdefault(route, []).append(schema)
+            elif self.sink_write == "bulk":
+                self.table_cases.append(render_bulk_staging_case(schema, route).replace("\n", "\n      "))
+            else:
+                self.table_cases.append(render_staging_case(schema, route).replace("\n", "\n      "))
+
+    def finish_routes(self) -> None:
+        """Emit the grouped dynamic cases (no-op for static routing)."""
+        for route, schemas in self._route_schemas.items():
+            self.table_cases.append(render_dynamic_staging_case(schemas, route).replace("\n", "\n      "))
+        self._route_schemas.clear()
+
+    def add_customer(self, topics: list[str], runtime_cases: list[str]) -> None:
+        for topic in topics:
+            self.topics.append(f"      - {topic}")
+        for runtime_case in runtime_cases:
+            self.runtime_cases.append(indent_runtime_processor_case(runtime_case))
+
+    def close(self) -> None:
+        self.topics.close()
+        self.table_cases.close()
+        self.runtime_cases.close()
+
+
+_CONSOLIDATED_SINK_HEADER = """# ============================================================================
 # DO NOT EDIT THIS FILE - IT IS AUTO-GENERATED
 # ============================================================================
 # CONSOLIDATED SINK - Handles ALL customers for this environment
@@ -184,6 +247,26 @@ def render_consolidated_sink_content(
 
 """
 
+
+def write_consolidated_sink(
+    sink_path: Path,
+    env_name: str,
+    customers: list[str],
+    blocks: ConsolidatedSinkBlocks,
+    sink_template: CompiledTemplate,
+    *,
+    shard: tuple[int, int] | None = None,
+) -> bool:
+    """Stream the consolidated sink to ``sink_path``.
+
+    Header, template segments and spooled blocks are written straight to a
+    temp file that is renamed into place only when its content hash differs
+    from the existing file's. ``shard`` is ``(index, count)`` for one file of
+    a sharded sink and selects its consumer group.
+
+    Returns:
+        True when the file was written, False when it was unchanged.
+    """
     timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     customer_list = ", ".join(
         sorted([
@@ -192,8 +275,24 @@ def render_consolidated_sink_content(
             if load_customer_config(customer).get("environments", {}).get(env_name)
         ])
     )
-    header_formatted = header.format(env=env_name, customers=customer_list, timestamp=timestamp)
-    return header_formatted + sink_pipeline
+    variables: dict[str, Any] = {
+        "ENV": env_name,
+        "SINK_CONSUMER_GROUP": sink_consumer_group(env_name, shard[0] if shard is not None else None),
+        "SINK_TOPICS": blocks.topics,
+        "TABLE_CASES": blocks.table_cases,
+        "SINK_RUNTIME_PROCESSORS": blocks.runtime_cases,
+    }
+
+    with AtomicPipelineWriter(sink_path) as writer:
+        writer.write_header(
+            _CONSOLIDATED_SINK_HEADER.format(
+                env=env_name if shard is None else f"{env_name} (shard {shard[0]} of {shard[1]})",
+                customers=customer_list,
+                timestamp=timestamp,
+            )
+        )
+        sink_template.render_to(writer.write, variables)
+        return writer.commit()
 
 
 def print_consolidated_sink_skip_summary(
@@ -0,0 +1,257 @@
+"""Generation manifest for incremental pipeline generation.
+
+``pipelines/generated/.manifest.json`` records, for every generated pipeline
+file, the inputs it was rendered from and their content hashes. With
+``cdc manage-pipelines generate --incremental`` only outputs whose recorded
+inputs changed (or whose file is missing) are regenerated.
+
+Source pipeline inputs:
+    - ``services/<service>.yaml``
+    - the service's ``source-groups.yaml`` entry
+    - the ``(service, schema, table)`` definitions of the customer's CDC tables
+    - target table definitions of ``target_exists`` sink tables (column pruning)
+    - ``pipelines/templates/source-pipeline.yaml`` (or its batched-LSN variant)
+    - column templates and transform rules
+
+Consolidated sink inputs (one sink aggregates every customer, so it is
+tracked coarsely):
+    - ``services/*.yaml`` and the whole ``services/_schemas`` tree
+    - ``source-groups.yaml`` and ``sink-groups.yaml``
+    - ``pipelines/templates/sink-pipeline.yaml``
+    - the customer list for the environment
+    - the ``--sink-routing`` and ``--sink-write`` modes and ``--sink-shards`` count
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, cast
+
+from cdc_generator import __version__
+from cdc_generator.core.pipeline_generator_builders import source_template_name
+from cdc_generator.core.pipeline_generator_columns import sink_tables_for_source
+from cdc_generator.helpers.service_config import get_project_model
+from cdc_generator.helpers.service_schema_paths import get_schema_roots
+
+MANIFEST_FILENAME = ".manifest.json"
+MANIFEST_VERSION = 1
+
+_MISSING = "missing"
+
+
+def _digest_bytes(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _digest_value(value: object) -> str:
+    return _digest_bytes(json.dumps(value, sort_keys=True, default=str).encode("utf-8"))
+
+
+class InputDigests:
+    """Memoized content hashes for generation inputs of one project."""
+
+    def __init__(self, project_root: Path) -> None:
+        self.project_root = project_root
+        self._files: dict[Path, str] = {}
+        self._table_files: dict[str, list[Path]] | None = None
+
+    def rel(self, path: Path) -> str:
+        try:
+            return path.relative_to(self.project_root).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def file(self, path: Path) -> str:
+        """Hash of a file's bytes (``"missing"`` when absent)."""
+        cached = self._files.get(path)
+        if cached is None:
+            try:
+                cached = _digest_bytes(path.read_bytes())
+            except FileNotFoundError:
+                cached = _MISSING
+            self._files[path] = cached
+        return cached
+
+    def forget(self, path: Path) -> None:
+        """Drop the memoized hash of a file this run has rewritten."""
+        self._files.pop(path, None)
+
+    def tree(self, root: Path, suffixes: tuple[str, ...] = (".yaml", ".blobl")) -> str:
+        """Hash over every matching file under ``root`` (names and contents)."""
+        if not root.is_dir():
+            return _MISSING
+        entries = [
+            (self.rel(path), self.file(path))
+            for path in sorted(root.rglob("*"))
+            if path.is_file() and path.suffix in suffixes
+        ]
+        return _digest_value(entries)
+
+    def table(self, service_name: str, schema_name: str, table_name: str) -> str:
+        """Hash of the table definition a ``cdc_tables`` entry resolves to.
+
+        Generation looks definitions up by ``(service, schema, table)``
+        (``GeneratedTableIndex``), so only that file matters. Legacy configs
+        without a service match by table name across all definitions.
+        """
+        if service_name:
+            schemas_dir = get_project_model(self.project_root).schemas_dir
+            return self.file(schemas_dir / service_name / schema_name / f"{table_name}.yaml")
+        if self._table_files is None:
+            model = get_project_model(self.project_root)
+            index: dict[str, list[Path]] = {}
+            for path in model.table_definition_files():
+                try:
+                    raw = model.load(path)
+                except Exception:
+                    raw = None
+                name = cast(dict[str, Any], raw).get("table") if isinstance(raw, dict) else None
+                index.setdefault(name if isinstance(name, str) else path.stem, []).append(path)
+            self._table_files = index
+        return _digest_value([
+            (self.rel(path), self.file(path))
+            for path in self._table_files.get(table_name, [])
+        ])
+
+    def schema_root_files(self, filename: str) -> dict[str, str]:
+        """Hashes of ``filename`` in every schema root that has it."""
+        return {
+            self.rel(root / filename): self.file(root / filename)
+            for root in get_schema_roots(self.project_root)
+            if (root / filename).is_file()
+        }
+
+
+def source_output_inputs(
+    digests: InputDigests,
+    customer: str,
+    config: dict[str, Any],
+) -> dict[str, str]:
+    """Inputs a customer/environment source pipeline is rendered from."""
+    root = digests.project_root
+    model = get_project_model(root)
+    inputs: dict[str, str] = {}
+
+    service_name = str(config.get("service", "")).strip()
+    server_group: object = None
+    service_cfg: dict[str, Any] = {}
+    if service_name:
+        service_path = model.services_dir / f"{service_name}.yaml"
+        inputs[digests.rel(service_path)] = digests.file(service_path)
+        if service_path.is_file():
+            service_cfg = model.service_config(service_name)
+            server_group = service_cfg.get("server_group")
+    else:
+        legacy_path = root / "2-customers" / f"{customer}.yaml"
+        inputs[digests.rel(legacy_path)] = digests.file(legacy_path)
+
+    source_groups_path = root / "source-groups.yaml"
+    if isinstance(server_group, str) and server_group:
+        inputs[f"source-groups.yaml#{server_group}"] = _digest_value(
+            model.source_groups().get(server_group),
+        )
+    else:
+        inputs[digests.rel(source_groups_path)] = digests.file(source_groups_path)
+
+    for table_cfg in cast(list[dict[str, Any]], config.get("cdc_tables", [])):
+        table_name = str(table_cfg.get("table", ""))
+        schema_name = str(table_cfg.get("schema", "dbo"))
+        inputs[f"table:{service_name}.{schema_name}.{table_name}"] = digests.table(service_name, schema_name, table_name)
+        for sink_key, sink_table_key, sink_table_cfg in sink_tables_for_source(service_cfg, table_name):
+            if sink_table_cfg.get("target_exists") and "." in sink_key and "." in sink_table_key:
+                target_schema, target_table = sink_table_key.split(".", 1)
+                target_path = model.schemas_dir / sink_key.split(".", 1)[1] / target_schema / f"{target_table}.yaml"
+                inputs[digests.rel(target_path)] = digests.file(target_path)
+
+    template_path = root / "pipelines" / "templates" / source_template_name(service_cfg)
+    inputs[digests.rel(template_path)] = digests.file(template_path)
+    inputs.update(digests.schema_root_files("column-templates.yaml"))
+    inputs.update(digests.schema_root_files("transform-rules.yaml"))
+    return inputs
+
+
+def sink_output_inputs(
+    digests: InputDigests,
+    customers: list[str],
+    sink_routing: str = "static",
+    sink_write: str = "insert",
+    sink_shards: int = 1,
+) -> dict[str, str]:
+    """Inputs a consolidated environment sink pipeline is rendered from."""
+    root = digests.project_root
+    model = get_project_model(root)
+    inputs: dict[str, str] = {
+        "customers": _digest_value(sorted(customers)),
+        "sink_routing": sink_routing,
+        "sink_write": sink_write,
+        "sink_shards": str(sink_shards),
+        "services/*.yaml": _digest_value([
+            (name, digests.file(model.services_dir / f"{name}.yaml"))
+            for name in model.service_names()
+        ]),
+    }
+    for schema_root in get_schema_roots(root):
+        inputs[f"{digests.rel(schema_root)}/**"] = digests.tree(schema_root)
+    for name in ("source-groups.yaml", "sink-groups.yaml"):
+        inputs[name] = digests.file(root / name)
+    template_path = root / "pipelines" / "templates" / "sink-pipeline.yaml"
+    inputs[digests.rel(template_path)] = digests.file(template_path)
+    return inputs
+
+
+class GenerationManifest:
+    """Output -> input-hash records stored in ``.manifest.json``."""
+
+    def __init__(self, generated_dir: Path, outputs: dict[str, dict[str, Any]] | None = None) -> None:
+        self.generated_dir = generated_dir
+        self.outputs: dict[str, dict[str, Any]] = outputs if outputs is not None else {}
+
+    @property
+    def path(self) -> Path:
+        return self.generated_dir / MANIFEST_FILENAME
+
+    @classmethod
+    def load(cls, generated_dir: Path) -> GenerationManifest:
+        """Load the manifest; unreadable or outdated manifests load empty."""
+        manifest_path = generated_dir / MANIFEST_FILENAME
+        try:
+            raw = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cls(generated_dir)
+        if (
+            not isinstance(raw, dict)
+            or raw.get("version") != MANIFEST_VERSION
+            or raw.get("generator") != __version__
+            or not isinstance(raw.get("outputs"), dict)
+        ):
+            return cls(generated_dir)
+        return cls(generated_dir, cast(dict[str, dict[str, Any]], raw["outputs"]))
+
+    def key(self, output_path: Path) -> str:
+        return output_path.relative_to(self.generated_dir).as_posix()
+
+    def is_current(self, output_path: Path, inputs: dict[str, str]) -> bool:
+        """True when ``output_path`` exists and was built from ``inputs``."""
+        entry = self.outputs.get(self.key(output_path))
+        return entry is not None and entry.get("inputs") == inputs and output_path.is_file()
+
+    def record(self, output_path: Path, inputs: dict[str, str]) -> None:
+        self.outputs[self.key(output_path)] = {"inputs": inputs}
+
+    def discard(self, output_path: Path) -> None:
+        self.outputs.pop(self.key(output_path), None)
+
+    def save(self) -> None:
+        """Write the manifest atomically."""
+        self.generated_dir.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "version": MANIFEST_VERSION,
+            "generator": __version__,
+            "outputs": dict(sorted(self.outputs.items())),
+        }
+        tmp_path = self.path.with_name(f"{MANIFEST_FILENAME}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        tmp_path.replace(self.path)
@@ -0,0 +1,121 @@
+"""Customer -> shard assignment for sharded consolidated sinks.
+
+``cdc manage-pipelines generate --sink-shards N`` splits an environment's
+consolidated sink into N files (``sink-pipeline-shard-<k>.yaml``), each with
+its own consumer group and topic list, so sink instances scale horizontally.
+
+Customers are placed with rendezvous hashing: each customer goes to the shard
+with the highest ``hash(customer, shard)`` score, so adding customers never
+moves existing ones and changing N only moves customers whose shard was
+removed or who now score highest on a newly added shard.
+
+The assignment is written to ``pipelines/generated/sinks/<env>/.shards.json``.
+Assignments recorded there are kept while their shard still exists, so a
+tenant moved by hand (e.g. to isolate a hot customer) stays where it was put.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, cast
+
+SHARD_MANIFEST_FILENAME = ".shards.json"
+SHARD_MANIFEST_VERSION = 1
+SINK_PIPELINE_FILENAME = "sink-pipeline.yaml"
+
+
+def sink_shard_filename(shard: int) -> str:
+    return f"sink-pipeline-shard-{shard}.yaml"
+
+
+def sink_consumer_group(env_name: str, shard: int | None = None) -> str:
+    """Kafka consumer group of an environment sink (or one of its shards)."""
+    if shard is None:
+        return f"{env_name}-sink-group"
+    return f"{env_name}-sink-group-shard-{shard}"
+
+
+def _shard_score(customer: str, shard: int) -> int:
+    digest = hashlib.blake2b(f"{customer}\0{shard}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+def rendezvous_shard(customer: str, shards: int) -> int:
+    """Highest-scoring shard of ``customer`` among ``shards`` shards."""
+    return max(range(shards), key=lambda shard: _shard_score(customer, shard))
+
+
+def load_shard_manifest(sink_dir: Path) -> tuple[int, dict[str, int]]:
+    """(shard count, customer -> shard) from ``.shards.json`` (``(0, {})`` when absent)."""
+    try:
+        raw = json.loads((sink_dir / SHARD_MANIFEST_FILENAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return 0, {}
+    if not isinstance(raw, dict) or raw.get("version") != SHARD_MANIFEST_VERSION:
+        return 0, {}
+    manifest = cast(dict[str, Any], raw)
+    shards = manifest.get("shards")
+    assignments = manifest.get("assignments")
+    if not isinstance(shards, int) or not isinstance(assignments, dict):
+        return 0, {}
+    return shards, {
+        str(customer): shard
+        for customer, shard in cast(dict[str, object], assignments).items()
+        if isinstance(shard, int)
+    }
+
+
+def assign_sink_shards(
+    customers: list[str],
+    shards: int,
+    previous_shards: int = 0,
+    previous: dict[str, int] | None = None,
+) -> dict[str, int]:
+    """Assign ``customers`` to ``shards`` shards, moving as few as possible.
+
+    A previously assigned customer keeps its shard unless that shard no
+    longer exists or the customer now hashes to a shard added since the
+    previous assignment.
+    """
+    previous = previous or {}
+    assignments: dict[str, int] = {}
+    for customer in sorted(customers):
+        hashed = rendezvous_shard(customer, shards)
+        kept = previous.get(customer)
+        if kept is not None and 0 <= kept < shards and hashed < previous_shards:
+            assignments[customer] = kept
+        else:
+            assignments[customer] = hashed
+    return assignments
+
+
+def write_shard_manifest(sink_dir: Path, shards: int, assignments: dict[str, int]) -> None:
+    """Write ``.shards.json`` atomically."""
+    sink_dir.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "version": SHARD_MANIFEST_VERSION,
+        "shards": shards,
+        "assignments": dict(sorted(assignments.items())),
+    }
+    path = sink_dir / SHARD_MANIFEST_FILENAME
+    tmp_path = path.with_name(f"{SHARD_MANIFEST_FILENAME}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    tmp_path.replace(path)
+
+
+def sink_output_filenames(sink_dir: Path, shards: int = 1) -> list[str] | None:
+    """Sink files expected in ``sink_dir`` for ``shards`` shards.
+
+    Sharded sinks are only written for shards with customers, so the
+    expected files come from the shard manifest; None when the manifest is
+    missing or was written for a different shard count.
+    """
+    if shards <= 1:
+        return [SINK_PIPELINE_FILENAME]
+    recorded_shards, assignments = load_shard_manifest(sink_dir)
+    if recorded_shards != shards:
+        return None
+    return [sink_shard_filename(shard) for shard in sorted(set(assignments.values()))]
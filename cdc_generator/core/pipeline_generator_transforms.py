@@ -201,15 +201,11 @@ def build_runtime_processor_case(
     )
 
 
-def build_runtime_processors_block(processor_cases: list[str]) -> str:
-    if not processor_cases:
-        return ""
+RUNTIME_PROCESSORS_BLOCK_PREFIX = "- switch:\n        cases:\n"
 
-    indented_cases = "\n".join(
-        "          " + processor_case.replace("\n", "\n          ")
-        for processor_case in processor_cases
-    )
-    return "- switch:\n        cases:\n" + indented_cases
+
+def indent_runtime_processor_case(processor_case: str) -> str:
+    return "          " + processor_case.replace("\n", "\n          ")
 
 
 def build_source_transform_processors(
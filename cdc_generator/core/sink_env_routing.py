@@ -9,7 +9,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any, cast
 
-from cdc_generator.helpers.yaml_loader import load_yaml_file
+from cdc_generator.helpers.service_config import get_project_model
 
 _ENV_ALIASES: dict[str, list[str]] = {
     "default": ["dev", "nonprod", "stage", "test"],
@@ -80,7 +80,7 @@ def get_sink_target_env_keys(
     if not sink_groups_path.exists():
         return None, "sink-groups.yaml is missing"
 
-    sink_groups_data = cast(dict[str, Any], load_yaml_file(sink_groups_path))
+    sink_groups_data = get_project_model(project_root).sink_groups()
     sink_group_raw = sink_groups_data.get(sink_group_name)
     if not isinstance(sink_group_raw, dict):
         return None, f"Sink group '{sink_group_name}' not found in sink-groups.yaml"
@@ -109,7 +109,7 @@ def get_all_sink_target_env_keys(project_root: Path) -> tuple[set[str] | None, s
     if not sink_groups_path.exists():
         return None, "sink-groups.yaml is missing"
 
-    sink_groups_data = cast(dict[str, Any], load_yaml_file(sink_groups_path))
+    sink_groups_data = get_project_model(project_root).sink_groups()
     env_keys: set[str] = set()
 
     for sink_group_raw in sink_groups_data.values():
@@ -40,7 +40,7 @@ from pathlib import Path
 from typing import Any, cast
 
 from cdc_generator.helpers.type_mapper import TypeMapper
-from cdc_generator.helpers.yaml_loader import load_yaml_file
+from cdc_generator.helpers.yaml_loader import load_yaml_fast
 
 
 @dataclass
@@ -148,7 +148,7 @@ def load_source_schema(
     if not schema_file.exists():
         return None
 
-    raw = load_yaml_file(schema_file)
+    raw = load_yaml_fast(schema_file)
     return cast(dict[str, Any], raw) if raw else None
 
 
@@ -255,7 +255,7 @@ def load_custom_table_reference(
     if not ref_file.exists():
         return None
 
-    raw = load_yaml_file(ref_file)
+    raw = load_yaml_fast(ref_file)
     if not raw:
         return None
 
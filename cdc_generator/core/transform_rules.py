@@ -35,7 +35,7 @@ from cdc_generator.helpers.service_schema_paths import (
     get_schema_roots,
     get_schema_write_root,
 )
-from cdc_generator.helpers.yaml_loader import load_yaml_file
+from cdc_generator.helpers.yaml_loader import load_yaml_fast
 
 # ---------------------------------------------------------------------------
 # File reference resolution
@@ -391,7 +391,7 @@ def _load_all_rules(path: Path) -> dict[str, TransformRule]:
         Dict of rule key → TransformRule.
     """
     try:
-        raw_data = load_yaml_file(path)
+        raw_data = load_yaml_fast(path)
     except FileNotFoundError:
         print_error(f"Transform rules file not found: {path}")
         return {}
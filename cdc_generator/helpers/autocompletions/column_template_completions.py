@@ -11,7 +11,7 @@ from cdc_generator.core.column_template_operations import (
 )
 from cdc_generator.core.column_templates import get_templates, list_template_keys
 from cdc_generator.helpers.service_schema_paths import get_service_schema_read_dirs
-from cdc_generator.helpers.yaml_loader import load_yaml_file
+from cdc_generator.helpers.yaml_loader import load_yaml_cached
 
 from .sinks import load_sink_tables_for_autocomplete
 
@@ -61,7 +61,7 @@ def _load_target_column_types(
             continue
 
         try:
-            schema_data = load_yaml_file(schema_file)
+            schema_data = load_yaml_cached(schema_file)
             columns_raw = schema_data.get("columns", [])
             if not isinstance(columns_raw, list):
                 return {}
@@ -4,7 +4,7 @@ from typing import Any, cast
 
 from cdc_generator.helpers.autocompletions.utils import find_file_upward
 from cdc_generator.helpers.service_schema_paths import get_service_schema_read_dirs
-from cdc_generator.helpers.yaml_loader import load_yaml_file
+from cdc_generator.helpers.yaml_loader import load_yaml_cached
 
 
 def _schemas_from_schema_dirs(service_name: str) -> set[str]:
@@ -58,7 +58,7 @@ def list_schemas_for_service(service_name: str) -> list[str]:
     discovered: set[str] = set()
 
     try:
-        data = load_yaml_file(server_group_file)
+        data = load_yaml_cached(server_group_file)
         if data:
             # Find first server group (should only be one)
             for server_group_data in data.values():
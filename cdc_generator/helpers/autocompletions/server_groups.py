@@ -3,7 +3,7 @@
 from typing import Any, cast
 
 from cdc_generator.helpers.autocompletions.utils import find_file_upward
-from cdc_generator.helpers.yaml_loader import load_yaml_file
+from cdc_generator.helpers.yaml_loader import load_yaml_cached
 
 
 def list_servers_from_server_group() -> list[str]:
@@ -30,7 +30,7 @@ def list_servers_from_server_group() -> list[str]:
         return []
 
     try:
-        config = load_yaml_file(server_group_file)
+        config = load_yaml_cached(server_group_file)
         if not config or not isinstance(config, dict):
             return []
 
@@ -67,7 +67,7 @@ def list_server_group_names() -> list[str]:
         return []
 
     try:
-        config = load_yaml_file(server_group_file)
+        config = load_yaml_cached(server_group_file)
         if not config or not isinstance(config, dict):
             return []
 
@@ -90,7 +90,7 @@ def list_source_names_from_server_group() -> list[str]:
         return []
 
     try:
-        config = load_yaml_file(server_group_file)
+        config = load_yaml_cached(server_group_file)
         if not config or not isinstance(config, dict):
             return []
 
@@ -122,7 +122,7 @@ def list_source_envs_from_server_group(source_name: str) -> list[str]:
         return []
 
     try:
-        config = load_yaml_file(server_group_file)
+        config = load_yaml_cached(server_group_file)
         if not config or not isinstance(config, dict):
             return []
 
@@ -160,7 +160,7 @@ def list_sink_target_envs_from_sink_groups() -> list[str]:
         return []
 
     try:
-        config = load_yaml_file(sink_file)
+        config = load_yaml_cached(sink_file)
         if not config or not isinstance(config, dict):
             return []
 
@@ -208,7 +208,7 @@ def list_sink_group_names() -> list[str]:
         return []
 
     try:
-        config = load_yaml_file(sink_file)
+        config = load_yaml_cached(sink_file)
         if not config or not isinstance(config, dict):
             return []
 
@@ -243,7 +243,7 @@ def list_non_inherited_sink_group_names() -> list[str]:
         return []
 
     try:
-        config = load_yaml_file(sink_file)
+        config = load_yaml_cached(sink_file)
         if not config or not isinstance(config, dict):
             return []
 
@@ -280,7 +280,7 @@ def list_servers_for_sink_group(sink_group_name: str) -> list[str]:
         return []
 
     try:
-        config = load_yaml_file(sink_file)
+        config = load_yaml_cached(sink_file)
         if not config or not isinstance(config, dict):
             return []
 
@@ -325,7 +325,7 @@ def list_databases_from_server_group() -> list[str]:
         return []
 
     try:
-        config = load_yaml_file(server_group_file)
+        config = load_yaml_cached(server_group_file)
         if not config or not isinstance(config, dict):
             return []
 
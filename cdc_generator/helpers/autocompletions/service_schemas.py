@@ -8,7 +8,7 @@ references.
 from cdc_generator.helpers.autocompletions.utils import (
     find_service_schemas_dir_upward,
 )
-from cdc_generator.helpers.yaml_loader import load_yaml_file
+from cdc_generator.helpers.yaml_loader import load_yaml_cached
 
 
 def list_schema_services() -> list[str]:
@@ -93,7 +93,7 @@ def list_custom_table_columns_for_mapping(
         return []
 
     try:
-        data = load_yaml_file(custom_file)
+        data = load_yaml_cached(custom_file)
         if not data:
             return []
 
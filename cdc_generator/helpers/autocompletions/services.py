@@ -6,7 +6,7 @@ from cdc_generator.helpers.autocompletions.utils import (
     find_directory_upward,
     find_file_upward,
 )
-from cdc_generator.helpers.yaml_loader import load_yaml_file
+from cdc_generator.helpers.yaml_loader import load_yaml_cached
 
 
 def list_existing_services() -> list[str]:
@@ -63,7 +63,7 @@ def list_available_services_from_server_group() -> list[str]:
         return []
 
     try:
-        config = load_yaml_file(server_group_file)
+        config = load_yaml_cached(server_group_file)
         if not config:
             return []
 
@@ -135,7 +135,7 @@ def list_available_validation_databases(
         return []
 
     try:
-        config = load_yaml_file(server_group_file)
+        config = load_yaml_cached(server_group_file)
         if not isinstance(config, dict):
             return []
 
@@ -9,7 +9,7 @@ from cdc_generator.helpers.autocompletions.utils import (
 )
 from cdc_generator.helpers.helpers_logging import print_warning
 from cdc_generator.helpers.service_schema_paths import get_service_schema_read_dirs
-from cdc_generator.helpers.yaml_loader import load_yaml_file
+from cdc_generator.helpers.yaml_loader import load_yaml_cached
 
 try:
     import yaml
@@ -63,7 +63,7 @@ def list_sink_keys_for_service(service_name: str) -> list[str]:
         return []
 
     try:
-        data = load_yaml_file(service_file)
+        data = load_yaml_cached(service_file)
         if not data or not data:
             return []
 
@@ -148,7 +148,7 @@ def list_available_sink_keys() -> list[str]:
         return []
 
     try:
-        config = load_yaml_file(sink_file)
+        config = load_yaml_cached(sink_file)
         if not config or not config:
             return []
 
@@ -309,7 +309,7 @@ def list_target_columns_for_sink_table(
             continue
 
         try:
-            table_schema = load_yaml_file(table_file)
+            table_schema = load_yaml_cached(table_file)
 
             columns = table_schema.get("columns", [])
             return (
@@ -479,7 +479,7 @@ def list_custom_table_columns_for_autocomplete(
         schema_file = service_dir / schema_name / f"{table_name}.yaml"
         if not schema_file.exists():
             continue
-        data = load_yaml_file(schema_file)
+        data = load_yaml_cached(schema_file)
         cols_raw = data.get("columns")
         if not isinstance(cols_raw, list):
             continue
@@ -542,7 +542,7 @@ def list_source_columns_for_sink_table(
             continue
 
         try:
-            table_schema = load_yaml_file(table_file)
+            table_schema = load_yaml_cached(table_file)
 
             columns = table_schema.get("columns", [])
             return (
@@ -573,7 +573,7 @@ def _load_column_type_map(service_name: str, table_key: str) -> dict[str, str]:
             continue
 
         try:
-            table_schema = load_yaml_file(table_file)
+            table_schema = load_yaml_cached(table_file)
             columns = table_schema.get("columns", [])
             if not isinstance(columns, list):
                 return {}
@@ -5,7 +5,7 @@ from cdc_generator.helpers.autocompletions.utils import (
     find_service_schemas_dir_upward,
 )
 from cdc_generator.helpers.service_config import get_project_root
-from cdc_generator.helpers.yaml_loader import load_yaml_file
+from cdc_generator.helpers.yaml_loader import load_yaml_cached
 
 
 def list_tables_for_service(service_name: str) -> list[str]:
@@ -62,7 +62,7 @@ def list_tables_for_service_autocomplete(service_name: str) -> list[str]:
 
     if definitions_file.is_file():
         try:
-            data = load_yaml_file(definitions_file)
+            data = load_yaml_cached(definitions_file)
             if isinstance(data, dict):
                 tables: list[str] = []
                 for schema_raw, table_names_raw in data.items():
@@ -118,7 +118,7 @@ def list_columns_for_table(service_name: str, schema: str, table: str) -> list[s
         return []
 
     try:
-        table_schema = load_yaml_file(table_file)
+        table_schema = load_yaml_cached(table_file)
         if not table_schema:
             return []
 
@@ -166,7 +166,7 @@ def list_source_tables_for_service(service_name: str) -> list[str]:
         return []
 
     try:
-        data = load_yaml_file(service_file)
+        data = load_yaml_cached(service_file)
         if not data:
             return []
 
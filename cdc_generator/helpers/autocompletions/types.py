@@ -3,7 +3,7 @@
 from typing import Any, cast
 
 from cdc_generator.helpers.service_config import get_project_root
-from cdc_generator.helpers.yaml_loader import load_yaml_file
+from cdc_generator.helpers.yaml_loader import load_yaml_cached
 
 _FALLBACK_PG_TYPES = (
     "bigint",
@@ -45,7 +45,7 @@ def _load_types_from_definitions() -> list[str]:
         return []
 
     try:
-        data = load_yaml_file(definitions_file)
+        data = load_yaml_cached(definitions_file)
         if not isinstance(data, dict):
             return []
 
@@ -87,7 +87,7 @@ def _load_types_from_mapping_file() -> list[str]:
         return []
 
     try:
-        data = load_yaml_file(mapping_file)
+        data = load_yaml_cached(mapping_file)
         if not isinstance(data, dict):
             return []
 
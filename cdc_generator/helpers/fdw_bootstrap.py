@@ -13,9 +13,9 @@ from cdc_generator.helpers.fdw_identifiers import (
     build_base_foreign_table_name,
     build_foreign_table_name,
 )
-from cdc_generator.helpers.service_config import get_project_root, load_service_config
+from cdc_generator.helpers.primary_key_resolver import get_primary_key_resolver
+from cdc_generator.helpers.service_config import get_project_model, get_project_root
 from cdc_generator.helpers.type_mapper import TypeMapper
-from cdc_generator.helpers.yaml_loader import load_yaml_file
 
 _CDC_SCHEMA_NAME = "cdc"
 _DEFAULT_TDS_VERSION = "7.4"
@@ -53,6 +53,7 @@ class FdwTablePlan:
     target_table_name: str
     columns: tuple[tuple[str, str], ...]
     base_columns: tuple[tuple[str, str], ...]
+    primary_key_columns: tuple[str, ...] = ()
 
 
 @dataclass(frozen=True)
@@ -115,7 +116,7 @@ def build_fdw_bootstrap_plan(
     """
     effective_request = request or FdwBootstrapRequest()
     project_root = get_project_root()
-    service_config = load_service_config(service_name)
+    service_config = get_project_model(project_root).service_config(service_name)
     server_group_name = _resolve_server_group_name(service_config, service_name)
     source_group = _load_source_group(project_root, server_group_name)
     _validate_source_group(source_group, server_group_name)
@@ -155,6 +156,13 @@ def build_fdw_bootstrap_plan(
     if not source_plans:
         raise ValueError("No valid source instances matched the requested filters")
 
+    warnings.extend(
+        f"{table_plan.source_schema_name}.{table_plan.source_table_name}: "
+        + "no primary key in services/_schemas (native merges need one)"
+        for table_plan in table_plans
+        if not table_plan.primary_key_columns
+    )
+
     _assign_environment_profile_names(source_plans)
 
     return FdwBootstrapPlan(
@@ -206,7 +214,8 @@ def render_fdw_plan_summary(plan: FdwBootstrapPlan) -> list[str]:
             + f"{table_plan.target_schema_name}.{table_plan.target_table_name} | "
             + f"foreign {table_plan.foreign_table_name} | "
             + f"base {table_plan.base_foreign_table_name} | "
-            + f"columns {len(table_plan.columns)}"
+            + f"columns {len(table_plan.columns)} | "
+            + f"pk {', '.join(table_plan.primary_key_columns) or '-'}"
         )
 
     return lines
@@ -281,7 +290,7 @@ def _load_source_group(project_root: Path, server_group_name: str) -> dict[str,
     if not source_groups_path.exists():
         raise FileNotFoundError(f"source-groups.yaml not found at {source_groups_path}")
 
-    source_groups = load_yaml_file(source_groups_path)
+    source_groups = get_project_model(project_root).source_groups()
     source_group_raw = source_groups.get(server_group_name)
     if not isinstance(source_group_raw, dict):
         raise ValueError(f"Source group '{server_group_name}' not found in source-groups.yaml")
@@ -420,13 +429,16 @@ def _build_table_plans(
             table_name_counts[table_name] = table_name_counts.get(table_name, 0) + 1
 
     mapper = TypeMapper("mssql", "pgsql")
+    pk_resolver = get_primary_key_resolver(project_root)
     table_plans: list[FdwTablePlan] = []
 
     for tracked_table in tracked_tables:
         schema_name = str(tracked_table.get("schema", "")).strip()
         table_name = str(tracked_table.get("table", "")).strip()
-        schema_path = project_root / "services" / "_schemas" / service_name / schema_name / f"{table_name}.yaml"
-        schema_data = load_yaml_file(schema_path)
+        schema_data = get_project_model(project_root).table_definition(service_name, schema_name, table_name)
+        if schema_data is None:
+            schema_path = project_root / "services" / "_schemas" / service_name / schema_name / f"{table_name}.yaml"
+            raise FileNotFoundError(f"YAML file not found: {schema_path}")
         base_columns = _load_fdw_columns(
             schema_data,
             mapper,
@@ -459,6 +471,7 @@ def _build_table_plans(
                 target_table_name=table_name,
                 columns=(*_FDW_META_COLUMNS, *base_columns),
                 base_columns=base_columns,
+                primary_key_columns=tuple(pk_resolver.resolve(service_name, schema_name, table_name) or ()),
             )
         )
 
@@ -7,6 +7,8 @@ that efficiently handle CDC operations (INSERT, UPDATE, DELETE) using:
 - sql_insert with ON CONFLICT for INSERT/UPDATE operations
 """
 
+from dataclasses import dataclass
+
 
 def bloblang_field(field_name: str) -> str:
     """Format a field name for use in Bloblang expressions.
@@ -257,92 +259,221 @@ def build_batch_upsert_case(table_name: str, schema: str, postgres_url: str,
     )
 
 
-def build_staging_case(
+# Every sql output opens its own connection pool, so each one is capped;
+# deployments size them with SINK_CONN_MAX_OPEN / SINK_CONN_MAX_IDLE.
+SINK_CONN_MAX_OPEN_DEFAULT = 4
+SINK_CONN_MAX_IDLE_DEFAULT = 2
+
+# Batch policies per sink write mode; a table's ``batching`` config wins.
+SINK_WRITE_MODES = ("insert", "bulk")
+_DEFAULT_BATCH_COUNT = {"insert": "${SINK_BATCH_COUNT:-100}", "bulk": "${SINK_BULK_BATCH_COUNT:-5000}"}
+_DEFAULT_BATCH_PERIOD = {"insert": "${SINK_BATCH_PERIOD:-5s}", "bulk": "${SINK_BULK_BATCH_PERIOD:-1s}"}
+
+_STAGING_METADATA_COLUMNS = (
+    '__sync_timestamp',
+    '__source',
+    '__source_db',
+    '__source_table',
+    '__source_ts_ms',
+    '__cdc_operation',
+    '__kafka_offset',
+    '__kafka_partition',
+    '__kafka_timestamp',
+)
+
+
+@dataclass(frozen=True)
+class StagingRoute:
+    """Shape of one staging-table insert: target, columns and argument mapping.
+
+    Routes are hashable; customers whose routes are equal share a table
+    shape and can be served by one dynamic output. ``batch_count`` and
+    ``batch_period`` are per-table overrides (None = the write mode default).
+    """
+
+    table_name: str
+    stg_table: str
+    postgres_url: str
+    columns: tuple[str, ...]
+    args: tuple[str, ...]
+    batch_count: str | None = None
+    batch_period: str | None = None
+
+    def batching(self, sink_write: str = "insert") -> tuple[str, str]:
+        """Batch (count, period) for this route under ``sink_write``."""
+        return (
+            self.batch_count or _DEFAULT_BATCH_COUNT[sink_write],
+            self.batch_period or _DEFAULT_BATCH_PERIOD[sink_write],
+        )
+
+
+def build_staging_route(  # noqa: PLR0913
     table_name: str,
-    schema: str,
     postgres_url: str,
     postgres_fields: list[str],
     mssql_fields: list[str],
     extra_columns: list[str] | None = None,
     extra_args: list[str] | None = None,
     target_table_name: str | None = None,
-) -> str:
-    """
-    Generate staging table INSERT case using sql_insert with batching.
-
-    Writes all records (INSERT, UPDATE, DELETE) to staging table for later
-    merge processing by stored procedure.
+    *,
+    batching: dict[str, object] | None = None,
+) -> StagingRoute:
+    """Collect the staging columns and args_mapping expressions for a table.
 
-    Args:
-        table_name: Source table name (e.g., "Actor")
-        schema: Target PostgreSQL schema (e.g., "avansas")
-        postgres_url: PostgreSQL connection URL placeholder
-        postgres_fields: List of PostgreSQL column names
-        mssql_fields: List of MSSQL field names
-
-    Returns:
-        YAML configuration string for staging table INSERT case
+    ``batching`` is the sink table's optional ``{count, period}`` override.
     """
     target_name = target_table_name if target_table_name else table_name
-    table_normalized = normalize_table_name(target_name)
-    stg_table = f"stg_{table_normalized}"
-
     computed_columns = extra_columns if extra_columns is not None else []
     computed_args = extra_args if extra_args is not None else []
 
-    # Build columns list (business fields + all metadata fields including kafka tracking)
-    all_columns = list(postgres_fields) + list(computed_columns) + [
-        '__sync_timestamp',
-        '__source',
-        '__source_db',
-        '__source_table',
-        '__source_ts_ms',
-        '__cdc_operation',
-        '__kafka_offset',
-        '__kafka_partition',
-        '__kafka_timestamp'
-    ]
-
-    # Build args_mapping (map MSSQL fields to PostgreSQL + add metadata)
-    args_list: list[str] = []
-    for mssql_field in mssql_fields:
-        args_list.append(bloblang_field(mssql_field))
-
-    # Add computed/runtime values
-    args_list.extend(computed_args)
-
-    # Add metadata values
-    args_list.extend([
-        'this.__sync_timestamp',
-        'this.__source',
-        'this.__source_db',
-        'this.__source_table',
-        'this.__source_ts_ms',
-        'this.__cdc_operation',
-        'this.__kafka_offset',
-        'this.__kafka_partition',
-        'this.__kafka_timestamp'
-    ])
+    # Business fields + computed values + all metadata fields including kafka tracking
+    columns = (*postgres_fields, *computed_columns, *_STAGING_METADATA_COLUMNS)
+    args = (
+        *(bloblang_field(mssql_field) for mssql_field in mssql_fields),
+        *computed_args,
+        *(f'this.{column}' for column in _STAGING_METADATA_COLUMNS),
+    )
+    batch_cfg = batching or {}
+    batch_count = batch_cfg.get("count")
+    batch_period = batch_cfg.get("period")
+    return StagingRoute(
+        table_name=table_name,
+        stg_table=f"stg_{normalize_table_name(target_name)}",
+        postgres_url=postgres_url,
+        columns=columns,
+        args=args,
+        batch_count=str(batch_count) if batch_count is not None else None,
+        batch_period=str(batch_period) if batch_period is not None else None,
+    )
 
-    # Build columns YAML (indented list with SQL quotes for PostgreSQL case sensitivity)
-    columns_yaml = "\n".join([f'        - \'"{col}"\'' for col in all_columns])
 
-    # Build args_mapping YAML
-    args_yaml = ", ".join(args_list)
+def render_staging_case(schema: str, route: StagingRoute) -> str:
+    """Render a ``switch`` case inserting one schema's rows of ``route``."""
+    # Columns YAML (indented list with SQL quotes for PostgreSQL case sensitivity)
+    columns_yaml = "\n".join([f'        - \'"{col}"\'' for col in route.columns])
+    args_yaml = ", ".join(route.args)
+    batch_count, batch_period = route.batching()
 
     # Check BOTH schema and table for consolidated routing
-    return f"""# Staging INSERT for {schema}.{table_name}
-- check: 'this.__routing_schema == "{schema}" && this.__routing_table == "{table_name}"'
+    return f"""# Staging INSERT for {schema}.{route.table_name}
+- check: 'this.__routing_schema == "{schema}" && this.__routing_table == "{route.table_name}"'
   output:
     sql_insert:
       driver: postgres
-      dsn: "{postgres_url}"
-      table: '{schema}."{stg_table}"'
+      dsn: "{route.postgres_url}"
+      table: '{schema}."{route.stg_table}"'
       columns:
 {columns_yaml}
       args_mapping: |
         root = [ {args_yaml} ]
+      conn_max_open: ${{SINK_CONN_MAX_OPEN:-{SINK_CONN_MAX_OPEN_DEFAULT}}}
+      conn_max_idle: ${{SINK_CONN_MAX_IDLE:-{SINK_CONN_MAX_IDLE_DEFAULT}}}
       batching:
-                count: ${{SINK_BATCH_COUNT:-100}}
-                period: ${{SINK_BATCH_PERIOD:-5s}}
+                count: {batch_count}
+                period: {batch_period}
 """
+
+
+def render_dynamic_staging_case(schemas: list[str], route: StagingRoute) -> str:
+    """Render one ``switch`` case serving ``route`` for every schema in ``schemas``.
+
+    The case matches on the table and a constant-time lookup of the routing
+    schema in an object literal, and the target schema is interpolated into
+    the INSERT at runtime. Only schemas listed here can be interpolated, so
+    the dynamic query cannot be pointed at arbitrary schemas.
+    """
+    schema_map = ", ".join(f'"{schema}": true' for schema in schemas)
+    column_list = ", ".join(f'"{col}"' for col in route.columns)
+    placeholders = ", ".join(f"${index}" for index in range(1, len(route.columns) + 1))
+    args_yaml = ", ".join(route.args)
+    batch_count, batch_period = route.batching()
+
+    return f"""# Staging INSERT for {route.table_name} ({len(schemas)} schema(s))
+- check: 'this.__routing_table == "{route.table_name}" && {{{schema_map}}}.exists(this.__routing_schema)'
+  output:
+    sql_raw:
+      driver: postgres
+      dsn: "{route.postgres_url}"
+      unsafe_dynamic_query: true
+      query: 'INSERT INTO ${{! this.__routing_schema }}."{route.stg_table}" ({column_list}) VALUES ({placeholders})'
+      args_mapping: |
+        root = [ {args_yaml} ]
+      conn_max_open: ${{SINK_CONN_MAX_OPEN:-{SINK_CONN_MAX_OPEN_DEFAULT}}}
+      conn_max_idle: ${{SINK_CONN_MAX_IDLE:-{SINK_CONN_MAX_IDLE_DEFAULT}}}
+      batching:
+                count: {batch_count}
+                period: {batch_period}
+"""
+
+
+def render_bulk_staging_case(schema: str, route: StagingRoute) -> str:
+    """Render a ``switch`` case that bulk-loads one schema's rows of ``route``.
+
+    Each flushed batch is archived into a single JSON array and loaded with
+    one set-based ``INSERT ... SELECT FROM json_populate_recordset(...)``,
+    typed by the staging table's row type, instead of a multi-row INSERT
+    with one bind parameter per value.
+    """
+    column_list = ", ".join(f'"{col}"' for col in route.columns)
+    row_fields = ", ".join(f'"{col}": {arg}' for col, arg in zip(route.columns, route.args, strict=True))
+    target = f'{schema}."{route.stg_table}"'
+    batch_count, batch_period = route.batching("bulk")
+
+    return f"""# Staging bulk load for {schema}.{route.table_name}
+- check: 'this.__routing_schema == "{schema}" && this.__routing_table == "{route.table_name}"'
+  output:
+    sql_raw:
+      driver: postgres
+      dsn: "{route.postgres_url}"
+      query: 'INSERT INTO {target} ({column_list}) SELECT {column_list} FROM json_populate_recordset(NULL::{target}, $1::json)'
+      args_mapping: |
+        root = [ this.map_each({{ {row_fields} }}).format_json() ]
+      conn_max_open: ${{SINK_CONN_MAX_OPEN:-{SINK_CONN_MAX_OPEN_DEFAULT}}}
+      conn_max_idle: ${{SINK_CONN_MAX_IDLE:-{SINK_CONN_MAX_IDLE_DEFAULT}}}
+      batching:
+                count: {batch_count}
+                period: {batch_period}
+                processors:
+                  - archive:
+                      format: json_array
+"""
+
+
+def build_staging_case(
+    table_name: str,
+    schema: str,
+    postgres_url: str,
+    postgres_fields: list[str],
+    mssql_fields: list[str],
+    extra_columns: list[str] | None = None,
+    extra_args: list[str] | None = None,
+    target_table_name: str | None = None,
+) -> str:
+    """
+    Generate staging table INSERT case using sql_insert with batching.
+
+    Writes all records (INSERT, UPDATE, DELETE) to staging table for later
+    merge processing by stored procedure.
+
+    Args:
+        table_name: Source table name (e.g., "Actor")
+        schema: Target PostgreSQL schema (e.g., "avansas")
+        postgres_url: PostgreSQL connection URL placeholder
+        postgres_fields: List of PostgreSQL column names
+        mssql_fields: List of MSSQL field names
+
+    Returns:
+        YAML configuration string for staging table INSERT case
+    """
+    return render_staging_case(
+        schema,
+        build_staging_route(
+            table_name=table_name,
+            postgres_url=postgres_url,
+            postgres_fields=postgres_fields,
+            mssql_fields=mssql_fields,
+            extra_columns=extra_columns,
+            extra_args=extra_args,
+            target_table_name=target_table_name,
+        ),
+    )
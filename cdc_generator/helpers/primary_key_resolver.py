@@ -0,0 +1,85 @@
+"""Shared primary-key resolution for ``services/_schemas`` table definitions.
+
+Pipeline generation resolves the key of every tracked table once per
+customer, and the FDW planner and migration generator need the same keys.
+``PrimaryKeyResolver`` resolves each ``(service, schema, table)`` once per
+run and hands out the cached result afterwards.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, cast
+
+from cdc_generator.helpers.service_config import ProjectModel, get_project_model
+
+TableKey = tuple[str, str, str]
+
+
+def primary_key_from_table_def(table_def: Mapping[str, object]) -> list[str]:
+    """Primary key columns of a table definition (empty when it has none).
+
+    A top-level ``primary_key`` (string or list) wins; otherwise columns
+    marked ``primary_key: true`` are used in column order.
+    """
+    top_level_pk = table_def.get("primary_key")
+    if isinstance(top_level_pk, str) and top_level_pk:
+        return [top_level_pk]
+    if isinstance(top_level_pk, list):
+        pk_list = [str(pk) for pk in cast(list[object], top_level_pk) if str(pk)]
+        if pk_list:
+            return pk_list
+
+    columns = table_def.get("columns", [])
+    pk_columns: list[str] = []
+    if isinstance(columns, list):
+        col: object
+        for col in cast(list[object], columns):
+            if not isinstance(col, dict):
+                continue
+            col_dict = cast(dict[str, Any], col)
+            if col_dict.get("primary_key") is True:
+                col_name = col_dict.get("name")
+                if isinstance(col_name, str) and col_name:
+                    pk_columns.append(col_name)
+    return pk_columns
+
+
+class PrimaryKeyResolver:
+    """Per-run ``(service, schema, table)`` -> primary key cache.
+
+    Entries remember the parsed definition they were resolved from. The
+    project model re-parses a file only when it changes, so a cached key is
+    reused as long as the model still returns the same definition object.
+    """
+
+    def __init__(self, model: ProjectModel) -> None:
+        self.model = model
+        self._keys: dict[TableKey, tuple[object, list[str]]] = {}
+
+    def resolve(self, service_name: str, schema_name: str, table_name: str) -> list[str] | None:
+        """Primary key columns, or None when the table definition is missing."""
+        table_def = self.model.table_definition(service_name, schema_name, table_name)
+        if table_def is None:
+            return None
+        key = (service_name, schema_name, table_name)
+        cached = self._keys.get(key)
+        if cached is not None and cached[0] is table_def:
+            return cached[1]
+        primary_key = primary_key_from_table_def(table_def)
+        self._keys[key] = (table_def, primary_key)
+        return primary_key
+
+
+_RESOLVERS: dict[Path, PrimaryKeyResolver] = {}
+
+
+def get_primary_key_resolver(project_root: Path | None = None) -> PrimaryKeyResolver:
+    """Return the shared resolver for a project root (default: current)."""
+    model = get_project_model(project_root)
+    resolver = _RESOLVERS.get(model.root)
+    if resolver is None or resolver.model is not model:
+        resolver = PrimaryKeyResolver(model)
+        _RESOLVERS[model.root] = resolver
+    return resolver
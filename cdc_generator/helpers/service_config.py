@@ -2,12 +2,17 @@
 """
 Shared module for loading service and customer configurations.
 Supports both new service-based format (services/) and legacy format (2-customers/).
+
+Read-only consumers (pipeline/migration generators, FDW planner, validators)
+should go through ``get_project_model()``, which parses each YAML file at most
+once per process. ``load_service_config()`` keeps returning a fresh,
+comment-preserving copy for edit-and-save flows.
 """
 
 from pathlib import Path
 from typing import Any, cast
 
-from cdc_generator.helpers.yaml_loader import yaml
+from cdc_generator.helpers.yaml_loader import CACHE_DIR_NAME, load_yaml_cached, yaml
 
 
 def get_project_root() -> Path:
@@ -36,6 +41,149 @@ def get_project_root() -> Path:
     return current
 
 
+_FileStamp = tuple[int, int]
+
+
+def _file_stamp(path: Path) -> _FileStamp | None:
+    """Return (mtime_ns, size) for a file, or None when it does not exist."""
+    try:
+        stat_result = path.stat()
+    except OSError:
+        return None
+    return stat_result.st_mtime_ns, stat_result.st_size
+
+
+class ProjectModel:
+    """Parse-once, read-only view of an implementation's YAML configuration.
+
+    Covers ``source-groups.yaml``, ``sink-groups.yaml``, ``services/*.yaml``
+    and ``services/_schemas/**``. Each file is parsed on first access and
+    cached by path; the cached value is reused until the file's mtime or size
+    changes, so writes made earlier in the same process are picked up.
+    Parses go through ``load_yaml_cached()``, so they also survive across
+    CLI runs via ``<root>/.cdc-cache/``.
+
+    Returned values are shared between callers and must not be mutated.
+    Use ``load_service_config()`` when the config is going to be edited and
+    saved back.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self._files: dict[Path, tuple[_FileStamp, object]] = {}
+        self._service_configs: dict[str, tuple[tuple[_FileStamp, _FileStamp | None], dict[str, object]]] = {}
+
+    @property
+    def services_dir(self) -> Path:
+        return self.root / "services"
+
+    @property
+    def schemas_dir(self) -> Path:
+        return self.services_dir / "_schemas"
+
+    def clear(self) -> None:
+        """Drop all cached files (mainly for tests)."""
+        self._files.clear()
+        self._service_configs.clear()
+
+    def load(self, path: Path) -> object | None:
+        """Return parsed YAML for ``path`` (None when the file is missing)."""
+        stamp = _file_stamp(path)
+        if stamp is None:
+            self._files.pop(path, None)
+            return None
+
+        cached = self._files.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        data: object = load_yaml_cached(path, self.root / CACHE_DIR_NAME)
+        self._files[path] = (stamp, data)
+        return data
+
+    def _load_mapping(self, path: Path) -> dict[str, Any]:
+        raw = self.load(path)
+        if isinstance(raw, dict):
+            return cast(dict[str, Any], raw)
+        return {}
+
+    def source_groups(self) -> dict[str, Any]:
+        """Parsed ``source-groups.yaml`` (empty when missing)."""
+        return self._load_mapping(self.root / "source-groups.yaml")
+
+    def sink_groups(self) -> dict[str, Any]:
+        """Parsed ``sink-groups.yaml`` (empty when missing)."""
+        return self._load_mapping(self.root / "sink-groups.yaml")
+
+    def service_names(self) -> list[str]:
+        """Sorted service names from ``services/*.yaml``."""
+        if not self.services_dir.is_dir():
+            return []
+        return sorted(path.stem for path in self.services_dir.glob("*.yaml"))
+
+    def service_config(self, service_name: str) -> dict[str, object]:
+        """Normalized service config, equivalent to ``load_service_config()``.
+
+        Raises:
+            FileNotFoundError: If services/<service_name>.yaml does not exist.
+            ValueError: If the file is not a mapping.
+        """
+        service_path = self.services_dir / f"{service_name}.yaml"
+        service_stamp = _file_stamp(service_path)
+        if service_stamp is None:
+            raise FileNotFoundError(f"Service config not found: {service_path}")
+
+        key = (service_stamp, _file_stamp(self.root / "source-groups.yaml"))
+        cached = self._service_configs.get(service_name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        config = _build_service_config(
+            self.load(service_path),
+            service_name,
+            service_path,
+            self.source_groups(),
+        )
+        self._service_configs[service_name] = (key, config)
+        return config
+
+    def table_definition_files(self) -> list[Path]:
+        """Sorted table definition files under ``services/_schemas/``."""
+        if not self.schemas_dir.is_dir():
+            return []
+        return sorted(
+            path
+            for path in self.schemas_dir.rglob("*.yaml")
+            if not {"_definitions", "_bloblang", "adapters"} & set(path.parts)
+        )
+
+    def table_definition(
+        self,
+        service_name: str,
+        schema_name: str,
+        table_name: str,
+    ) -> dict[str, Any] | None:
+        """Raw ``services/_schemas/<service>/<schema>/<Table>.yaml`` content."""
+        path = self.schemas_dir / service_name / schema_name / f"{table_name}.yaml"
+        raw = self.load(path)
+        if isinstance(raw, dict):
+            return cast(dict[str, Any], raw)
+        return None
+
+
+_PROJECT_MODELS: dict[Path, ProjectModel] = {}
+
+
+def get_project_model(project_root: Path | None = None) -> ProjectModel:
+    """Return the shared ProjectModel for a project root (default: current)."""
+    root = project_root if project_root is not None else get_project_root()
+    model = _PROJECT_MODELS.get(root)
+    if model is None:
+        model = ProjectModel(root)
+        _PROJECT_MODELS[root] = model
+    return model
+
+
 def load_service_config(service_name: str) -> dict[str, object]:
     """Load service configuration from services/, preserving comments.
 
@@ -52,6 +200,16 @@ def load_service_config(service_name: str) -> dict[str, object]:
     with service_path.open() as f:
         raw_config = yaml.load(f)
 
+    return _build_service_config(raw_config, service_name, service_path)
+
+
+def _build_service_config(
+    raw_config: object,
+    service_name: str,
+    service_path: Path,
+    source_groups: dict[str, Any] | None = None,
+) -> dict[str, object]:
+    """Turn a parsed services/<name>.yaml document into a normalized config."""
     # Check if new format (service name as root key)
     if isinstance(raw_config, dict) and service_name in raw_config:
         # New format: extract service config and add 'service' field for backward compatibility
@@ -60,15 +218,21 @@ def load_service_config(service_name: str) -> dict[str, object]:
         if isinstance(service_config, dict):
             config = cast(dict[str, object], dict(cast(dict[str, Any], service_config)))
             config['service'] = service_name
-            return _normalize_loaded_service_config(config)
+            return _normalize_loaded_service_config(config, source_groups)
 
     # Legacy format: already has 'service' field
     if isinstance(raw_config, dict):
-        return _normalize_loaded_service_config(cast(dict[str, object], dict(cast(dict[str, Any], raw_config))))
+        return _normalize_loaded_service_config(
+            cast(dict[str, object], dict(cast(dict[str, Any], raw_config))),
+            source_groups,
+        )
     raise ValueError(f"Invalid service config format in {service_path}: expected mapping")
 
 
-def _normalize_loaded_service_config(config: dict[str, object]) -> dict[str, object]:
+def _normalize_loaded_service_config(
+    config: dict[str, object],
+    source_groups: dict[str, Any] | None = None,
+) -> dict[str, object]:
     """Normalize service config for runtime usage.
 
     For db-per-tenant services, customers are derived from source-groups sources
@@ -83,8 +247,7 @@ def _normalize_loaded_service_config(config: dict[str, object]) -> dict[str, obj
 
     config['server_group'] = server_group_name
 
-    source_groups = _load_source_groups_file()
-    source_groups_dict = cast(dict[str, Any], source_groups)
+    source_groups_dict = source_groups if source_groups is not None else _load_source_groups_file()
     server_group_raw = source_groups_dict.get(server_group_name)
     if not isinstance(server_group_raw, dict):
         return config
@@ -105,7 +268,7 @@ def _normalize_legacy_source_tables(config: dict[str, object]) -> None:
     Input shape supported:
       source:
         tables:
-          dbo.Actor: {primary_key: actno, ignore_columns: [...]}
+          dbo.Actor: {primary_key: actno, ignore_columns: [...], polling: hot}
           dbo.Address: {}
     """
     shared_raw = config.get('shared')
@@ -148,6 +311,10 @@ def _normalize_legacy_source_tables(config: dict[str, object]) -> None:
         if include_columns is not None:
             normalized_table['include_columns'] = include_columns
 
+        polling = table_cfg.get('polling')
+        if polling is not None:
+            normalized_table['polling'] = polling
+
         grouped.setdefault(schema_name, []).append(normalized_table)
 
     source_tables = [
@@ -161,18 +328,9 @@ def _normalize_legacy_source_tables(config: dict[str, object]) -> None:
     }
 
 
-def _load_source_groups_file() -> dict[str, object]:
-    """Load source-groups.yaml as a dictionary."""
-    source_groups_path = get_project_root() / "source-groups.yaml"
-    if not source_groups_path.exists():
-        return {}
-
-    with source_groups_path.open() as source_groups_file:
-        raw = yaml.load(source_groups_file)
-
-    if isinstance(raw, dict):
-        return dict(raw)
-    return {}
+def _load_source_groups_file() -> dict[str, Any]:
+    """Load source-groups.yaml as a dictionary (shared, read-only)."""
+    return get_project_model().source_groups()
 
 
 def _resolve_server_group_pattern(server_group: dict[str, Any]) -> str:
@@ -342,6 +500,10 @@ def _flatten_shared_source_tables(shared_cfg: dict[str, Any]) -> list[dict[str,
             elif include_cols:
                 table_config['include_columns'] = include_cols
 
+            polling = table_dict.get('polling')
+            if polling is not None:
+                table_config['polling'] = polling
+
             source_tables_flat.append(table_config)
 
     return source_tables_flat
@@ -374,15 +536,11 @@ def _resolve_default_service_name() -> str | None:
     Returns the only available service file stem, or the first sorted stem when
     multiple service files exist.
     """
-    services_dir = get_project_root() / "services"
-    if not services_dir.is_dir():
-        return None
-
-    service_files = sorted(services_dir.glob("*.yaml"))
-    if not service_files:
+    service_names = get_project_model().service_names()
+    if not service_names:
         return None
 
-    return service_files[0].stem
+    return service_names[0]
 
 
 def _derive_customer_environments_from_source_groups(
@@ -398,17 +556,7 @@ def _derive_customer_environments_from_source_groups(
     if not server_group_name:
         return {}
 
-    source_groups_path = get_project_root() / "source-groups.yaml"
-    if not source_groups_path.exists():
-        return {}
-
-    with source_groups_path.open() as source_groups_file:
-        source_groups = yaml.load(source_groups_file)
-
-    if not isinstance(source_groups, dict):
-        return {}
-
-    source_groups_dict = cast(dict[str, Any], source_groups)
+    source_groups_dict = _load_source_groups_file()
     server_group = source_groups_dict.get(server_group_name)
     if not isinstance(server_group, dict):
         return {}
@@ -501,7 +649,7 @@ def load_customer_config(customer: str, service_name: str | None = None) -> dict
     fallback_exc: Exception | None = None
     if resolved_service:
         try:
-            service_config = load_service_config(resolved_service)
+            service_config = get_project_model().service_config(resolved_service)
             return merge_customer_config(service_config, customer)
         except (FileNotFoundError, ValueError) as exc:
             fallback_exc = exc
@@ -532,7 +680,7 @@ def get_all_customers(service_name: str | None = None) -> list[str]:
     try:
         if not resolved_service:
             raise FileNotFoundError("No service config discovered")
-        service_config = load_service_config(resolved_service)
+        service_config = get_project_model().service_config(resolved_service)
         customers = service_config.get('customers', [])
         if not isinstance(customers, list):
             return []
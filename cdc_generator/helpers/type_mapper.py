@@ -31,7 +31,7 @@ Bidirectional usage (reverse direction):
 from pathlib import Path
 from typing import Any, cast
 
-from cdc_generator.helpers.yaml_loader import load_yaml_file
+from cdc_generator.helpers.yaml_loader import load_yaml_fast
 
 # Adapters directory within the package
 _ADAPTERS_DIR = Path(__file__).parent.parent / "service-schemas" / "adapters"
@@ -104,7 +104,7 @@ class TypeMapper:
             file_path: Path to the mapping YAML file.
             reverse: If True, swap keys and values for reverse direction.
         """
-        raw = load_yaml_file(file_path)
+        raw = load_yaml_fast(file_path)
         data = cast(dict[str, Any], raw)
 
         raw_mappings = data.get("mappings", {})
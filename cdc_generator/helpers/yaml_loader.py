@@ -2,11 +2,23 @@
 """
 Type-safe YAML loader with runtime validation.
 Provides validated ruamel.yaml instance with proper type hints.
+
+Read-only callers should use ``load_yaml_fast()`` (plain data via libyaml)
+or ``load_yaml_cached()``, which additionally keeps a marshal copy of each
+parsed file under ``<project>/.cdc-cache/yaml/`` so repeated CLI runs and
+shell completions skip parsing for files that have not changed.
 """
 
+import contextlib
+import hashlib
+import marshal
+import os
+import re
 from pathlib import Path
 from typing import TYPE_CHECKING, Protocol, TextIO, Union, cast
 
+import yaml as pyyaml
+
 if TYPE_CHECKING:
     from cdc_generator.helpers.ruamel_yaml_stub import YAMLInterface
 else:
@@ -100,6 +112,183 @@ def load_yaml_file(file_path: Path) -> ConfigDict:
         return cast(ConfigDict, raw)
 
 
+CACHE_DIR_NAME = ".cdc-cache"
+# Bump whenever parsing changes (loader class, resolvers) so stale entries are reparsed.
+_CACHE_FORMAT = 2
+# (format, resolved path, size, mtime_ns, content digest, data)
+_CACHE_ENTRY_FIELDS = 6
+
+
+def _cache_root(cache_dir: Path | None) -> Path | None:
+    """Directory holding parsed-YAML cache entries (None when disabled).
+
+    ``CDC_YAML_CACHE=0`` disables the cache; ``CDC_CACHE_DIR`` overrides
+    the default ``<project root>/.cdc-cache`` location.
+    """
+    if os.environ.get("CDC_YAML_CACHE", "1").lower() in ("0", "false", "no", "off"):
+        return None
+    override = os.environ.get("CDC_CACHE_DIR")
+    if override:
+        return Path(override) / "yaml"
+    if cache_dir is not None:
+        return cache_dir / "yaml"
+
+    # Imported lazily: service_config imports this module.
+    from cdc_generator.helpers.service_config import get_project_root
+
+    return get_project_root() / CACHE_DIR_NAME / "yaml"
+
+
+class _FastLoader(getattr(pyyaml, "CSafeLoader", pyyaml.SafeLoader)):  # type: ignore[misc]
+    """Safe loader (libyaml when available) with YAML 1.2 core scalars.
+
+    PyYAML resolves scalars per YAML 1.1 (``yes``/``no``/``on``/``off`` are
+    booleans, ``012`` is octal). The round-trip ruamel instance follows
+    YAML 1.2, so the implicit resolvers are swapped to keep both loaders
+    returning the same values for the same file.
+    """
+
+
+_YAML11_SCALAR_TAGS = frozenset({
+    "tag:yaml.org,2002:bool",
+    "tag:yaml.org,2002:int",
+    "tag:yaml.org,2002:float",
+})
+
+_FastLoader.yaml_implicit_resolvers = {
+    first: [(tag, regexp) for tag, regexp in resolvers if tag not in _YAML11_SCALAR_TAGS]
+    for first, resolvers in pyyaml.SafeLoader.yaml_implicit_resolvers.items()
+}
+_FastLoader.add_implicit_resolver(
+    "tag:yaml.org,2002:bool",
+    re.compile(r"^(?:true|True|TRUE|false|False|FALSE)$"),
+    list("tTfF"),
+)
+_FastLoader.add_implicit_resolver(
+    "tag:yaml.org,2002:int",
+    re.compile(r"^(?:[-+]?[0-9][0-9_]*|0o[0-7_]+|0x[0-9a-fA-F_]+|0b[01_]+)$"),
+    list("-+0123456789"),
+)
+_FastLoader.add_implicit_resolver(
+    "tag:yaml.org,2002:float",
+    re.compile(
+        r"^(?:[-+]?(?:\.[0-9]+|[0-9]+(?:\.[0-9]*)?)(?:[eE][-+]?[0-9]+)?"
+        r"|[-+]?\.(?:inf|Inf|INF)|\.(?:nan|NaN|NAN))$"
+    ),
+    list("-+0123456789."),
+)
+
+
+def _construct_yaml12_int(loader: pyyaml.SafeLoader, node: pyyaml.ScalarNode) -> int:
+    text = str(loader.construct_scalar(node)).replace("_", "")
+    if text[:2] in ("0o", "0x", "0b"):
+        return int(text, 0)
+    return int(text)
+
+
+_FastLoader.add_constructor("tag:yaml.org,2002:int", _construct_yaml12_int)
+
+
+def load_yaml_fast(file_path: Path) -> ConfigDict:
+    """Load a YAML file as plain data for read-only use.
+
+    Uses PyYAML's libyaml-backed ``CSafeLoader`` (pure-Python ``SafeLoader``
+    when libyaml is not compiled in). Comments and quoting are dropped, so
+    the result must not be passed to ``save_yaml_file()``; use
+    ``load_yaml_file()`` for edit-and-save flows.
+
+    Args:
+        file_path: Path to YAML file to load
+
+    Returns:
+        Configuration dictionary loaded from YAML
+
+    Raises:
+        FileNotFoundError: If file does not exist
+    """
+    try:
+        content = file_path.read_bytes()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"YAML file not found: {file_path}") from None
+    return cast(ConfigDict, pyyaml.load(content, Loader=_FastLoader))
+
+
+def _read_cache_entry(entry_path: Path) -> tuple[object, ...] | None:
+    try:
+        entry = marshal.loads(entry_path.read_bytes())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(entry, tuple) or len(entry) != _CACHE_ENTRY_FIELDS or entry[0] != _CACHE_FORMAT:
+        return None
+    return cast(tuple[object, ...], entry)
+
+
+def _write_cache_entry(entry_path: Path, entry: tuple[object, ...]) -> None:
+    try:
+        payload = marshal.dumps(entry)
+    except ValueError:
+        return
+    tmp_path = entry_path.with_name(f"{entry_path.name}.{os.getpid()}.tmp")
+    try:
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(payload)
+        tmp_path.replace(entry_path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            tmp_path.unlink()
+
+
+def load_yaml_cached(file_path: Path, cache_dir: Path | None = None) -> ConfigDict:
+    """Load a YAML file as plain data, using the on-disk parse cache.
+
+    Entries are keyed by the file's resolved path and validated against its
+    size and mtime; when those differ the content hash decides whether the
+    cached data can still be reused. Misses are parsed with
+    ``load_yaml_fast()``'s loader.
+
+    The returned structure is made of plain ``dict``/``list``/scalars with no
+    comment or quote information, so it must not be passed to
+    ``save_yaml_file()``. Use ``load_yaml_file()`` for edit-and-save flows.
+
+    Args:
+        file_path: Path to YAML file to load
+        cache_dir: Cache directory (default: ``<project root>/.cdc-cache``)
+
+    Returns:
+        Configuration dictionary loaded from YAML (or cache)
+
+    Raises:
+        FileNotFoundError: If file does not exist
+    """
+    try:
+        stat = file_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"YAML file not found: {file_path}") from None
+
+    cache_root = _cache_root(cache_dir)
+    if cache_root is None:
+        return load_yaml_fast(file_path)
+
+    resolved = str(file_path.resolve())
+    entry_path = cache_root / f"{hashlib.sha256(resolved.encode()).hexdigest()[:32]}.bin"
+    entry = _read_cache_entry(entry_path)
+    if entry is not None and entry[1] == resolved and entry[2] == stat.st_size and entry[3] == stat.st_mtime_ns:
+        return cast(ConfigDict, entry[5])
+
+    content = file_path.read_bytes()
+    digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+    if entry is not None and entry[1] == resolved and entry[4] == digest:
+        data = cast(ConfigValue, entry[5])
+    else:
+        data = cast(ConfigValue, pyyaml.load(content, Loader=_FastLoader))
+
+    _write_cache_entry(
+        entry_path,
+        (_CACHE_FORMAT, resolved, stat.st_size, stat.st_mtime_ns, digest, data),
+    )
+    return cast(ConfigDict, data)
+
+
 def save_yaml_file(data: ConfigDict, file_path: Path) -> None:
     """Save data to YAML file with comment preservation.
 
@@ -139,6 +139,7 @@ def get_sink_pipeline_template() -> str:
         Complete sink pipeline template as string for Kafka to PostgreSQL.
         Uses placeholders for customer-specific values:
         - {{ENV}}: Environment (nonprod, prod)
+        - {{SINK_CONSUMER_GROUP}}: Kafka consumer group (one per sink shard)
         - {{SINK_TOPICS}}: List of Kafka topics to consume
         - {{TABLE_CASES}}: Switch cases for table routing
     """
@@ -151,7 +152,7 @@ def get_sink_pipeline_template() -> str:
 # Architecture:
 #   - 1 Sink container handles ALL customers for an environment
 #   - Routes by schema (customer) extracted from Kafka topic
-#   - Single port, single consumer group per environment
+#   - Single port, single consumer group per environment (per shard with --sink-shards)
 #
 # Pattern:
 #   1. Consume from all customer topics for environment
@@ -168,7 +169,7 @@ input:
       - "${KAFKA_BOOTSTRAP_SERVERS}"
     topics:
       {{SINK_TOPICS}}
-    consumer_group: "{{ENV}}-sink-group"
+    consumer_group: "{{SINK_CONSUMER_GROUP}}"
     start_from_oldest: true
 
 pipeline:
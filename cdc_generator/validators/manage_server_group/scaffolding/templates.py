@@ -913,6 +913,7 @@ __pycache__/
 *.pyc
 .pytest_cache/
 .lsn_cache/
+.cdc-cache/
 pipelines/generated/*
 !pipelines/generated/**/.gitkeep
 generated/schemas/*
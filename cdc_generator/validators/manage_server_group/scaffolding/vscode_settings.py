@@ -53,7 +53,8 @@ def create_vscode_settings() -> dict[str, object]:
             "**/__pycache__": True,
             "**/.pytest_cache": True,
             "**/*.pyc": True,
-            ".lsn_cache": True
+            ".lsn_cache": True,
+            ".cdc-cache": True
         },
         "files.readonlyInclude": {
             "source-groups.yaml": True,
@@ -82,6 +83,7 @@ def get_gitignore_patterns() -> list[str]:
         "*.pyc",
         ".pytest_cache/",
         ".lsn_cache/",
+        ".cdc-cache/",
         "pipelines/generated/*",
         "!pipelines/generated/**/.gitkeep",
         "generated/schemas/*",
@@ -5,8 +5,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any, TypedDict, cast
 
-from cdc_generator.helpers.service_config import get_project_root
-from cdc_generator.helpers.yaml_loader import load_yaml_file
+from cdc_generator.helpers.service_config import get_project_model, get_project_root
 
 
 class ValidationConfig(TypedDict, total=False):
@@ -37,7 +36,7 @@ def load_source_group_context(
             "source_group_cfg": None,
         }
 
-    source_groups = cast(dict[str, Any], load_yaml_file(source_groups_path))
+    source_groups = get_project_model().source_groups()
     server_group_raw = config.get("server_group") or config.get("service") or service
     server_group_name = str(server_group_raw).strip()
     if not server_group_name:
@@ -65,7 +64,7 @@ def load_sink_group_config(sink_group_name: str) -> dict[str, Any] | None:
     if not sink_groups_path.exists():
         return None
 
-    sink_groups = cast(dict[str, Any], load_yaml_file(sink_groups_path))
+    sink_groups = get_project_model().sink_groups()
     sink_group_raw = sink_groups.get(sink_group_name)
     if not isinstance(sink_group_raw, dict):
         return None
@@ -8,7 +8,7 @@ from typing import Any, cast
 from cdc_generator.core.column_template_operations import ResolvedColumnTemplate, resolve_column_templates
 from cdc_generator.core.sink_env_routing import get_sink_target_env_keys
 from cdc_generator.core.source_ref_resolver import parse_source_ref, resolve_source_ref
-from cdc_generator.helpers.yaml_loader import load_yaml_file
+from cdc_generator.helpers.service_config import get_project_model
 
 from .types import (
     ValidationConfig,
@@ -183,7 +183,7 @@ def collect_unique_template_issues(
         return errors
 
     source_entries = cast(dict[str, Any], sources_raw)
-    source_groups = cast(dict[str, Any], load_yaml_file(project_root() / "source-groups.yaml"))
+    source_groups = get_project_model(project_root()).source_groups()
 
     collisions: dict[tuple[str, str, str, str], set[str]] = {}
     missing_unique_values: list[str] = []
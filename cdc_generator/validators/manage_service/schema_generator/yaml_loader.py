@@ -5,7 +5,7 @@ from typing import Any, cast
 from cdc_generator.helpers.helpers_logging import print_error
 from cdc_generator.helpers.service_config import get_project_root
 from cdc_generator.helpers.service_schema_paths import get_service_schema_read_dirs
-from cdc_generator.helpers.yaml_loader import load_yaml_file
+from cdc_generator.helpers.yaml_loader import load_yaml_fast
 
 
 def load_schemas_from_yaml(service: str, schema_filter: str | None = None) -> dict[str, Any]:
@@ -43,7 +43,7 @@ def load_schemas_from_yaml(service: str, schema_filter: str | None = None) -> di
             # Load all table YAML files in this schema
             for table_file in schema_dir.glob('*.yaml'):
                 try:
-                    loaded = load_yaml_file(table_file)
+                    loaded = load_yaml_fast(table_file)
                     table_data = loaded
 
                     table_name = table_data.get('table')
@@ -91,7 +91,7 @@ def load_server_groups_config() -> dict[str, Any]:
     server_groups_file = project_root / 'source-groups.yaml'
     if not server_groups_file.exists():
         return {}
-    return load_yaml_file(server_groups_file)
+    return load_yaml_fast(server_groups_file)
 
 
 def extract_database_names_by_group(server_groups_data: dict[str, Any]) -> dict[str, set[str]]:
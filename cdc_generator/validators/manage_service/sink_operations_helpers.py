@@ -24,9 +24,9 @@ def _validate_sink_group_exists(sink_group: str) -> bool:
     if not sink_file.exists():
         return False
     try:
-        from cdc_generator.helpers.yaml_loader import load_yaml_file
+        from cdc_generator.helpers.yaml_loader import load_yaml_fast
 
-        sink_groups = load_yaml_file(sink_file)
+        sink_groups = load_yaml_fast(sink_file)
         return sink_group in sink_groups
     except (FileNotFoundError, ValueError):
         return False
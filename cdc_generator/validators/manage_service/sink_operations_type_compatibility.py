@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from functools import lru_cache
 from typing import Any, cast
 
-from cdc_generator.helpers.yaml_loader import load_yaml_file
+from cdc_generator.helpers.yaml_loader import load_yaml_fast
 from cdc_generator.validators.manage_service.sink_operations_type_utils import (
     _extract_aliases,
     _extract_compatibility,
@@ -123,7 +123,7 @@ def _resolve_source_type_overrides_path(project_root_key: str) -> str | None:
         return None
 
     try:
-        source_groups = load_yaml_file(source_groups_file)
+        source_groups = load_yaml_fast(source_groups_file)
     except Exception as exc:
         raise ValueError(
             "Failed to read source groups for source type overrides: "
@@ -166,7 +166,7 @@ def _load_source_type_overrides(project_root_key: str) -> dict[str, dict[str, st
     override_file = Path(resolved_path)
 
     try:
-        data = load_yaml_file(override_file)
+        data = load_yaml_fast(override_file)
     except Exception as exc:
         raise ValueError(
             "Failed to read source type overrides: "
@@ -300,7 +300,7 @@ def _load_type_compatibility_map(
     mapping_file = Path(resolved_map_path)
 
     try:
-        data_raw = cast(object, load_yaml_file(mapping_file))
+        data_raw = cast(object, load_yaml_fast(mapping_file))
     except Exception as exc:
         raise ValueError(
             "Failed to read type compatibility map: "
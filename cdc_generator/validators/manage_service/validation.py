@@ -9,8 +9,7 @@ from cdc_generator.helpers.helpers_logging import (
     print_success,
     print_warning,
 )
-from cdc_generator.helpers.service_config import load_service_config
-from cdc_generator.helpers.yaml_loader import load_yaml_file
+from cdc_generator.helpers.service_config import get_project_model
 from cdc_generator.validators.manage_service.preflight import (
     ValidationConfig,
     collect_sink_routing_issues,
@@ -28,7 +27,7 @@ def _resolve_server_group_pattern(service: str) -> str | None:
         return None
 
     try:
-        source_groups = load_yaml_file(source_groups_path)
+        source_groups = get_project_model(PROJECT_ROOT.parent).load(source_groups_path)
     except Exception:
         return None
 
@@ -215,7 +214,7 @@ def validate_service_sink_preflight(
     config: dict[str, object] | None = None,
 ) -> tuple[list[str], list[str]]:
     """Validate sink routing and unique template constraints for a service."""
-    cfg = load_service_config(service) if config is None else config
+    cfg = get_project_model().service_config(service) if config is None else config
     typed_cfg: ValidationConfig = dict(cfg)
     routing_errors, routing_warnings = collect_sink_routing_issues(service, typed_cfg)
     unique_errors = collect_unique_template_issues(service, typed_cfg)
@@ -234,7 +233,7 @@ def validate_service_config(service: str) -> bool:
     Returns:
         True if validation passes, False otherwise
     """
-    config = load_service_config(service)
+    config = get_project_model().service_config(service)
 
     errors = []
     warnings = []
@@ -127,3 +127,17 @@ def project_dir(tmp_path: Path) -> Iterator[Path]:
         patch_service_schemas=True,
         patch_server_groups=True,
     )
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _isolated_yaml_cache(tmp_path_factory: pytest.TempPathFactory) -> Iterator[None]:
+    """Keep the parsed-YAML cache out of the working tree during tests."""
+    previous = os.environ.get("CDC_CACHE_DIR")
+    os.environ["CDC_CACHE_DIR"] = str(tmp_path_factory.mktemp("cdc-cache"))
+    try:
+        yield
+    finally:
+        if previous is None:
+            os.environ.pop("CDC_CACHE_DIR", None)
+        else:
+            os.environ["CDC_CACHE_DIR"] = previous
@@ -14,6 +14,7 @@ Covers:
 
 from __future__ import annotations
 
+import re
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
@@ -775,6 +776,117 @@ class TestGenerateMigrations:
         assert (sink_dir / "00-infrastructure" / "01-create-schemas.sql").exists()
         assert (sink_dir / "00-infrastructure" / "02-cdc-management.sql").exists()
         assert (sink_dir / "01-tables" / "Actor.sql").exists()
+        mgmt_sql = (sink_dir / "00-infrastructure" / "02-cdc-management.sql").read_text(encoding="utf-8")
+        assert 'PROCEDURE "cdc_management"."run_pending_merges"' in mgmt_sql
+        assert "FOR UPDATE SKIP LOCKED" in mgmt_sql
+        assert 'CREATE TABLE IF NOT EXISTS "cdc_management"."merge_settings"' in mgmt_sql
+        assert 'FROM "cdc_management"."merge_settings" ms' in mgmt_sql
+        assert "merge_orchestrator" not in mgmt_sql
+
+    def _generate_management_sql(self, tmp_path: Path) -> str:
+        """Generate the brokered fixture and return 02-cdc-management.sql."""
+        self._setup_project(tmp_path)
+        service_config = {
+            "service": "test_svc",
+            "source": {"tables": {"dbo.Actor": {"primary_key": "actno"}}},
+            "sinks": {"sink_test.db": {"tables": {"myschema.Actor": {"from": "dbo.Actor"}}}},
+        }
+        from cdc_generator.core.migration_generator import generate_migrations
+
+        with (
+            patch("cdc_generator.core.migration_generator.get_project_root", return_value=tmp_path),
+            patch("cdc_generator.core.migration_generator.load_service_config", return_value=service_config),
+            patch(
+                "cdc_generator.core.migration_generator.get_service_schema_read_dirs",
+                return_value=[tmp_path / "services" / "_schemas" / "test_svc"],
+            ),
+        ):
+            result = generate_migrations("test_svc", output_dir=tmp_path / "migrations")
+
+        assert result.errors == []
+        return (tmp_path / "migrations" / "sink_test.db" / "00-infrastructure" / "02-cdc-management.sql").read_text(
+            encoding="utf-8",
+        )
+
+    def test_parallel_merge_takes_over_only_dead_claims(self, tmp_path: Path) -> None:
+        """A claim is taken over only when its table merge lock is free, never by age."""
+        mgmt_sql = self._generate_management_sql(tmp_path)
+        start = mgmt_sql.index('CREATE OR REPLACE PROCEDURE "cdc_management"."run_pending_merges"(')
+        proc_sql = mgmt_sql[start:mgmt_sql.index("$$;", start)]
+        table_lock = "hashtext(v_schema || '.' || v_table)"
+
+        assert "p_stale_after_seconds" not in proc_sql
+        assert "merge_started_at\" >=" not in proc_sql
+        assert 'DROP PROCEDURE IF EXISTS "cdc_management"."run_pending_merges"(INT, INT);' in mgmt_sql
+        # Abandoned claims are reset only after their merge lock is acquired
+        reset = proc_sql.index('WHERE mc."is_merging" = TRUE\n            FOR UPDATE SKIP LOCKED')
+        reset_block = proc_sql[reset:proc_sql.index("END LOOP;", reset)]
+        assert reset_block.index("IF pg_try_advisory_lock(") < reset_block.index('"is_merging"       = FALSE')
+        # The lock is taken before the claim commits and released after the result commits
+        lock = proc_sql.index("IF pg_try_advisory_lock(", reset + len(reset_block))
+        claim = proc_sql.index('SET "is_merging"       = TRUE')
+        merge = proc_sql.index("EXECUTE format('CALL %I.sp_merge_%s()'")
+        last_commit = proc_sql.rindex("COMMIT;")
+        assert lock < claim < proc_sql.index("COMMIT;", claim) < merge < last_commit
+        assert proc_sql.index(f"PERFORM pg_advisory_unlock({table_lock});") > last_commit
+
+    def test_serial_and_parallel_merges_share_the_table_merge_lock(self, tmp_path: Path) -> None:
+        """trigger_pending_merges() skips tables a worker holds and locks the ones it merges."""
+        mgmt_sql = self._generate_management_sql(tmp_path)
+        start = mgmt_sql.index('CREATE OR REPLACE FUNCTION "cdc_management"."trigger_pending_merges"(')
+        trigger_sql = mgmt_sql[start:mgmt_sql.index("$$;", start)]
+        start = mgmt_sql.index('CREATE OR REPLACE PROCEDURE "cdc_management"."run_pending_merges"(')
+        proc_sql = mgmt_sql[start:mgmt_sql.index("$$;", start)]
+        key = re.compile(r"pg_try_advisory(?:_xact)?_lock\((hashtext\([^;]*?\))\)")
+
+        trigger_keys = {match.replace("v_rec.", "") for match in key.findall(trigger_sql)}
+        worker_keys = {match.replace("v_rec.", "") for match in key.findall(proc_sql)}
+        assert trigger_keys == worker_keys == {"hashtext(\"schema_name\" || '.' || \"table_name\")"}
+        # The lock gates the mark and the merge; it is held until the caller's transaction ends
+        gate = trigger_sql.index("CONTINUE WHEN NOT pg_try_advisory_xact_lock(")
+        assert gate < trigger_sql.index('SET "is_merging" = TRUE') < trigger_sql.index("EXECUTE format('CALL %s()', v_proc);")
+        assert "pg_advisory_unlock" not in trigger_sql
+        # Its uncommitted marks are invisible to the worker cap, so it does not pretend to claim
+        assert "merge_started_at" not in trigger_sql
+        assert "merge_claim" not in trigger_sql
+
+    @patch("cdc_generator.core.migration_generator.get_project_root")
+    @patch("cdc_generator.core.migration_generator.load_service_config")
+    @patch("cdc_generator.core.migration_generator.get_service_schema_read_dirs")
+    def test_staging_merge_claims_rows_once(
+        self,
+        mock_schema_dirs: MagicMock,
+        mock_load_config: MagicMock,
+        mock_root: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """Merge claims staging with DELETE ... RETURNING and upserts seq ranges."""
+        self._setup_project(tmp_path)
+        mock_root.return_value = tmp_path
+        mock_load_config.return_value = {
+            "service": "test_svc",
+            "source": {"tables": {"dbo.Actor": {"primary_key": "actno"}}},
+            "sinks": {
+                "sink_test.db": {
+                    "tables": {"myschema.Actor": {"from": "dbo.Actor"}},
+                },
+            },
+        }
+        mock_schema_dirs.return_value = [
+            tmp_path / "services" / "_schemas" / "test_svc",
+        ]
+
+        from cdc_generator.core.migration_generator import generate_migrations
+
+        output = tmp_path / "migrations"
+        generate_migrations("test_svc", output_dir=output)
+
+        staging_sql = (output / "sink_test.db" / "01-tables" / "Actor-staging.sql").read_text()
+        assert 'DELETE FROM "myschema"."stg_Actor"\n        RETURNING *' in staging_sql
+        assert 'FROM pg_temp."claimed_actor"\n        ORDER BY "actno", "__source_ts_ms" DESC' in staging_sql
+        assert 'WHERE "__merge_seq" > v_processed' in staging_sql
+        assert "ctid" not in staging_sql
+        assert "LIMIT v_batch_size" not in staging_sql
 
     @patch("cdc_generator.core.migration_generator.get_project_root")
     @patch("cdc_generator.core.migration_generator.load_service_config")
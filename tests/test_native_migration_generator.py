@@ -186,6 +186,133 @@ def test_generate_native_runtime_writes_expected_files(tmp_path: Path) -> None:
     assert ckpt_line_idx > merge_line_idx, "Checkpoint advancement must occur after merge/apply, not before"
 
 
+def _generate_native_sql(tmp_path: Path) -> tuple[str, str]:
+    """Generate the native fixture; returns (runtime SQL, Actor staging SQL)."""
+    schema_base = _write_native_project(tmp_path)
+    output_dir = tmp_path / "migrations"
+
+    with (
+        patch(
+            "cdc_generator.core.migration_generator.get_project_root",
+            return_value=tmp_path,
+        ),
+        patch(
+            "cdc_generator.core.migration_generator.load_service_config",
+            return_value=_SERVICE_CONFIG,
+        ),
+        patch(
+            "cdc_generator.core.migration_generator.get_service_schema_read_dirs",
+            return_value=[schema_base],
+        ),
+    ):
+        result = generate_migrations(
+            "native_test",
+            output_dir=output_dir,
+            topology="fdw",
+        )
+
+    assert result.errors == []
+    sink_dir = output_dir / "sink_test.db"
+    return (
+        (sink_dir / "00-infrastructure" / "03-native-cdc-runtime.sql").read_text(encoding="utf-8"),
+        (sink_dir / "01-tables" / "Actor-staging.sql").read_text(encoding="utf-8"),
+    )
+
+
+def _routine_sql(sql: str, header: str) -> str:
+    """Body of the routine whose definition starts with ``header``."""
+    start = sql.index(header)
+    return sql[start:sql.index("$$;\n", start)]
+
+
+def test_native_runtime_claim_scans_claimable_index(tmp_path: Path) -> None:
+    """Claim scans the denormalized claimable index instead of joining eligibility tables."""
+    native_infra_sql, _ = _generate_native_sql(tmp_path)
+    claim_sql = _routine_sql(native_infra_sql, 'CREATE OR REPLACE FUNCTION "cdc_management"."claim_due_native_cdc_work"')
+
+    assert 'WHERE runtime."is_claimable"' in claim_sql
+    assert "native_cdc_checkpoint" not in claim_sql
+    assert '"idx_native_cdc_runtime_state_claimable"' in native_infra_sql
+    assert 'WHERE "is_claimable";' in native_infra_sql
+    assert 'PERFORM "cdc_management"."refresh_native_cdc_claimable"(p_source_instance_key, p_logical_table_name);' in native_infra_sql
+
+
+def test_native_runtime_claimable_follows_customer_mapping_changes(tmp_path: Path) -> None:
+    """Remapping a source instance or a customer's id refreshes the claimable flags it feeds."""
+    native_infra_sql, _ = _generate_native_sql(tmp_path)
+    trigger_sql = _routine_sql(native_infra_sql, 'CREATE OR REPLACE FUNCTION "cdc_management"."trg_refresh_native_cdc_claimable"()')
+
+    assert 'AFTER UPDATE OF "enabled", "customer_key" ON "cdc_management"."source_instance"' in native_infra_sql
+    assert 'AFTER UPDATE OF "customer_id" ON "cdc_management"."customer_registry"' in native_infra_sql
+    registry_branch = trigger_sql[trigger_sql.index("TG_TABLE_NAME = 'customer_registry'"):]
+    assert 'WHERE si."customer_key" = v_row."customer_key";' in registry_branch[: registry_branch.index("ELSE")]
+
+
+def test_native_runtime_cycle_pulls_and_merges_each_table_in_one_transaction(tmp_path: Path) -> None:
+    """run_native_cdc_cycle commits a table's pull with its merge, checking budget and lease first."""
+    native_infra_sql, _ = _generate_native_sql(tmp_path)
+    cycle_sql = _routine_sql(native_infra_sql, 'CREATE OR REPLACE PROCEDURE "cdc_management"."run_native_cdc_cycle"(')
+
+    assert '"claim_due_native_cdc_work"(p_limit, NULL, v_worker)' in cycle_sql
+    assert 'CALL "cdc_management"."mark_native_cdc_success"(' in cycle_sql
+    assert 'CALL "cdc_management"."mark_native_cdc_failure"(' in cycle_sql
+    # claim, max-LSN refresh per source, one per table, lease release
+    assert cycle_sql.count("COMMIT;") == 4
+
+    table_sql = cycle_sql[cycle_sql.index("CONTINUE WHEN v_source_instance_keys[j] <> v_source_key;"):]
+    deadline = table_sql.index("EXIT sources WHEN clock_timestamp() >= v_deadline;")
+    renew = table_sql.index('CALL "cdc_management"."renew_native_cdc_lease"(')
+    pull = table_sql.index('"cdc_management"."pull_native_cdc_source"(')
+    merge = table_sql.index("format('sp_merge_%s'")
+    commit = table_sql.index("COMMIT;")
+    assert deadline < renew < pull < merge < commit
+    assert "EXCEPTION" in table_sql[pull:commit]
+
+
+def test_native_runtime_pulls_each_source_max_lsn_once(tmp_path: Path) -> None:
+    """The source max LSN is cached per source and refreshed before, not during, the pulls."""
+    native_infra_sql, _ = _generate_native_sql(tmp_path)
+    refresh_sql = _routine_sql(
+        native_infra_sql, 'CREATE OR REPLACE FUNCTION "cdc_management"."refresh_native_cdc_source_max_lsn"(',
+    )
+    source_sql = _routine_sql(native_infra_sql, 'CREATE OR REPLACE FUNCTION "cdc_management"."pull_native_cdc_source"(')
+    cycle_sql = _routine_sql(native_infra_sql, 'CREATE OR REPLACE PROCEDURE "cdc_management"."run_native_cdc_cycle"(')
+
+    assert 'CREATE UNLOGGED TABLE IF NOT EXISTS "cdc_management"."native_cdc_source_max_lsn"' in native_infra_sql
+    assert "observed_max_lsn" not in native_infra_sql.split('"native_cdc_source_max_lsn" (', 1)[0]
+    assert refresh_sql.count("'cdc_max_lsn'") == 1
+    assert 'ON CONFLICT ("source_instance_key") DO UPDATE' in refresh_sql
+    assert "cdc_max_lsn" not in source_sql
+    assert 'UPDATE "cdc_management"."native_cdc_runtime_state"' not in source_sql
+    assert "format('pull_%s_batch'" in source_sql
+    assert "'unchanged'" in source_sql
+    refresh = cycle_sql.index('v_max_lsn := "cdc_management"."refresh_native_cdc_source_max_lsn"(v_source_key);')
+    assert refresh < cycle_sql.index("COMMIT;", refresh) < cycle_sql.index('"cdc_management"."pull_native_cdc_source"(')
+
+
+def test_native_runtime_backs_off_idle_tables(tmp_path: Path) -> None:
+    """Tables with nothing new back off exponentially up to the policy's poll ceiling."""
+    native_infra_sql, _ = _generate_native_sql(tmp_path)
+    cycle_sql = _routine_sql(native_infra_sql, 'CREATE OR REPLACE PROCEDURE "cdc_management"."run_native_cdc_cycle"(')
+    idle_sql = _routine_sql(native_infra_sql, 'CREATE OR REPLACE PROCEDURE "cdc_management"."mark_native_cdc_idle"(')
+
+    assert 'CALL "cdc_management"."mark_native_cdc_idle"(' in cycle_sql
+    assert 'power(2, LEAST(COALESCE(runtime."empty_pull_streak", 0), 20))' in idle_sql
+    assert 'policy."max_poll_interval_seconds"' in idle_sql
+
+
+def test_native_merge_consumes_staged_batch_in_single_pass(tmp_path: Path) -> None:
+    """sp_merge_<table> reads and removes the staged batch in a single pass."""
+    _, staging_sql = _generate_native_sql(tmp_path)
+    merge_sql = _routine_sql(staging_sql, 'CREATE OR REPLACE PROCEDURE "adopus"."sp_merge_actor"(')
+
+    assert merge_sql.count('"adopus"."stg_Actor"') == 1
+    assert 'DELETE FROM "adopus"."stg_Actor"\n        WHERE "batch_id" = p_batch_id\n        RETURNING *' in merge_sql
+    assert 'PARTITION BY "customer_id", "actno"' in merge_sql
+    assert 'staged_row."__merge_rank" = 1' in merge_sql
+    assert "DISTINCT ON" not in merge_sql
+
+
 def test_generate_native_runtime_keeps_existing_target_tables_and_cleans_stale_legacy_sql(
     tmp_path: Path,
 ) -> None:
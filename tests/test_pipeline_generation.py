@@ -3,14 +3,36 @@
 from __future__ import annotations
 
 import importlib
+import json
+import os
+import re
 import shutil
 import sys
 from pathlib import Path
 
+import pytest
+import yaml
 from _pytest.monkeypatch import MonkeyPatch
 
 from cdc_generator.cli import pipeline_verify
 from cdc_generator.core import pipeline_generator
+from cdc_generator.core.pipeline_generator_builders import build_source_table_inputs
+from cdc_generator.core.pipeline_generator_columns import project_source_columns, project_staging_columns
+from cdc_generator.core.pipeline_generator_common import (
+    AtomicPipelineWriter,
+    CompiledTemplate,
+    GeneratedTableIndex,
+    content_checksum,
+    get_generated_table_index,
+    load_template,
+    read_header_checksum,
+    substitute_variables,
+    write_generated_file,
+)
+from cdc_generator.core.pipeline_generator_consolidated import ConsolidatedSinkBlocks
+from cdc_generator.core.pipeline_generator_manifest import InputDigests
+from cdc_generator.core.pipeline_generator_shards import assign_sink_shards, load_shard_manifest
+from cdc_generator.helpers.helpers_batch import build_staging_case, build_staging_route, render_staging_case
 
 
 def _copy_fixture_tree(tmp_path: Path) -> None:
@@ -137,3 +159,738 @@ def test_generate_consolidated_sink_skips_invalid_target_sink_env_route(
         / "sink-pipeline.yaml"
     )
     assert sink_pipeline.exists() is False
+
+
+def _write_multi_customer_project(tmp_path: Path) -> None:
+    _copy_fixture_tree(tmp_path)
+    (tmp_path / "source-groups.yaml").write_text(
+        "adopus:\n"
+        "  pattern: db-per-tenant\n"
+        "  environment_aware: true\n"
+        "  type: mssql\n"
+        "  servers:\n"
+        "    default:\n"
+        "      host: localhost\n"
+        "      port: 1433\n"
+        "      user: sa\n"
+        "      password: pass\n"
+        "      kafka_bootstrap_servers: localhost:9092\n"
+        "  sources:\n"
+        "    CustomerA:\n"
+        "      schemas: [dbo]\n"
+        "      dev: {server: default, database: AdOpusA}\n"
+        "      prod: {server: default, database: AdOpusAProd}\n"
+        "    CustomerB:\n"
+        "      schemas: [dbo]\n"
+        "      dev: {server: default, database: AdOpusB}\n"
+        "    CustomerC:\n"
+        "      schemas: [dbo]\n"
+        "      dev: {server: default, database: AdOpusC}\n"
+    )
+    (tmp_path / "sink-groups.yaml").write_text(
+        "sink_asma:\n"
+        "  environment_aware: true\n"
+        "  servers:\n"
+        "    default: {host: pg, port: 5432, user: postgres, password: postgres}\n"
+        "  sources:\n"
+        "    directory:\n"
+        "      schemas: [public]\n"
+        "      dev: {server: default, database: directory_dev}\n"
+        "      prod: {server: default, database: directory}\n"
+    )
+    (tmp_path / "services" / "adopus.yaml").write_text(
+        "adopus:\n"
+        "  source:\n"
+        "    tables:\n"
+        "      dbo.Actor:\n"
+        "        primary_key: actno\n"
+        "  sinks:\n"
+        "    sink_asma.directory:\n"
+        "      tables:\n"
+        "        public.actor:\n"
+        "          target_exists: false\n"
+        "          from: dbo.Actor\n"
+    )
+
+
+def _snapshot_generated(root: Path) -> dict[str, str]:
+    generated = root / "pipelines" / "generated"
+    return {
+        str(path.relative_to(generated)): "".join(
+            line for line in path.read_text().splitlines(keepends=True)
+            if not line.startswith("# Generated:")
+        )
+        for path in sorted(generated.rglob("*.yaml"))
+    }
+
+
+def test_generate_jobs_matches_sequential_output(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    _write_multi_customer_project(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    importlib.reload(pipeline_generator)
+
+    monkeypatch.setattr(sys, "argv", ["pipeline_generator.py", "--all"])
+    pipeline_generator.main()
+    sequential_files = _snapshot_generated(tmp_path)
+    sequential_log = capsys.readouterr().out
+
+    shutil.rmtree(tmp_path / "pipelines" / "generated")
+    monkeypatch.setattr(sys, "argv", ["pipeline_generator.py", "--all", "--jobs", "3"])
+    pipeline_generator.main()
+    parallel_files = _snapshot_generated(tmp_path)
+    parallel_log = capsys.readouterr().out
+
+    assert len(sequential_files) == 6
+    assert parallel_files == sequential_files
+    assert parallel_log == sequential_log
+
+
+def test_generate_incremental_only_regenerates_stale_outputs(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    _write_multi_customer_project(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    importlib.reload(pipeline_generator)
+    generated = tmp_path / "pipelines" / "generated"
+
+    monkeypatch.setattr(sys, "argv", ["pipeline_generator.py", "--all"])
+    pipeline_generator.main()
+    assert (generated / ".manifest.json").is_file()
+    capsys.readouterr()
+
+    monkeypatch.setattr(sys, "argv", ["pipeline_generator.py", "--all", "--incremental"])
+    pipeline_generator.main()
+    noop_log = capsys.readouterr().out
+    assert "Up to date: 4 source pipeline(s), 2 sink pipeline(s)" in noop_log
+    assert "Customer:" not in noop_log
+    assert "Consolidated Sink:" not in noop_log
+
+    (generated / "sources" / "dev" / "customerc" / "source-pipeline.yaml").unlink()
+    pipeline_generator.main()
+    missing_log = capsys.readouterr().out
+    assert "Up to date: 3 source pipeline(s), 2 sink pipeline(s)" in missing_log
+    assert "Customer: customerc" in missing_log
+    assert (generated / "sources" / "dev" / "customerc" / "source-pipeline.yaml").is_file()
+
+    template = tmp_path / "pipelines" / "templates" / "sink-pipeline.yaml"
+    template.write_text(template.read_text() + "\n# changed\n")
+    pipeline_generator.main()
+    sink_log = capsys.readouterr().out
+    assert "Up to date: 4 source pipeline(s), 0 sink pipeline(s)" in sink_log
+    assert "Customer:" not in sink_log
+    assert "Consolidated Sink: dev" in sink_log
+    assert "Consolidated Sink: prod" in sink_log
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_generate_reports_broken_table_definition_per_customer(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    jobs: str,
+) -> None:
+    _write_multi_customer_project(tmp_path)
+    (tmp_path / "services" / "_schemas" / "adopus" / "dbo" / "Broken.yaml").write_text("table: [unclosed\n")
+    monkeypatch.chdir(tmp_path)
+    importlib.reload(pipeline_generator)
+
+    monkeypatch.setattr(sys, "argv", ["pipeline_generator.py", "--all", "--jobs", jobs])
+    with pytest.raises(SystemExit) as exc_info:
+        pipeline_generator.main()
+
+    assert exc_info.value.code == 1
+    log = capsys.readouterr().out
+    for customer in ("customera", "customerb", "customerc"):
+        assert f"Error generating {customer}:" in log
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_generate_builds_table_index_once_per_run(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+    jobs: str,
+) -> None:
+    _write_multi_customer_project(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    importlib.reload(pipeline_generator)
+    calls: list[GeneratedTableIndex] = []
+
+    def _counting_index() -> GeneratedTableIndex:
+        calls.append(get_generated_table_index())
+        return calls[-1]
+
+    monkeypatch.setattr(pipeline_generator, "get_generated_table_index", _counting_index)
+    monkeypatch.setattr(sys, "argv", ["pipeline_generator.py", "--all", "--jobs", jobs])
+    pipeline_generator.main()
+
+    assert len(calls) == 1
+    assert (tmp_path / "pipelines" / "generated" / "sinks" / "prod" / "sink-pipeline.yaml").is_file()
+
+
+def test_assign_sink_shards_moves_minimum_customers() -> None:
+    customers = [f"tenant{index:03d}" for index in range(200)]
+    four = assign_sink_shards(customers, 4)
+    assert set(four.values()) == {0, 1, 2, 3}
+
+    grown = assign_sink_shards([*customers, "tenant_new"], 4, 4, four)
+    assert {customer: grown[customer] for customer in customers} == four
+
+    five = assign_sink_shards(customers, 5, 4, four)
+    moved = {customer for customer in customers if five[customer] != four[customer]}
+    assert moved
+    assert all(five[customer] == 4 for customer in moved)
+    assert len(moved) < len(customers) // 3
+
+    pinned = assign_sink_shards(customers, 4, 4, {**four, "tenant000": (four["tenant000"] + 1) % 4})
+    assert pinned["tenant000"] == (four["tenant000"] + 1) % 4
+    three = assign_sink_shards(customers, 3, 4, four)
+    assert all(three[customer] == four[customer] for customer in customers if four[customer] < 3)
+
+
+def test_generate_sharded_consolidated_sink(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    _write_multi_customer_project(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    importlib.reload(pipeline_generator)
+    sink_dir = tmp_path / "pipelines" / "generated" / "sinks" / "dev"
+
+    monkeypatch.setattr(sys, "argv", ["pipeline_generator.py", "--all", "--sink-shards", "3"])
+    pipeline_generator.main()
+    monkeypatch.setattr(sys, "argv", ["pipeline_generator.py", "--all"])
+    pipeline_generator.main()
+    assert sorted(path.name for path in sink_dir.glob("sink-pipeline*.yaml")) == ["sink-pipeline.yaml"]
+
+    monkeypatch.setattr(sys, "argv", ["pipeline_generator.py", "--all", "--sink-shards", "2"])
+    pipeline_generator.main()
+    capsys.readouterr()
+
+    shards, assignments = load_shard_manifest(sink_dir)
+    assert shards == 2
+    assert sorted(assignments) == ["customera", "customerb", "customerc"]
+    assert sorted(path.name for path in sink_dir.glob("sink-pipeline*.yaml")) == [
+        f"sink-pipeline-shard-{shard}.yaml" for shard in sorted(set(assignments.values()))
+    ]
+    for shard in sorted(set(assignments.values())):
+        sink = (sink_dir / f"sink-pipeline-shard-{shard}.yaml").read_text()
+        assert f'consumer_group: "dev-sink-group-shard-{shard}"' in sink
+        assert set(re.findall(r'- "dev\.(\w+)\.', sink)) == {
+            customer for customer, assigned in assignments.items() if assigned == shard
+        }
+
+    monkeypatch.setattr(sys, "argv", ["pipeline_generator.py", "--all", "--sink-shards", "2", "--incremental"])
+    pipeline_generator.main()
+    assert "Up to date: 4 source pipeline(s), 2 sink pipeline(s)" in capsys.readouterr().out
+
+    monkeypatch.setattr(sys, "argv", ["pipeline_generator.py", "--all"])
+    pipeline_generator.main()
+    assert 'consumer_group: "dev-sink-group"' in (sink_dir / "sink-pipeline.yaml").read_text()
+    assert not (sink_dir / ".shards.json").exists()
+    assert sorted(path.name for path in sink_dir.glob("sink-pipeline*.yaml")) == ["sink-pipeline.yaml"]
+
+
+def test_incremental_generate_applies_hand_edited_shard_manifest(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    _write_multi_customer_project(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    importlib.reload(pipeline_generator)
+    sink_dir = tmp_path / "pipelines" / "generated" / "sinks" / "dev"
+    monkeypatch.setattr(sys, "argv", ["pipeline_generator.py", "--all", "--sink-shards", "2"])
+    pipeline_generator.main()
+    capsys.readouterr()
+
+    # Move a tenant to the other (existing) shard by hand
+    manifest_path = sink_dir / ".shards.json"
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    moved = "customera"
+    target = 1 - manifest["assignments"][moved]
+    manifest["assignments"][moved] = target
+    manifest_path.write_text(json.dumps(manifest), encoding="utf-8")
+
+    monkeypatch.setattr(sys, "argv", ["pipeline_generator.py", "--all", "--sink-shards", "2", "--incremental"])
+    pipeline_generator.main()
+    assert "Up to date: 4 source pipeline(s), 1 sink pipeline(s)" in capsys.readouterr().out
+    assert load_shard_manifest(sink_dir)[1][moved] == target
+    assert '- "dev.customera.' in (sink_dir / f"sink-pipeline-shard-{target}.yaml").read_text()
+
+    pipeline_generator.main()
+    assert "Up to date: 4 source pipeline(s), 2 sink pipeline(s)" in capsys.readouterr().out
+
+
+def test_substitute_variables_renders_in_single_pass() -> None:
+    template = CompiledTemplate("a: {{A}}\nb: {{B}}\nmeta: ${! meta(\"x\") }\n{{A}}", "t.yaml")
+
+    rendered = substitute_variables(template, {"A": "{{B}}", "B": 2, "UNUSED": "x"})
+
+    assert rendered == "a: {{B}}\nb: 2\nmeta: ${! meta(\"x\") }\n{{B}}"
+    assert template.placeholders == frozenset({"A", "B"})
+
+
+def test_substitute_variables_reports_unknown_placeholders() -> None:
+    template = CompiledTemplate("{{ENV}} {{MISSING}} {{OTHER}}", "sink-pipeline.yaml")
+
+    with pytest.raises(ValueError, match=r"sink-pipeline\.yaml: \{\{MISSING\}\}, \{\{OTHER\}\}"):
+        substitute_variables(template, {"ENV": "dev"})
+
+
+def test_load_template_is_compiled_once_per_path(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    _copy_fixture_tree(tmp_path)
+    monkeypatch.chdir(tmp_path)
+
+    first = load_template("source-pipeline.yaml")
+    assert load_template("source-pipeline.yaml") is first
+
+    template_path = tmp_path / "pipelines" / "templates" / "source-pipeline.yaml"
+    template_path.write_text("changed: {{ENV}}\n")
+    stat = template_path.stat()
+    os.utime(template_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    reloaded = load_template("source-pipeline.yaml")
+    assert reloaded is not first
+    assert reloaded.render({"ENV": "dev"}) == "changed: dev\n"
+
+
+def test_consolidated_sink_blocks_stream_expected_layout() -> None:
+    template = CompiledTemplate(
+        "topics: {{SINK_TOPICS}}\nprocessors:\n  {{SINK_RUNTIME_PROCESSORS}}\ncases:\n      {{TABLE_CASES}}\n",
+        "sink-pipeline.yaml",
+    )
+    route = build_staging_route("Actor", "pg-url", ["actno"], ["[actno]"])
+    blocks = ConsolidatedSinkBlocks()
+    try:
+        blocks.add_customer(["t.a", "t.b"], ["proc a\n  x"])
+        blocks.add_table_routes("customera", [route])
+        blocks.add_customer(["t.c"], ["proc c"])
+        rendered = template.render({
+            "SINK_TOPICS": blocks.topics,
+            "TABLE_CASES": blocks.table_cases,
+            "SINK_RUNTIME_PROCESSORS": blocks.runtime_cases,
+        })
+    finally:
+        blocks.close()
+
+    assert rendered == (
+        "topics: \n      - t.a\n      - t.b\n      - t.c\n"
+        "processors:\n  - switch:\n        cases:\n"
+        "          proc a\n            x\n          proc c\n"
+        "cases:\n      " + render_staging_case("customera", route).replace("\n", "\n      ") + "\n"
+    )
+
+
+def test_consolidated_sink_blocks_dynamic_routing_groups_table_shapes() -> None:
+    actor = build_staging_route("Actor", "pg-url", ["actno", "name"], ["[actno]", "[name]"])
+    address = build_staging_route("Address", "pg-url", ["addrno"], ["[addrno]"])
+    enriched_actor = build_staging_route(
+        "Actor", "pg-url", ["actno", "name"], ["[actno]", "[name]"], ["tenant"], ['"c"'],
+    )
+
+    static_blocks = ConsolidatedSinkBlocks()
+    dynamic_blocks = ConsolidatedSinkBlocks("dynamic")
+    try:
+        for blocks in (static_blocks, dynamic_blocks):
+            blocks.add_table_routes("customera", [actor, address])
+            blocks.add_table_routes("customerb", [actor, address])
+            blocks.add_table_routes("customerc", [enriched_actor])
+            blocks.finish_routes()
+        dynamic_cases = CompiledTemplate("{{TABLE_CASES}}").render({"TABLE_CASES": dynamic_blocks.table_cases})
+    finally:
+        static_blocks.close()
+        dynamic_blocks.close()
+
+    assert static_blocks.table_cases.count == 5
+    assert dynamic_blocks.table_cases.count == 3
+    assert 'this.__routing_table == "Actor" && {"customera": true, "customerb": true}' in dynamic_cases
+    assert 'this.__routing_table == "Actor" && {"customerc": true}' in dynamic_cases
+    assert "INSERT INTO ${! this.__routing_schema }.\"stg_Address\"" in dynamic_cases
+    assert build_staging_case("Actor", "customera", "pg-url", ["actno", "name"], ["[actno]", "[name]"]).startswith(
+        "# Staging INSERT for customera.Actor\n- check: 'this.__routing_schema == \"customera\""
+    )
+
+
+def test_consolidated_sink_blocks_bulk_write_uses_per_table_batching() -> None:
+    actor = build_staging_route(
+        "Actor", "pg-url", ["actno", "name"], ["[actno]", "[name]"], batching={"count": 20000},
+    )
+    address = build_staging_route("Address", "pg-url", ["addrno"], ["[addrno]"])
+
+    blocks = ConsolidatedSinkBlocks(sink_write="bulk")
+    try:
+        blocks.add_table_routes("customera", [actor, address])
+        cases = CompiledTemplate("{{TABLE_CASES}}").render({"TABLE_CASES": blocks.table_cases})
+    finally:
+        blocks.close()
+
+    assert blocks.table_cases.count == 2
+    assert "sql_insert" not in cases
+    assert 'FROM json_populate_recordset(NULL::customera."stg_Actor", $1::json)' in cases
+    assert "this.map_each({ \"actno\": this.[actno]" in cases
+    assert "count: 20000\n" in cases
+    assert "period: ${SINK_BULK_BATCH_PERIOD:-1s}" in cases
+    assert "count: ${SINK_BULK_BATCH_COUNT:-5000}" in cases
+    assert "format: json_array" in cases
+    assert actor.batching() == ("20000", "${SINK_BATCH_PERIOD:-5s}")
+    with pytest.raises(ValueError, match="static sink routing"):
+        ConsolidatedSinkBlocks("dynamic", "bulk")
+
+
+def test_atomic_pipeline_writer_skips_timestamp_only_changes(tmp_path: Path) -> None:
+    target = tmp_path / "sinks" / "dev" / "sink-pipeline.yaml"
+
+    with AtomicPipelineWriter(target) as writer:
+        writer.write_header("# Header\n# Generated: 2024-01-01 00:00:00\n\n")
+        writer.write("body: 1\n")
+        assert writer.commit() is True
+
+    with AtomicPipelineWriter(target) as writer:
+        writer.write_header("# Header\n# Generated: 2025-01-01 00:00:00\n\n")
+        writer.write("body: 1\n")
+        assert writer.commit() is False
+    assert "2024-01-01" in target.read_text()
+
+    with AtomicPipelineWriter(target) as writer:
+        writer.write_header("# Header\n# Generated: 2025-01-01 00:00:00\n\n")
+        writer.write("body: 2\n")
+        assert writer.commit() is True
+    assert target.read_text().endswith("body: 2\n")
+    assert sorted(p.name for p in target.parent.iterdir()) == ["sink-pipeline.yaml"]
+    assert read_header_checksum(target) == content_checksum(target.read_text())
+
+
+def test_write_generated_file_compares_header_checksum(tmp_path: Path) -> None:
+    target = tmp_path / "source-pipeline.yaml"
+    content = "# Header\n# Generated: 2024-01-01 00:00:00\n\nbody: 1\n"
+
+    assert write_generated_file(target, content) is True
+    assert target.read_text().splitlines()[2] == f"# Checksum: sha256:{content_checksum(content)}"
+
+    # Only the header is consulted: a body edit behind an intact checksum
+    # line is not re-read.
+    target.write_text(target.read_text().replace("body: 1", "body: edited"))
+    assert write_generated_file(target, content.replace("2024", "2025")) is False
+    assert write_generated_file(target, content.replace("body: 1", "body: 2")) is True
+    assert target.read_text().endswith("body: 2\n")
+
+    # Files from before checksums existed fall back to a full comparison.
+    target.write_text(content)
+    assert write_generated_file(target, content.replace("2024", "2025")) is False
+
+
+def test_generated_table_index_keys_by_service_schema_and_table(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    schemas_dir = tmp_path / "services" / "_schemas"
+    for service, schema, body in (
+        ("adopus", "dbo", "columns:\n- name: actno\n  primary_key: true\n- name: Navn\n"),
+        ("adopus", "hist", "primary_key: [actno, ts]\ncolumns:\n- name: actno\n- name: ts\n"),
+        ("directory", "dbo", "columns:\n- name: id\n"),
+    ):
+        (schemas_dir / service / schema).mkdir(parents=True, exist_ok=True)
+        (schemas_dir / service / schema / "Actor.yaml").write_text(
+            f"service: {service}\nschema: {schema}\ntable: Actor\n{body}",
+            encoding="utf-8",
+        )
+    monkeypatch.chdir(tmp_path)
+
+    index = get_generated_table_index()
+
+    assert isinstance(index, GeneratedTableIndex)
+    assert len(index) == 3
+    assert get_generated_table_index() is index
+    actor = index.get("adopus", "dbo", "Actor")
+    assert actor is not None
+    assert actor.mssql_columns == ("[actno]", "[Navn]")
+    assert actor.postgres_columns == ("actno", "Navn")
+    assert index.primary_key("adopus", "dbo", "Actor") == "actno"
+    assert index.primary_key("adopus", "hist", "Actor") == ["actno", "ts"]
+    directory_actor = index.lookup("directory", "dbo", "Actor")
+    assert directory_actor is not None
+    assert directory_actor.mssql_columns == ("[id]",)
+    with pytest.raises(ValueError, match="Missing primary key metadata"):
+        index.primary_key("directory", "dbo", "Actor")
+    with pytest.raises(ValueError, match="Missing table schema definition"):
+        index.primary_key("adopus", "dbo", "Missing")
+
+    (schemas_dir / "adopus" / "dbo" / "Address.yaml").write_text(
+        "table: Address\ncolumns:\n- name: addrno\n",
+        encoding="utf-8",
+    )
+    assert get_generated_table_index().get("adopus", "dbo", "Address") is not None
+
+
+_SOURCE_VARIABLES = {
+    "MSSQL_USER": "sa",
+    "MSSQL_PASSWORD": "pw",
+    "MSSQL_HOST": "mssql",
+    "MSSQL_PORT": "1433",
+    "DATABASE_NAME": "AdOpus",
+}
+
+
+def _write_source_tables(root: Path, tables: tuple[str, ...]) -> None:
+    table_dir = root / "services" / "_schemas" / "adopus" / "dbo"
+    table_dir.mkdir(parents=True, exist_ok=True)
+    for table in tables:
+        (table_dir / f"{table}.yaml").write_text(
+            f"service: adopus\nschema: dbo\ntable: {table}\nprimary_key: id\ncolumns:\n- name: id\n",
+            encoding="utf-8",
+        )
+
+
+def test_input_digests_track_table_by_service_schema_and_table(tmp_path: Path) -> None:
+    schemas_dir = tmp_path / "services" / "_schemas"
+    (schemas_dir / "adopus" / "dbo").mkdir(parents=True)
+    (schemas_dir / "adopus" / "dbo" / "Actor.yaml").write_text("table: Actor\n", encoding="utf-8")
+    before = InputDigests(tmp_path).table("adopus", "dbo", "Actor")
+
+    (schemas_dir / "directory" / "dbo").mkdir(parents=True)
+    (schemas_dir / "directory" / "dbo" / "Actor.yaml").write_text("table: Actor\n", encoding="utf-8")
+    assert InputDigests(tmp_path).table("adopus", "dbo", "Actor") == before
+    assert InputDigests(tmp_path).table("", "", "Actor") != InputDigests(tmp_path).table("", "", "Missing")
+
+    (schemas_dir / "adopus" / "dbo" / "Actor.yaml").write_text("table: Actor\ncolumns: []\n", encoding="utf-8")
+    assert InputDigests(tmp_path).table("adopus", "dbo", "Actor") != before
+
+
+def test_source_inputs_use_polling_profiles_and_max_lsn_probe(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    _write_source_tables(tmp_path, ("Actor", "Address", "Log"))
+    monkeypatch.chdir(tmp_path)
+    config = {
+        "service": "adopus",
+        "cdc_tables": [
+            {"schema": "dbo", "table": "Actor", "polling": "hot"},
+            {"schema": "dbo", "table": "Address"},
+            {"schema": "dbo", "table": "Log", "polling": "cold"},
+        ],
+    }
+    variables = _SOURCE_VARIABLES
+
+    plain = build_source_table_inputs(config, variables, get_generated_table_index())
+    probed = build_source_table_inputs(
+        config, variables, get_generated_table_index(), {"source": {"probe_max_lsn": True}},
+    )
+
+    intervals = [line.strip() for line in plain.splitlines() if line.strip().startswith("interval:")]
+    assert intervals == ["interval: 1s", "interval: 5s", "interval: 60s"]
+    assert "fn_cdc_get_max_lsn" not in plain
+    assert probed.count("sys.fn_cdc_get_max_lsn()") == 1
+    assert probed.index("label: cdc_max_lsn_probe") < probed.index("label: actor_cdc")
+    assert 'key: "actor_probed_lsn"' in probed
+    assert "this.db_max_lsn == this.probed_lsn { deleted() }" in probed
+
+
+def test_source_inputs_union_mode_polls_all_tables_in_one_query(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    _write_source_tables(tmp_path, ("Actor", "Address"))
+    monkeypatch.chdir(tmp_path)
+    config = {
+        "service": "adopus",
+        "cdc_tables": [
+            {"schema": "dbo", "table": "Actor", "polling": "cold"},
+            {"schema": "dbo", "table": "Address", "polling": "cool"},
+        ],
+    }
+
+    inputs = build_source_table_inputs(
+        config, _SOURCE_VARIABLES, get_generated_table_index(), {"source": {"poll_mode": "union"}},
+    )
+
+    assert inputs.count("- label:") == 1
+    assert inputs.count("sql_raw:") == 1
+    assert "interval: 30s" in inputs
+    assert inputs.count("UNION ALL") == 1
+    assert "FROM cdc.dbo_Actor_CT AS ct" in inputs
+    assert "WHERE ct.[__$start_lsn] > CONVERT(VARBINARY(10), $2, 1)" in inputs
+    assert "args_mapping: 'root = [ this.lsn.actor, this.lsn.address ]'" in inputs
+    assert 'key: "address_last_lsn"' in inputs
+    assert "meta source_table = this.__source_table" in inputs
+
+
+def test_column_projection_honours_source_and_sink_columns(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    schemas_dir = tmp_path / "services" / "_schemas"
+    (schemas_dir / "adopus" / "dbo").mkdir(parents=True)
+    (schemas_dir / "adopus" / "dbo" / "Actor.yaml").write_text(
+        "service: adopus\nschema: dbo\ntable: Actor\nprimary_key: id\n"
+        + "columns:\n- name: id\n- name: name\n- name: Blob\n- name: Notes\n",
+        encoding="utf-8",
+    )
+    (schemas_dir / "directory" / "public").mkdir(parents=True)
+    (schemas_dir / "directory" / "public" / "ActorLite.yaml").write_text(
+        "table: ActorLite\ncolumns:\n- name: id\n- name: display_name\n",
+        encoding="utf-8",
+    )
+    monkeypatch.chdir(tmp_path)
+    clone_cfg = {"from": "dbo.Actor", "include_columns": ["name", "Notes"]}
+    mapped_cfg = {"from": "dbo.Actor", "target_exists": True, "columns": {"name": "display_name"}}
+    service_cfg = {"sinks": {"sink_asma.directory": {"tables": {"public.Actor": clone_cfg, "public.ActorLite": mapped_cfg}}}}
+    table_config = {"schema": "dbo", "table": "Actor", "ignore_columns": ["notes"]}
+    actor = get_generated_table_index().get("adopus", "dbo", "Actor")
+    assert actor is not None
+
+    assert project_source_columns(actor, table_config, service_cfg).mssql_columns == ("[id]", "[name]")
+    assert project_staging_columns(actor, table_config, service_cfg, clone_cfg).postgres_columns == ("id", "name")
+    assert project_staging_columns(actor, {}, service_cfg, mapped_cfg).postgres_columns == ("id", "name")
+    assert project_staging_columns(actor, {}, service_cfg, None) is actor
+
+    clone_cfg["transforms"] = [{"bloblang_ref": "services/_bloblang/x.blobl"}]
+    assert project_source_columns(actor, table_config, service_cfg).mssql_columns == ("[id]", "[name]", "[Blob]")
+
+
+def test_verify_warns_about_selected_columns_never_staged(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    _write_source_tables(tmp_path, ("Actor", "Address"))
+    monkeypatch.chdir(tmp_path)
+    config = {"service": "adopus", "cdc_tables": [{"schema": "dbo", "table": "Actor"}, {"schema": "dbo", "table": "Address"}]}
+    generated_dir = tmp_path / "pipelines" / "generated"
+    for poll_mode, customer in (("per-table", "customera"), ("union", "customerb")):
+        inputs = build_source_table_inputs(
+            config, _SOURCE_VARIABLES, get_generated_table_index(), {"source": {"poll_mode": poll_mode}},
+        )
+        source_path = generated_dir / "sources" / "dev" / customer / "source-pipeline.yaml"
+        source_path.parent.mkdir(parents=True)
+        source_path.write_text(
+            "input:\n  broker:\n    inputs:\n      " + inputs + "\n",
+            encoding="utf-8",
+        )
+    sink_path = generated_dir / "sinks" / "dev" / "sink-pipeline.yaml"
+    sink_path.parent.mkdir(parents=True)
+    sink_path.write_text(
+        "output:\n  switch:\n    cases:\n      "
+        + build_staging_case("Actor", "a", "postgres://pg/db", ["name"], ["[name]"]).replace("\n", "\n      "),
+        encoding="utf-8",
+    )
+
+    pipeline_verify._report_unused_source_columns(tmp_path)
+
+    out = capsys.readouterr().out
+    assert "sources/dev/customera/source-pipeline.yaml: Actor: id" in out
+    assert "sources/dev/customerb/source-pipeline.yaml: Actor: id" in out
+    assert "Address" not in out
+
+
+def test_batched_lsn_source_pipeline_commits_once_per_batch(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    _write_source_tables(tmp_path, ("Actor", "Address"))
+    shutil.copytree(Path(__file__).parents[1] / "pipelines" / "templates", tmp_path / "pipelines" / "templates")
+    (tmp_path / "services" / "adopus.yaml").write_text(
+        "adopus:\n  source:\n    lsn_commit: batch\n    tables:\n      dbo.Actor: {}\n      dbo.Address: {}\n",
+        encoding="utf-8",
+    )
+    monkeypatch.chdir(tmp_path)
+    config = {
+        "service": "adopus",
+        "cdc_tables": [{"schema": "dbo", "table": "Actor"}, {"schema": "dbo", "table": "Address"}],
+    }
+
+    _, content = pipeline_generator.render_customer_source_pipeline("customera", config, "dev", {})
+    pipeline = yaml.safe_load(content)
+
+    def _lsn_cache_writes(node: object) -> list[object]:
+        if isinstance(node, list):
+            return [write for item in node for write in _lsn_cache_writes(item)]
+        if not isinstance(node, dict):
+            return []
+        writes = [write for value in node.values() for write in _lsn_cache_writes(value)]
+        cache = node.get("cache")
+        if isinstance(cache, dict) and (
+            cache.get("target") == "lsn_cache"
+            or (cache.get("resource") == "lsn_cache" and cache.get("operator") == "set")
+        ):
+            writes.insert(0, cache)
+        return writes
+
+    broker = pipeline["output"]["broker"]
+    assert broker["pattern"] == "fan_out_sequential"
+    assert "kafka" in broker["outputs"][0]
+    assert broker["outputs"][1]["cache"]["key"] == "committed_lsns"
+    assert _lsn_cache_writes(pipeline) == [broker["outputs"][1]["cache"]]
+    assert "batching" in broker
+    assert content.count('key: "actor_last_lsn"') == 2
+    assert "resource: lsn_watermarks" in content
+
+
+def test_warm_generation_caches_loads_the_selected_source_templates(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    _write_source_tables(tmp_path, ("Actor",))
+    (tmp_path / "services" / "adopus.yaml").write_text(
+        "adopus:\n  source:\n    lsn_commit: batch\n    tables:\n      dbo.Actor: {}\n",
+        encoding="utf-8",
+    )
+    monkeypatch.chdir(tmp_path)
+    configs = {"customera": {"service": "adopus"}}
+
+    def _load_customer_config(customer: str) -> dict[str, object]:
+        if customer not in configs:
+            raise FileNotFoundError(customer)
+        return configs[customer]
+
+    loaded: list[str] = []
+    monkeypatch.setattr(pipeline_generator, "load_customer_config", _load_customer_config)
+    monkeypatch.setattr(pipeline_generator, "load_template", loaded.append)
+
+    table_index = pipeline_generator._warm_generation_caches([("customera", None), ("missing", ["dev"])])
+
+    assert loaded == ["source-pipeline-batched-lsn.yaml"]
+    assert table_index is not None
+
+    def _broken_template(name: str) -> None:
+        raise TypeError(name)
+
+    monkeypatch.setattr(pipeline_generator, "load_template", _broken_template)
+    with pytest.raises(TypeError, match=r"source-pipeline-batched-lsn\.yaml"):
+        pipeline_generator._warm_generation_caches([("customera", None)])
+
+
+def test_verify_reports_worst_case_sink_connections(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    cases = "".join(
+        build_staging_case(table, schema, "postgres://u:secret@pg:5432/db", ["id"], ["id"]).replace("\n", "\n      ")
+        for schema in ("a", "b")
+        for table in ("Actor", "Address")
+    )
+    sink_path = tmp_path / "sink-pipeline.yaml"
+    sink_path.write_text(
+        "output:\n  switch:\n    cases:\n      "
+        + cases
+        + "- output:\n          sql_raw:\n            dsn: postgres://other/db\n",
+        encoding="utf-8",
+    )
+    monkeypatch.delenv("SINK_CONN_MAX_OPEN", raising=False)
+
+    assert pipeline_verify._sink_connection_budget(sink_path) == {
+        "postgres://***@pg:5432/db": (4, 16),
+        "postgres://other/db": (1, None),
+    }
+    monkeypatch.setenv("SINK_CONN_MAX_OPEN", "1")
+    assert pipeline_verify._sink_connection_budget(sink_path)["postgres://***@pg:5432/db"] == (4, 4)
@@ -0,0 +1,48 @@
+"""Tests for the shared per-run primary-key resolver."""
+
+import os
+from pathlib import Path
+
+from cdc_generator.helpers.primary_key_resolver import (
+    PrimaryKeyResolver,
+    primary_key_from_table_def,
+)
+from cdc_generator.helpers.service_config import ProjectModel
+
+
+def _write_table(root: Path, schema: str, table: str, body: str) -> Path:
+    path = root / "services" / "_schemas" / "adopus" / schema / f"{table}.yaml"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"table: {table}\n{body}", encoding="utf-8")
+    return path
+
+
+def test_primary_key_from_table_def() -> None:
+    assert primary_key_from_table_def({"primary_key": "actno"}) == ["actno"]
+    assert primary_key_from_table_def({"primary_key": ["actno", "addrno"]}) == ["actno", "addrno"]
+    assert primary_key_from_table_def({
+        "columns": [
+            {"name": "actno", "primary_key": True},
+            {"name": "name"},
+            {"name": "addrno", "primary_key": True},
+        ],
+    }) == ["actno", "addrno"]
+    assert primary_key_from_table_def({"columns": [{"name": "name"}]}) == []
+
+
+def test_resolver_reuses_keys_until_definition_changes(tmp_path: Path) -> None:
+    path = _write_table(tmp_path, "dbo", "Actor", "primary_key: actno\n")
+    _write_table(tmp_path, "dbo", "Log", "columns:\n- name: message\n")
+    resolver = PrimaryKeyResolver(ProjectModel(tmp_path))
+
+    first = resolver.resolve("adopus", "dbo", "Actor")
+    assert first == ["actno"]
+    assert resolver.resolve("adopus", "dbo", "Actor") is first
+    assert resolver.resolve("adopus", "dbo", "Log") == []
+    assert resolver.resolve("adopus", "dbo", "Missing") is None
+
+    path.write_text("table: Actor\nprimary_key: [actno, ts]\n", encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert resolver.resolve("adopus", "dbo", "Actor") == ["actno", "ts"]
+
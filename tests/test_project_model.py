@@ -0,0 +1,84 @@
+"""Tests for the parse-once ProjectModel used by read-only generation paths."""
+
+import os
+from pathlib import Path
+
+from pytest import MonkeyPatch
+
+from cdc_generator.helpers import yaml_loader
+from cdc_generator.helpers.service_config import ProjectModel
+
+
+def _write_project(root: Path) -> None:
+    (root / "services" / "_schemas" / "adopus" / "dbo").mkdir(parents=True)
+    (root / "source-groups.yaml").write_text(
+        "adopus:\n  pattern: db-per-tenant\n  sources: {}\n",
+        encoding="utf-8",
+    )
+    (root / "services" / "adopus.yaml").write_text(
+        "adopus:\n  source:\n    tables:\n      dbo.Actor: {}\n",
+        encoding="utf-8",
+    )
+    (root / "services" / "_schemas" / "adopus" / "dbo" / "Actor.yaml").write_text(
+        "name: Actor\nprimary_key: actno\n",
+        encoding="utf-8",
+    )
+
+
+def test_project_model_parses_each_file_once(
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    _write_project(tmp_path)
+    model = ProjectModel(tmp_path)
+
+    calls: list[object] = []
+    real_load = yaml_loader.pyyaml.load
+
+    def _counting_load(stream: object, Loader: object) -> object:  # noqa: N803
+        calls.append(stream)
+        return real_load(stream, Loader=Loader)  # type: ignore[arg-type]
+
+    monkeypatch.delenv("CDC_CACHE_DIR", raising=False)
+    monkeypatch.setenv("CDC_YAML_CACHE", "0")
+    monkeypatch.setattr(yaml_loader.pyyaml, "load", _counting_load)
+
+    for _ in range(3):
+        assert model.service_names() == ["adopus"]
+        config = model.service_config("adopus")
+        assert config["service"] == "adopus"
+        assert "adopus" in model.source_groups()
+        table = model.table_definition("adopus", "dbo", "Actor")
+        assert table is not None
+        assert table["primary_key"] == "actno"
+
+    # service file + source-groups + table definition
+    assert len(calls) == 3
+
+
+def test_project_model_reloads_file_after_change(tmp_path: Path) -> None:
+    _write_project(tmp_path)
+    model = ProjectModel(tmp_path)
+    table_path = tmp_path / "services" / "_schemas" / "adopus" / "dbo" / "Actor.yaml"
+
+    first = model.table_definition("adopus", "dbo", "Actor")
+    assert first is not None
+    assert first["primary_key"] == "actno"
+
+    table_path.write_text("name: Actor\nprimary_key: [actno, id]\n", encoding="utf-8")
+    stat = table_path.stat()
+    os.utime(table_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    second = model.table_definition("adopus", "dbo", "Actor")
+    assert second is not None
+    assert list(second["primary_key"]) == ["actno", "id"]
+
+
+def test_project_model_missing_files(tmp_path: Path) -> None:
+    model = ProjectModel(tmp_path)
+
+    assert model.source_groups() == {}
+    assert model.sink_groups() == {}
+    assert model.service_names() == []
+    assert model.table_definition_files() == []
+    assert model.table_definition("adopus", "dbo", "Missing") is None
@@ -0,0 +1,117 @@
+"""Tests for the on-disk parsed-YAML cache behind load_yaml_cached()."""
+
+import os
+from pathlib import Path
+
+import pytest
+from pytest import MonkeyPatch
+
+from cdc_generator.helpers import yaml_loader
+from cdc_generator.helpers.yaml_loader import load_yaml_cached
+
+
+@pytest.fixture
+def parse_calls(monkeypatch: MonkeyPatch) -> list[object]:
+    calls: list[object] = []
+    real_load = yaml_loader.pyyaml.load
+
+    def _counting_load(stream: object, Loader: object) -> object:  # noqa: N803
+        calls.append(stream)
+        return real_load(stream, Loader=Loader)  # type: ignore[arg-type]
+
+    monkeypatch.delenv("CDC_CACHE_DIR", raising=False)
+    monkeypatch.delenv("CDC_YAML_CACHE", raising=False)
+    monkeypatch.setattr(yaml_loader.pyyaml, "load", _counting_load)
+    return calls
+
+
+def _bump_mtime(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_second_load_is_served_from_cache(tmp_path: Path, parse_calls: list[object]) -> None:
+    table = tmp_path / "Actor.yaml"
+    table.write_text(
+        "# comment\nname: Actor\nprimary_key: 'actno'\ncolumns:\n  - name: actno\n    nullable: false\n",
+        encoding="utf-8",
+    )
+    cache_dir = tmp_path / ".cdc-cache"
+
+    first = load_yaml_cached(table, cache_dir)
+    second = load_yaml_cached(table, cache_dir)
+
+    assert len(parse_calls) == 1
+    assert first == second == {
+        "name": "Actor",
+        "primary_key": "actno",
+        "columns": [{"name": "actno", "nullable": False}],
+    }
+    assert type(second) is dict
+    assert type(second["primary_key"]) is str
+    assert list((cache_dir / "yaml").glob("*.bin"))
+
+
+def test_touched_file_with_same_content_reuses_entry(tmp_path: Path, parse_calls: list[object]) -> None:
+    table = tmp_path / "Actor.yaml"
+    table.write_text("name: Actor\n", encoding="utf-8")
+    cache_dir = tmp_path / ".cdc-cache"
+
+    load_yaml_cached(table, cache_dir)
+    _bump_mtime(table)
+
+    assert load_yaml_cached(table, cache_dir) == {"name": "Actor"}
+    assert len(parse_calls) == 1
+
+
+def test_changed_file_is_reparsed(tmp_path: Path, parse_calls: list[object]) -> None:
+    table = tmp_path / "Actor.yaml"
+    table.write_text("name: Actor\n", encoding="utf-8")
+    cache_dir = tmp_path / ".cdc-cache"
+
+    load_yaml_cached(table, cache_dir)
+    table.write_text("name: Actors\n", encoding="utf-8")
+    _bump_mtime(table)
+
+    assert load_yaml_cached(table, cache_dir) == {"name": "Actors"}
+    assert len(parse_calls) == 2
+
+
+def test_cache_can_be_disabled(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+    parse_calls: list[object],
+) -> None:
+    monkeypatch.setenv("CDC_YAML_CACHE", "0")
+    table = tmp_path / "Actor.yaml"
+    table.write_text("name: Actor\n", encoding="utf-8")
+    cache_dir = tmp_path / ".cdc-cache"
+
+    load_yaml_cached(table, cache_dir)
+    load_yaml_cached(table, cache_dir)
+
+    assert len(parse_calls) == 2
+    assert not cache_dir.exists()
+
+
+def test_missing_file_raises(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError, match="YAML file not found"):
+        load_yaml_cached(tmp_path / "missing.yaml", tmp_path / ".cdc-cache")
+
+
+def test_entry_from_older_cache_format_is_reparsed(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+    parse_calls: list[object],
+) -> None:
+    table = tmp_path / "Actor.yaml"
+    table.write_text("name: Actor\n", encoding="utf-8")
+    cache_dir = tmp_path / ".cdc-cache"
+    current_format = yaml_loader._CACHE_FORMAT
+
+    monkeypatch.setattr(yaml_loader, "_CACHE_FORMAT", current_format - 1)
+    load_yaml_cached(table, cache_dir)
+    monkeypatch.setattr(yaml_loader, "_CACHE_FORMAT", current_format)
+
+    assert load_yaml_cached(table, cache_dir) == {"name": "Actor"}
+    assert len(parse_calls) == 2
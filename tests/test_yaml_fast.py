@@ -0,0 +1,112 @@
+"""Tests and benchmark for the read-only load_yaml_fast() path.
+
+The benchmark builds a 2,000-table ``services/_schemas`` tree and compares
+the round-trip ruamel loader with ``load_yaml_fast()`` and the warm on-disk
+cache. It is skipped unless ``CDC_RUN_BENCHMARKS=1``::
+
+    CDC_RUN_BENCHMARKS=1 pytest tests/test_yaml_fast.py -s
+"""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from cdc_generator.helpers.yaml_loader import (
+    load_yaml_cached,
+    load_yaml_fast,
+    load_yaml_file,
+)
+
+_SCALARS = [
+    "yes", "no", "on", "off", "true", "False", "~", "null", "",
+    "012", "0o17", "0x1F", "0b101", "1_000", "-3", "+4",
+    "1.5", ".5", "1e5", "3.", ".inf", "-.inf",
+    "nvarchar(50)", "2024-01-01", "'quoted'", '"double"',
+]
+
+
+def _table_yaml(schema: str, index: int) -> str:
+    lines = [
+        "# Generated by cdc manage-services schema",
+        f"database: AdOpus{schema}",
+        f"schema: {schema}",
+        "service: adopus",
+        f"table: Table{index:04d}",
+        "columns:",
+    ]
+    for col in range(15):
+        lines.extend([
+            f"  - name: col_{col}",
+            "    type: nvarchar" if col % 3 else "    type: int",
+            f"    nullable: {'false' if col == 0 else 'true'}",
+            f"    primary_key: {'true' if col == 0 else 'false'}",
+            f"    max_length: {col * 10}",
+        ])
+    lines.append("primary_key: col_0")
+    return "\n".join(lines) + "\n"
+
+
+def test_load_yaml_fast_matches_round_trip_loader(tmp_path: Path) -> None:
+    path = tmp_path / "scalars.yaml"
+    path.write_text(
+        "".join(f"k{i}: {value}\n" for i, value in enumerate(_SCALARS))
+        + "nested:\n  list: [1, two, {three: 3}]\n",
+        encoding="utf-8",
+    )
+
+    fast = load_yaml_fast(path)
+    slow = load_yaml_file(path)
+
+    assert list(fast) == list(slow)
+    for key, slow_value in slow.items():
+        fast_value = fast[key]
+        assert fast_value == slow_value, key
+        assert isinstance(fast_value, bool) == isinstance(slow_value, bool), key
+    assert fast["k0"] == "yes"
+    assert fast["k9"] == 12
+    assert type(fast) is dict
+
+
+def test_load_yaml_fast_missing_file(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError, match="YAML file not found"):
+        load_yaml_fast(tmp_path / "missing.yaml")
+
+
+@pytest.mark.skipif(
+    os.environ.get("CDC_RUN_BENCHMARKS") != "1",
+    reason="benchmark; set CDC_RUN_BENCHMARKS=1 to run",
+)
+def test_benchmark_schema_tree_2000_tables(tmp_path: Path) -> None:
+    schemas_dir = tmp_path / "services" / "_schemas" / "adopus"
+    files: list[Path] = []
+    for schema_index in range(20):
+        schema = f"s{schema_index:02d}"
+        schema_dir = schemas_dir / schema
+        schema_dir.mkdir(parents=True)
+        for table_index in range(100):
+            path = schema_dir / f"Table{table_index:04d}.yaml"
+            path.write_text(_table_yaml(schema, table_index), encoding="utf-8")
+            files.append(path)
+    assert len(files) == 2000
+
+    def _timed(load: object) -> float:
+        start = time.perf_counter()
+        for path in files:
+            load(path)  # type: ignore[operator]
+        return time.perf_counter() - start
+
+    cache_dir = tmp_path / ".cdc-cache"
+    ruamel_s = _timed(load_yaml_file)
+    fast_s = _timed(load_yaml_fast)
+    cold_s = _timed(lambda path: load_yaml_cached(path, cache_dir))
+    warm_s = _timed(lambda path: load_yaml_cached(path, cache_dir))
+
+    print(
+        f"\n2000 tables: ruamel {ruamel_s:.2f}s, load_yaml_fast {fast_s:.2f}s "
+        + f"({ruamel_s / fast_s:.1f}x), cache cold {cold_s:.2f}s, "
+        + f"cache warm {warm_s:.2f}s ({ruamel_s / warm_s:.1f}x)"
+    )
+    assert fast_s < ruamel_s
+    assert warm_s < fast_s